@@ -1,5 +1,6 @@
 """Core CLI app definition and global state."""
 
+import sys
 from typing import Annotated
 
 import typer
@@ -30,8 +31,16 @@ def _version_callback(value: bool) -> None:
         raise typer.Exit()
 
 
+def _close_pipeline_provider() -> None:
+    """Release the shared pipeline provider's connections, if one was created."""
+    providers = sys.modules.get("extropy.core.providers")
+    if providers is not None:
+        providers.close_pipeline_provider()
+
+
 @app.callback()
 def main_callback(
+    ctx: typer.Context,
     json_output: Annotated[
         bool,
         typer.Option(
@@ -56,6 +65,7 @@ def main_callback(
     """
     global _json_mode
     _json_mode = json_output
+    ctx.call_on_close(_close_pipeline_provider)
 
 
 # Import commands to register them with the app
@@ -8,15 +8,6 @@ import typer
 from rich.live import Live
 from rich.spinner import Spinner
 
-from ...population.spec_builder import (
-    select_attributes,
-    hydrate_attributes,
-    bind_constraints,
-    build_spec,
-)
-from ...utils import topological_sort, CircularDependencyError
-from ...core.models import PopulationSpec
-from ...population.validator import validate_spec
 from ..app import app, console
 from ..display import (
     display_extend_attributes,
@@ -44,6 +35,16 @@ def extend_command(
         extropy extend surgeons_base.yaml -s "AI diagnostic tool adoption" -o surgeons_ai.yaml
         extropy extend farmers.yaml -s "Drought response behavior" -o farmers_drought.yaml
     """
+    from ...population.spec_builder import (
+        select_attributes,
+        hydrate_attributes,
+        bind_constraints,
+        build_spec,
+    )
+    from ...utils import topological_sort, CircularDependencyError
+    from ...core.models import PopulationSpec
+    from ...population.validator import validate_spec
+
     start_time = time.time()
     console.print()
 
@@ -9,7 +9,6 @@ import typer
 from rich.live import Live
 from rich.spinner import Spinner
 
-from ...core.models import PopulationSpec
 from ..app import app, console
 from ..utils import (
     format_elapsed,
@@ -70,6 +69,8 @@ def persona_command(
         extropy persona population.yaml -a agents.json --agent 42 -y
         extropy persona population.yaml -a agents.json --show  # preview existing
     """
+    from ...core.models import PopulationSpec
+
     from ...population.persona import (
         generate_persona_config,
         preview_persona,
@@ -178,11 +179,13 @@ def persona_command(
     config = None
     gen_error = None
     gen_done = Event()
-    current_step = ["1", "Starting..."]
+    # Single slot holding a (step, status) tuple: progress arrives from the
+    # generator's worker threads, and replacing the tuple keeps the pair
+    # consistent for the spinner loop below
+    current_step = [("1", "Starting...")]
 
     def on_progress(step: str, status: str):
-        current_step[0] = step
-        current_step[1] = status
+        current_step[0] = (step, status)
 
     def do_generation():
         nonlocal config, gen_error
@@ -207,7 +210,7 @@ def persona_command(
     with Live(spinner, console=console, refresh_per_second=12.5, transient=True):
         while not gen_done.is_set():
             elapsed = time.time() - gen_start
-            step, status = current_step
+            step, status = current_step[0]
             spinner.update(text=f"Step {step}: {status} ({format_elapsed(elapsed)})")
             time.sleep(0.1)
 
@@ -307,7 +310,7 @@ def persona_command(
             ):
                 while not gen_done.is_set():
                     elapsed = time.time() - gen_start
-                    step, status = current_step
+                    step, status = current_step[0]
                     spinner.update(
                         text=f"Step {step}: {status} ({format_elapsed(elapsed)})"
                     )
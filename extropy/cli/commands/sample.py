@@ -5,8 +5,6 @@ from pathlib import Path
 
 import typer
 
-from ...core.models import PopulationSpec
-from ...population.validator import validate_spec
 from ..app import app, console, get_json_mode
 from ..utils import (
     Output,
@@ -60,6 +58,9 @@ def sample_command(
         extropy sample surgeons.yaml -o agents.json --report
         extropy --json sample surgeons.yaml -o agents.json --report
     """
+    from ...core.models import PopulationSpec
+    from ...population.validator import validate_spec
+
     from ...population.sampler import (
         sample_population,
         save_json,
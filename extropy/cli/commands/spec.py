@@ -8,15 +8,6 @@ import typer
 from rich.live import Live
 from rich.spinner import Spinner
 
-from ...population.spec_builder import (
-    check_sufficiency,
-    select_attributes,
-    hydrate_attributes,
-    bind_constraints,
-    build_spec,
-)
-from ...utils import topological_sort, CircularDependencyError
-from ...population.validator import validate_spec
 from ..app import app, console
 from ..display import (
     display_discovered_attributes,
@@ -44,6 +35,16 @@ def spec_command(
         extropy spec "500 German surgeons" -o surgeons.yaml
         extropy spec "1000 Indian smallholder farmers" -o farmers.yaml
     """
+    from ...population.spec_builder import (
+        check_sufficiency,
+        select_attributes,
+        hydrate_attributes,
+        bind_constraints,
+        build_spec,
+    )
+    from ...utils import topological_sort, CircularDependencyError
+    from ...population.validator import validate_spec
+
     start_time = time.time()
     console.print()
 
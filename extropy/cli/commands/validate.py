@@ -4,8 +4,6 @@ from pathlib import Path
 
 import typer
 
-from ...core.models import PopulationSpec
-from ...population.validator import validate_spec
 from ..app import app, console, get_json_mode
 from ..utils import Output, ExitCode, format_validation_for_json
 
@@ -21,6 +19,9 @@ def _is_scenario_file(path: Path) -> bool:
 
 def _validate_population_spec(spec_file: Path, strict: bool, out: Output) -> int:
     """Validate a population spec."""
+    from ...core.models import PopulationSpec
+    from ...population.validator import validate_spec
+
     # Load spec
     if not get_json_mode():
         with console.status("[cyan]Loading spec...[/cyan]"):
@@ -1,12 +1,18 @@
 """Display helpers for CLI output."""
 
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
 from rich.table import Table
 from rich.tree import Tree
 
-from ..core.models import DiscoveredAttribute, PopulationSpec
 from .app import console
 from .utils import grounding_indicator
 
+if TYPE_CHECKING:
+    from ..core.models import DiscoveredAttribute, PopulationSpec
+
 
 def display_discovered_attributes(
     attributes: list[DiscoveredAttribute], geography: str | None
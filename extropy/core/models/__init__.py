@@ -5,196 +5,234 @@ This package centralizes all model definitions:
 - scenario.py: Scenario specs, events, exposure rules, interaction models
 - simulation.py: Agent state and runtime models
 - results.py: Simulation results and aggregation models
+
+Models are imported lazily (PEP 562): ``from extropy.core.models import X``
+only loads the submodule that defines X, so entry points that need one
+domain do not pay for building every Pydantic model.
 """
 
-# Population models (Phase 1)
-from .population import (
-    # Grounding
-    GroundingInfo,
-    GroundingSummary,
-    # Distributions
-    NormalDistribution,
-    LognormalDistribution,
-    UniformDistribution,
-    BetaDistribution,
-    CategoricalDistribution,
-    BooleanDistribution,
-    Distribution,
-    # Modifiers
-    Modifier,
-    # Sampling
-    SamplingConfig,
-    Constraint,
-    # Attributes
-    AttributeSpec,
-    DiscoveredAttribute,
-    HydratedAttribute,
-    # Spec
-    SpecMeta,
-    PopulationSpec,
-    # Pipeline types
-    SufficiencyResult,
-)
-
-# Validation models (shared across population and scenario)
-from .validation import (
-    Severity,
-    ValidationIssue,
-    ValidationResult,
-)
-
-# Scenario models (Phase 2)
-from .scenario import (
-    # Event
-    EventType,
-    Event,
-    # Exposure
-    ExposureChannel,
-    ExposureRule,
-    SeedExposure,
-    # Interaction
-    InteractionType,
-    InteractionConfig,
-    SpreadModifier,
-    SpreadConfig,
-    # Outcomes
-    OutcomeType,
-    OutcomeDefinition,
-    OutcomeConfig,
-    # Simulation config
-    TimestepUnit,
-    SimulationConfig,
-    # Scenario
-    ScenarioMeta,
-    ScenarioSpec,
-)
-
-# Simulation models (Phase 3)
-from .simulation import (
-    ConvictionLevel,
-    CONVICTION_MAP,
-    CONVICTION_REVERSE_MAP,
-    conviction_to_float,
-    float_to_conviction,
-    score_to_conviction_float,
-    SimulationEventType,
-    ExposureRecord,
-    MemoryEntry,
-    AgentState,
-    SimulationEvent,
-    PeerOpinion,
-    ReasoningContext,
-    ReasoningResponse,
-    SimulationRunConfig,
-    TimestepSummary,
-)
-
-# Results models (Phase 4)
-from .results import (
-    SimulationSummary,
-    AgentFinalState,
-    SegmentAggregate,
-    TimelinePoint,
-    RunMeta,
-    SimulationResults,
-)
-
-# Sampling models (runtime)
-from .sampling import (
-    SamplingStats,
-    SamplingResult,
-)
-
-# Network models (runtime)
-from .network import (
-    Edge,
-    NetworkResult,
-    NetworkMetrics,
-    NodeMetrics,
-)
-
-__all__ = [
-    # Population - Grounding
-    "GroundingInfo",
-    "GroundingSummary",
-    # Population - Distributions
-    "NormalDistribution",
-    "LognormalDistribution",
-    "UniformDistribution",
-    "BetaDistribution",
-    "CategoricalDistribution",
-    "BooleanDistribution",
-    "Distribution",
-    # Population - Modifiers
-    "Modifier",
-    # Population - Sampling
-    "SamplingConfig",
-    "Constraint",
-    # Population - Attributes
-    "AttributeSpec",
-    "DiscoveredAttribute",
-    "HydratedAttribute",
-    # Population - Spec
-    "SpecMeta",
-    "PopulationSpec",
-    # Population - Pipeline types
-    "SufficiencyResult",
-    # Scenario - Event
-    "EventType",
-    "Event",
-    # Scenario - Exposure
-    "ExposureChannel",
-    "ExposureRule",
-    "SeedExposure",
-    # Scenario - Interaction
-    "InteractionType",
-    "InteractionConfig",
-    "SpreadModifier",
-    "SpreadConfig",
-    # Scenario - Outcomes
-    "OutcomeType",
-    "OutcomeDefinition",
-    "OutcomeConfig",
-    # Scenario - Config
-    "TimestepUnit",
-    "SimulationConfig",
-    # Scenario - Spec
-    "ScenarioMeta",
-    "ScenarioSpec",
-    # Validation (shared)
-    "Severity",
-    "ValidationIssue",
-    "ValidationResult",
-    # Simulation
-    "ConvictionLevel",
-    "CONVICTION_MAP",
-    "CONVICTION_REVERSE_MAP",
-    "conviction_to_float",
-    "float_to_conviction",
-    "score_to_conviction_float",
-    "SimulationEventType",
-    "ExposureRecord",
-    "MemoryEntry",
-    "AgentState",
-    "SimulationEvent",
-    "PeerOpinion",
-    "ReasoningContext",
-    "ReasoningResponse",
-    "SimulationRunConfig",
-    "TimestepSummary",
-    # Results
-    "SimulationSummary",
-    "AgentFinalState",
-    "SegmentAggregate",
-    "TimelinePoint",
-    "RunMeta",
-    "SimulationResults",
-    # Sampling
-    "SamplingStats",
-    "SamplingResult",
-    # Network
-    "Edge",
-    "NetworkResult",
-    "NetworkMetrics",
-    "NodeMetrics",
-]
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    # Population models (Phase 1)
+    from .population import (
+        # Grounding
+        GroundingInfo as GroundingInfo,
+        GroundingSummary as GroundingSummary,
+        # Distributions
+        NormalDistribution as NormalDistribution,
+        LognormalDistribution as LognormalDistribution,
+        UniformDistribution as UniformDistribution,
+        BetaDistribution as BetaDistribution,
+        CategoricalDistribution as CategoricalDistribution,
+        BooleanDistribution as BooleanDistribution,
+        Distribution as Distribution,
+        # Modifiers
+        Modifier as Modifier,
+        # Sampling
+        SamplingConfig as SamplingConfig,
+        Constraint as Constraint,
+        # Attributes
+        AttributeSpec as AttributeSpec,
+        DiscoveredAttribute as DiscoveredAttribute,
+        HydratedAttribute as HydratedAttribute,
+        # Spec
+        SpecMeta as SpecMeta,
+        PopulationSpec as PopulationSpec,
+        # Pipeline types
+        SufficiencyResult as SufficiencyResult,
+    )
+
+    # Validation models (shared across population and scenario)
+    from .validation import (
+        Severity as Severity,
+        ValidationIssue as ValidationIssue,
+        ValidationResult as ValidationResult,
+    )
+
+    # Scenario models (Phase 2)
+    from .scenario import (
+        # Event
+        EventType as EventType,
+        Event as Event,
+        # Exposure
+        ExposureChannel as ExposureChannel,
+        ExposureRule as ExposureRule,
+        SeedExposure as SeedExposure,
+        # Interaction
+        InteractionType as InteractionType,
+        InteractionConfig as InteractionConfig,
+        SpreadModifier as SpreadModifier,
+        SpreadConfig as SpreadConfig,
+        # Outcomes
+        OutcomeType as OutcomeType,
+        OutcomeDefinition as OutcomeDefinition,
+        OutcomeConfig as OutcomeConfig,
+        # Simulation config
+        TimestepUnit as TimestepUnit,
+        SimulationConfig as SimulationConfig,
+        # Scenario
+        ScenarioMeta as ScenarioMeta,
+        ScenarioSpec as ScenarioSpec,
+    )
+
+    # Simulation models (Phase 3)
+    from .simulation import (
+        ConvictionLevel as ConvictionLevel,
+        CONVICTION_MAP as CONVICTION_MAP,
+        CONVICTION_REVERSE_MAP as CONVICTION_REVERSE_MAP,
+        conviction_to_float as conviction_to_float,
+        float_to_conviction as float_to_conviction,
+        score_to_conviction_float as score_to_conviction_float,
+        SimulationEventType as SimulationEventType,
+        ExposureRecord as ExposureRecord,
+        MemoryEntry as MemoryEntry,
+        AgentState as AgentState,
+        SimulationEvent as SimulationEvent,
+        PeerOpinion as PeerOpinion,
+        ReasoningContext as ReasoningContext,
+        ReasoningResponse as ReasoningResponse,
+        SimulationRunConfig as SimulationRunConfig,
+        TimestepSummary as TimestepSummary,
+    )
+
+    # Results models (Phase 4)
+    from .results import (
+        SimulationSummary as SimulationSummary,
+        AgentFinalState as AgentFinalState,
+        SegmentAggregate as SegmentAggregate,
+        TimelinePoint as TimelinePoint,
+        RunMeta as RunMeta,
+        SimulationResults as SimulationResults,
+    )
+
+    # Sampling models (runtime)
+    from .sampling import (
+        SamplingStats as SamplingStats,
+        SamplingResult as SamplingResult,
+    )
+
+    # Network models (runtime)
+    from .network import (
+        Edge as Edge,
+        NetworkResult as NetworkResult,
+        NetworkMetrics as NetworkMetrics,
+        NodeMetrics as NodeMetrics,
+    )
+
+# Defining submodule -> public names it provides. This table is the single
+# source for __all__ and for lazy lookup; the TYPE_CHECKING imports above
+# only mirror it for static analysis.
+_LAZY_IMPORTS: dict[str, tuple[str, ...]] = {
+    ".population": (
+        # Grounding
+        "GroundingInfo",
+        "GroundingSummary",
+        # Distributions
+        "NormalDistribution",
+        "LognormalDistribution",
+        "UniformDistribution",
+        "BetaDistribution",
+        "CategoricalDistribution",
+        "BooleanDistribution",
+        "Distribution",
+        # Modifiers
+        "Modifier",
+        # Sampling
+        "SamplingConfig",
+        "Constraint",
+        # Attributes
+        "AttributeSpec",
+        "DiscoveredAttribute",
+        "HydratedAttribute",
+        # Spec
+        "SpecMeta",
+        "PopulationSpec",
+        # Pipeline types
+        "SufficiencyResult",
+    ),
+    ".scenario": (
+        # Event
+        "EventType",
+        "Event",
+        # Exposure
+        "ExposureChannel",
+        "ExposureRule",
+        "SeedExposure",
+        # Interaction
+        "InteractionType",
+        "InteractionConfig",
+        "SpreadModifier",
+        "SpreadConfig",
+        # Outcomes
+        "OutcomeType",
+        "OutcomeDefinition",
+        "OutcomeConfig",
+        # Config
+        "TimestepUnit",
+        "SimulationConfig",
+        # Spec
+        "ScenarioMeta",
+        "ScenarioSpec",
+    ),
+    ".validation": (
+        "Severity",
+        "ValidationIssue",
+        "ValidationResult",
+    ),
+    ".simulation": (
+        "ConvictionLevel",
+        "CONVICTION_MAP",
+        "CONVICTION_REVERSE_MAP",
+        "conviction_to_float",
+        "float_to_conviction",
+        "score_to_conviction_float",
+        "SimulationEventType",
+        "ExposureRecord",
+        "MemoryEntry",
+        "AgentState",
+        "SimulationEvent",
+        "PeerOpinion",
+        "ReasoningContext",
+        "ReasoningResponse",
+        "SimulationRunConfig",
+        "TimestepSummary",
+    ),
+    ".results": (
+        "SimulationSummary",
+        "AgentFinalState",
+        "SegmentAggregate",
+        "TimelinePoint",
+        "RunMeta",
+        "SimulationResults",
+    ),
+    ".sampling": (
+        "SamplingStats",
+        "SamplingResult",
+    ),
+    ".network": (
+        "Edge",
+        "NetworkResult",
+        "NetworkMetrics",
+        "NodeMetrics",
+    ),
+}
+_NAME_TO_MODULE = {
+    name: module for module, names in _LAZY_IMPORTS.items() for name in names
+}
+
+__all__ = list(_NAME_TO_MODULE)
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _NAME_TO_MODULE.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(__all__)
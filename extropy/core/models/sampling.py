@@ -3,6 +3,7 @@
 Contains models for sampling results and statistics.
 """
 
+import hashlib
 from typing import Any
 
 from pydantic import BaseModel, Field
@@ -33,3 +34,24 @@ class SamplingResult(BaseModel):
     agents: list[dict[str, Any]]
     meta: dict[str, Any]
     stats: SamplingStats
+
+    def fingerprint(self) -> str:
+        """Hash of the sampled agents, for cheap reproducibility checks.
+
+        Two results with the same agents (same attributes, value types and
+        values, in the same order) have the same fingerprint regardless of
+        dict key order. Values are tagged with their type, so 1, 1.0, True
+        and "1" all hash differently.
+        """
+        payload = repr(tuple(_canonical(agent) for agent in self.agents))
+        return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _canonical(value: Any) -> tuple:
+    """Type-tagged, key-order-independent form of a value for hashing."""
+    if isinstance(value, dict):
+        items = sorted((str(k), _canonical(v)) for k, v in value.items())
+        return ("dict", tuple(items))
+    if isinstance(value, (list, tuple)):
+        return (type(value).__name__, tuple(_canonical(v) for v in value))
+    return (type(value).__name__, repr(value))
@@ -4,14 +4,22 @@ Provides two-zone provider routing:
 - Pipeline provider: used for phases 1-2 (spec, extend, persona, scenario)
 - Simulation provider: used for phase 3 (agent reasoning)
 
-The simulation provider is cached so its async client can be reused
-across batch calls and closed cleanly before the event loop shuts down.
+Both providers are cached so their HTTP clients (and connection pools)
+are reused across calls. The simulation provider's async client is closed
+before the event loop shuts down; the pipeline provider is closed when
+the CLI exits.
 """
 
 from .base import LLMProvider
 from ...config import get_config, get_api_key, get_azure_config
 
 
+# Cached pipeline provider — shared by every pipeline step so one
+# connection pool is reused. Rebuilt if any setting it was built from
+# (provider, API key, Azure settings, API format) changes.
+_pipeline_provider: LLMProvider | None = None
+_pipeline_provider_key: tuple | None = None
+
 # Cached simulation provider — reused across batch calls so the async
 # client isn't re-created per request, and can be closed cleanly.
 _simulation_provider: LLMProvider | None = None
@@ -55,10 +63,41 @@ def _create_provider(provider_name: str) -> LLMProvider:
         )
 
 
+def _provider_settings_key(provider_name: str) -> tuple:
+    """Every resolved setting _create_provider builds a provider from."""
+    return (
+        provider_name,
+        get_api_key(provider_name),
+        tuple(sorted(get_azure_config(provider_name).items())),
+        get_config().simulation.api_format,
+    )
+
+
 def get_pipeline_provider() -> LLMProvider:
-    """Get the provider for pipeline phases (spec, extend, persona, scenario)."""
-    config = get_config()
-    return _create_provider(config.pipeline.provider)
+    """Get the cached provider for pipeline phases (spec, extend, persona, scenario).
+
+    All pipeline steps share one provider instance so its HTTP client and
+    connection pool are reused across calls.
+    """
+    global _pipeline_provider, _pipeline_provider_key
+    provider_name = get_config().pipeline.provider
+    key = _provider_settings_key(provider_name)
+
+    if _pipeline_provider is None or _pipeline_provider_key != key:
+        close_pipeline_provider()
+        _pipeline_provider = _create_provider(provider_name)
+        _pipeline_provider_key = key
+
+    return _pipeline_provider
+
+
+def close_pipeline_provider() -> None:
+    """Close and discard the cached pipeline provider's HTTP clients."""
+    global _pipeline_provider, _pipeline_provider_key
+    if _pipeline_provider is not None:
+        _pipeline_provider.close()
+        _pipeline_provider = None
+        _pipeline_provider_key = None
 
 
 def get_simulation_provider() -> LLMProvider:
@@ -92,6 +131,7 @@ async def close_simulation_provider() -> None:
 __all__ = [
     "LLMProvider",
     "get_pipeline_provider",
+    "close_pipeline_provider",
     "get_simulation_provider",
     "close_simulation_provider",
 ]
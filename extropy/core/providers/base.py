@@ -1,8 +1,14 @@
 """Abstract base class for LLM providers."""
 
+import asyncio
+import contextlib
+import logging
+import random
+import threading
+import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Callable, TYPE_CHECKING
+from typing import Any, Awaitable, Callable, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from ..rate_limiter import RateLimiter
@@ -23,11 +29,127 @@ ValidatorCallback = Callable[[dict], tuple[bool, str]]
 RetryCallback = Callable[[int, int, str], None]
 
 
+logger = logging.getLogger(__name__)
+
+# Default number of retries for transient API errors (429 / 5xx / network)
+_MAX_API_RETRIES = 3
+
+# Guards lazy rate limiter creation on providers shared across threads
+_rate_limiter_init_lock = threading.Lock()
+
+# Separator between validation feedback and the prompt it corrects
+_ERROR_PROMPT_SEPARATOR = "\n\n---\n\n"
+
+
+def _prepend_errors(errors: str, prompt: str) -> str:
+    """Prefix validation feedback to a prompt, building the string once."""
+    return _ERROR_PROMPT_SEPARATOR.join((errors, prompt))
+
+
 def estimate_tokens(text: str) -> int:
     """Estimate token count from text (rough heuristic: ~4 chars per token)."""
     return max(100, len(text) // 4)
 
 
+def _backoff_delay(
+    attempt: int, initial: float, factor: float, max_delay: float
+) -> float:
+    """Equal-jitter backoff: cap/2 + uniform(0, cap/2).
+
+    cap is min(max_delay, initial * factor**attempt). Keeping half of the
+    cap as a floor spreads retries out without letting a run of short
+    draws burn through a rate-limit window.
+    """
+    cap = min(max_delay, initial * factor**attempt)
+    return cap / 2 + random.uniform(0, cap / 2)
+
+
+def _retry_after_seconds(error: BaseException) -> float | None:
+    """Seconds the server asked us to wait (Retry-After header), if any."""
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None)
+    if headers is None:
+        return None
+    value = headers.get("retry-after")
+    if value is None:
+        return None
+    try:
+        seconds = float(value)
+    except (TypeError, ValueError):
+        # HTTP-date form is not used by the LLM APIs we call
+        return None
+    return seconds if seconds >= 0 else None
+
+
+def _retry_wait(
+    error: BaseException,
+    attempt: int,
+    initial: float,
+    factor: float,
+    max_delay: float,
+) -> float:
+    """Wait before retrying error: the backoff delay, or longer if the server asks."""
+    wait = _backoff_delay(attempt, initial, factor, max_delay)
+    retry_after = _retry_after_seconds(error)
+    if retry_after is not None:
+        wait = max(wait, retry_after)
+    return wait
+
+
+def _call_with_backoff(
+    fn: Callable[[], Any],
+    *,
+    transient_errors: tuple[type[BaseException], ...],
+    max_retries: int = _MAX_API_RETRIES,
+    initial: float = 0.5,
+    factor: float = 2.0,
+    max_delay: float = 30.0,
+    label: str = "LLM",
+) -> Any:
+    """Call fn, retrying transient errors with jittered exponential backoff.
+
+    Only exceptions in transient_errors are retried; anything else (and the
+    last transient error once retries are exhausted) propagates.
+    """
+    for attempt in range(max_retries + 1):
+        try:
+            return fn()
+        except transient_errors as e:
+            if attempt == max_retries:
+                raise
+            wait = _retry_wait(e, attempt, initial, factor, max_delay)
+            logger.warning(
+                f"[{label}] Transient error (attempt {attempt + 1}/{max_retries + 1}): "
+                f"{type(e).__name__}: {e}. Retrying in {wait:.1f}s"
+            )
+            time.sleep(wait)
+
+
+async def _call_with_backoff_async(
+    fn: Callable[[], Awaitable[Any]],
+    *,
+    transient_errors: tuple[type[BaseException], ...],
+    max_retries: int = _MAX_API_RETRIES,
+    initial: float = 0.5,
+    factor: float = 2.0,
+    max_delay: float = 30.0,
+    label: str = "LLM",
+) -> Any:
+    """Async version of _call_with_backoff."""
+    for attempt in range(max_retries + 1):
+        try:
+            return await fn()
+        except transient_errors as e:
+            if attempt == max_retries:
+                raise
+            wait = _retry_wait(e, attempt, initial, factor, max_delay)
+            logger.warning(
+                f"[{label}] Transient error (attempt {attempt + 1}/{max_retries + 1}): "
+                f"{type(e).__name__}: {e}. Retrying in {wait:.1f}s"
+            )
+            await asyncio.sleep(wait)
+
+
 class LLMProvider(ABC):
     """Abstract base class for LLM providers.
 
@@ -44,8 +166,24 @@ class LLMProvider(ABC):
     # Set to True to disable rate limiting (for tests)
     _disable_rate_limiting: bool = False
 
+    # Default in-flight request cap for batch_simple_call_async
+    default_max_concurrency: int = 16
+
+    # Provider-wide cap on in-flight async requests (None = unbounded),
+    # applied to every call that goes through _with_retry_async
+    max_concurrent_requests: int | None = None
+    _request_semaphore: asyncio.Semaphore | None = None
+    _request_semaphore_loop: asyncio.AbstractEventLoop | None = None
+
+    # SDK exceptions worth retrying with backoff (override in subclasses)
+    _transient_errors: tuple[type[BaseException], ...] = ()
+
+    # Label used in retry log messages (override in subclasses)
+    _log_label: str = "LLM"
+
     def __init__(self, api_key: str) -> None:
         self._api_key = api_key
+        self._cached_sync_client = None
         self._cached_async_client = None
         self._rate_limiter: "RateLimiter | None" = None
 
@@ -54,15 +192,21 @@ class LLMProvider(ABC):
 
         Uses Tier 1 limits by default. Called before each API request.
         """
-        # Defensive check for tests that use __new__ without __init__
-        if not hasattr(self, "_rate_limiter") or self._rate_limiter is None:
-            from ..rate_limiter import RateLimiter
-
-            self._rate_limiter = RateLimiter.for_provider(
-                provider=self.provider_name,
-                model=model,
-                tier=1,  # Default to Tier 1 (most restrictive)
-            )
+        # Defensive getattr for tests that use __new__ without __init__
+        limiter = getattr(self, "_rate_limiter", None)
+        if limiter is not None:
+            return limiter
+
+        # Threads sharing a provider must all end up with the same limiter
+        with _rate_limiter_init_lock:
+            if getattr(self, "_rate_limiter", None) is None:
+                from ..rate_limiter import RateLimiter
+
+                self._rate_limiter = RateLimiter.for_provider(
+                    provider=self.provider_name,
+                    model=model,
+                    tier=1,  # Default to Tier 1 (most restrictive)
+                )
         return self._rate_limiter
 
     def _acquire_rate_limit(
@@ -89,15 +233,79 @@ class LLMProvider(ABC):
             estimated_output_tokens=max_output,
         )
 
+    def _with_retry(self, fn, max_retries: int = _MAX_API_RETRIES):
+        """Retry a sync API call on transient errors with exponential backoff."""
+        return _call_with_backoff(
+            fn,
+            transient_errors=self._transient_errors,
+            max_retries=max_retries,
+            label=self._log_label,
+        )
+
+    def _request_slot(self):
+        """Async context manager holding one of the provider's request slots.
+
+        The semaphore is created per event loop, since each asyncio.run()
+        starts a new one.
+        """
+        if self.max_concurrent_requests is None:
+            return contextlib.nullcontext()
+        loop = asyncio.get_running_loop()
+        if self._request_semaphore is None or self._request_semaphore_loop is not loop:
+            self._request_semaphore = asyncio.Semaphore(self.max_concurrent_requests)
+            self._request_semaphore_loop = loop
+        return self._request_semaphore
+
+    async def _with_retry_async(self, fn, max_retries: int = _MAX_API_RETRIES):
+        """Retry an async API call on transient errors with exponential backoff.
+
+        The provider request slot is held across retries, so backoff waits
+        also count against max_concurrent_requests.
+        """
+        async with self._request_slot():
+            return await _call_with_backoff_async(
+                fn,
+                transient_errors=self._transient_errors,
+                max_retries=max_retries,
+                label=self._log_label,
+            )
+
+    def close(self) -> None:
+        """Close the cached sync client to release pooled connections."""
+        if self._cached_sync_client is not None:
+            self._cached_sync_client.close()
+            self._cached_sync_client = None
+
     async def close_async(self) -> None:
-        """Close the cached async client to release connections cleanly.
+        """Close the cached clients to release connections cleanly.
 
         Must be called before the event loop shuts down to avoid
         'Event loop is closed' errors from orphaned httpx connections.
+        Safe to call more than once.
         """
-        if self._cached_async_client is not None:
-            await self._cached_async_client.close()
-            self._cached_async_client = None
+        self.close()
+        client = self._cached_async_client
+        if client is None:
+            return
+        # Clear first so concurrent or repeated calls return immediately
+        self._cached_async_client = None
+        try:
+            await client.close()
+        except RuntimeError as e:
+            # Transport already torn down with its event loop
+            logger.debug(f"Ignoring error while closing async client: {e}")
+
+    def __enter__(self) -> "LLMProvider":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    async def __aenter__(self) -> "LLMProvider":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close_async()
 
     @property
     @abstractmethod
@@ -142,7 +350,50 @@ class LLMProvider(ABC):
         """Async version of simple_call for concurrent API requests."""
         ...
 
-    def _retry_with_validation(
+    async def batch_simple_call_async(
+        self,
+        prompts: list[tuple[str, dict]],
+        *,
+        schema_name: str = "response",
+        model: str | None = None,
+        max_tokens: int | None = None,
+        max_concurrency: int | None = None,
+    ) -> list[tuple[dict, TokenUsage] | BaseException]:
+        """Run independent simple_call_async requests with bounded concurrency.
+
+        Use this for fan-out over many independent prompts instead of
+        writing ad-hoc gather loops at call sites.
+
+        Args:
+            prompts: (prompt, response_schema) pairs.
+            schema_name: Schema name shared by all requests.
+            model: Model override shared by all requests.
+            max_tokens: Max output tokens shared by all requests.
+            max_concurrency: Max in-flight requests
+                (defaults to ``default_max_concurrency``).
+
+        Returns:
+            One entry per prompt, in input order: the (structured_data,
+            token_usage) result, or the exception raised by that request.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency or self.default_max_concurrency)
+
+        async def _call(prompt: str, response_schema: dict):
+            async with semaphore:
+                return await self.simple_call_async(
+                    prompt=prompt,
+                    response_schema=response_schema,
+                    schema_name=schema_name,
+                    model=model,
+                    max_tokens=max_tokens,
+                )
+
+        return await asyncio.gather(
+            *(_call(prompt, schema) for prompt, schema in prompts),
+            return_exceptions=True,
+        )
+
+    def _retry_with_validation_status(
         self,
         call_fn,
         prompt: str,
@@ -151,7 +402,7 @@ class LLMProvider(ABC):
         on_retry: RetryCallback | None,
         extract_error_summary_fn,
         initial_prompt: str | None = None,
-    ) -> dict:
+    ) -> tuple[dict, bool]:
         """Shared validation-retry loop for reasoning_call and agentic_research.
 
         Args:
@@ -167,7 +418,9 @@ class LLMProvider(ABC):
                 without persisting them across validation retries.
 
         Returns:
-            Validated result dict (or last attempt if retries exhausted).
+            Tuple of (result dict, whether it passed validation). The result
+            is the last attempt if retries were exhausted. Without a
+            validator every result counts as passing.
         """
         effective_prompt = initial_prompt if initial_prompt is not None else prompt
         attempts = 0
@@ -178,11 +431,11 @@ class LLMProvider(ABC):
             result = call_fn(effective_prompt)
 
             if validator is None:
-                return result
+                return result, True
 
             is_valid, error_msg = validator(result)
             if is_valid:
-                return result
+                return result, True
 
             attempts += 1
             last_error_summary = extract_error_summary_fn(error_msg)
@@ -190,11 +443,15 @@ class LLMProvider(ABC):
             if attempts <= max_retries:
                 if on_retry:
                     on_retry(attempts, max_retries, last_error_summary)
-                effective_prompt = f"{error_msg}\n\n---\n\n{prompt}"
+                effective_prompt = _prepend_errors(error_msg, prompt)
 
         if on_retry:
             on_retry(max_retries + 1, max_retries, f"EXHAUSTED: {last_error_summary}")
-        return result
+        return result, False
+
+    def _retry_with_validation(self, call_fn, prompt: str, *args, **kwargs) -> dict:
+        """Like _retry_with_validation_status, returning only the result."""
+        return self._retry_with_validation_status(call_fn, prompt, *args, **kwargs)[0]
 
     @abstractmethod
     def reasoning_call(
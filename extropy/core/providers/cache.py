@@ -0,0 +1,95 @@
+"""Response cache for deterministic LLM calls.
+
+Pipeline steps often send the exact same prompt and schema more than once
+within a run (and across reruns of the same spec). ``LLMCache`` stores the
+structured result of such calls keyed by a hash of everything that shapes
+the request, so repeats skip the network round-trip entirely.
+
+By default entries live in memory for the life of the process. Pass
+``directory`` to persist them on disk across runs; that requires the
+optional ``diskcache`` package (``pip install diskcache``).
+"""
+
+import copy
+import hashlib
+import json
+from typing import Any
+
+try:
+    import diskcache
+
+    HAS_DISKCACHE = True
+except ImportError:
+    HAS_DISKCACHE = False
+
+
+def make_cache_key(**request: Any) -> str:
+    """Hash the fields that shape an LLM request into a stable cache key."""
+    payload = json.dumps(request, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class LLMCache:
+    """Cache of structured LLM responses keyed by request hash.
+
+    Args:
+        directory: Persist entries in this directory via diskcache. When
+            omitted, entries are kept in memory only.
+        ttl: Seconds before an entry expires (disk cache only). ``None``
+            keeps entries until evicted.
+        max_entries: Max entries held by the in-memory cache; the oldest
+            entry is evicted first.
+    """
+
+    def __init__(
+        self,
+        directory: str | None = None,
+        *,
+        ttl: float | None = None,
+        max_entries: int = 1024,
+    ) -> None:
+        if directory is not None and not HAS_DISKCACHE:
+            raise ImportError(
+                "A persistent LLM cache requires the diskcache package.\n"
+                "  pip install diskcache"
+            )
+        self._disk = diskcache.Cache(directory) if directory is not None else None
+        self._memory: dict[str, Any] = {}
+        self._ttl = ttl
+        self._max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Any | None:
+        """Return a copy of the cached value for key, or None on a miss."""
+        if self._disk is not None:
+            value = self._disk.get(key)
+        else:
+            value = copy.deepcopy(self._memory.get(key))
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a copy of value under key."""
+        if self._disk is not None:
+            self._disk.set(key, value, expire=self._ttl)
+            return
+        if key not in self._memory and len(self._memory) >= self._max_entries:
+            del self._memory[next(iter(self._memory))]
+        self._memory[key] = copy.deepcopy(value)
+
+    def clear(self) -> None:
+        """Drop every entry and reset the hit/miss counters."""
+        if self._disk is not None:
+            self._disk.clear()
+        self._memory.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def close(self) -> None:
+        """Close the underlying disk cache, if any."""
+        if self._disk is not None:
+            self._disk.close()
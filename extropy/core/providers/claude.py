@@ -7,20 +7,41 @@ data guaranteed to match the schema.
 """
 
 import logging
-import random
-import time
 
 import anthropic
-
-from .base import LLMProvider, TokenUsage, ValidatorCallback, RetryCallback
+import httpx
+
+from .base import (
+    LLMProvider,
+    TokenUsage,
+    ValidatorCallback,
+    RetryCallback,
+    _prepend_errors,
+)
 from .logging import log_request_response, extract_error_summary
 
+try:
+    import httpx_aiohttp  # noqa: F401
+
+    HAS_AIOHTTP = True
+except ImportError:
+    HAS_AIOHTTP = False
+
 _TRANSIENT_ANTHROPIC_ERRORS = (
     anthropic.APIConnectionError,
+    anthropic.APITimeoutError,
     anthropic.InternalServerError,
     anthropic.RateLimitError,
 )
-_MAX_API_RETRIES = 3
+
+# Connection pool sizing for the shared HTTP clients. The SDK default caps
+# in-flight requests at 100, which throttles large simulation batches.
+_DEFAULT_MAX_CONNECTIONS = 1000
+_DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 500
+# Matches the SDK's own read timeout; non-streamed research calls with web
+# search can legitimately run for several minutes
+_DEFAULT_TIMEOUT_SECONDS = 600.0
+_CONNECT_TIMEOUT_SECONDS = 5.0
 
 
 logger = logging.getLogger(__name__)
@@ -49,9 +70,25 @@ def _clean_schema_for_tool(schema: dict) -> dict:
     return cleaned
 
 
+# Structured-output tools keyed by (schema_name, id(response_schema)). Each
+# entry holds a reference to its schema so the id cannot be reused while
+# cached. Schemas are treated as immutable once passed to a call.
+_STRUCTURED_TOOL_CACHE: dict[tuple[str, int], tuple[dict, dict]] = {}
+_STRUCTURED_TOOL_CACHE_MAX = 128
+
+
 def _make_structured_tool(schema_name: str, response_schema: dict) -> dict:
-    """Create a tool definition that forces structured output."""
-    return {
+    """Create a tool definition that forces structured output.
+
+    Cached per schema object, so repeated calls with the same schema
+    (e.g. every validation retry) skip re-cleaning it.
+    """
+    key = (schema_name, id(response_schema))
+    cached = _STRUCTURED_TOOL_CACHE.get(key)
+    if cached is not None and cached[0] is response_schema:
+        return cached[1]
+
+    tool = {
         "name": schema_name,
         "description": (
             "Return your response as structured data. "
@@ -59,6 +96,10 @@ def _make_structured_tool(schema_name: str, response_schema: dict) -> dict:
         ),
         "input_schema": _clean_schema_for_tool(response_schema),
     }
+    if len(_STRUCTURED_TOOL_CACHE) >= _STRUCTURED_TOOL_CACHE_MAX:
+        _STRUCTURED_TOOL_CACHE.clear()
+    _STRUCTURED_TOOL_CACHE[key] = (response_schema, tool)
+    return tool
 
 
 def _extract_tool_input(response) -> dict | None:
@@ -69,17 +110,64 @@ def _extract_tool_input(response) -> dict | None:
     return None
 
 
+def _stream_message(client: anthropic.Anthropic, **kwargs):
+    """Send a Messages request as a stream and return the assembled message.
+
+    The response body is consumed as it is generated instead of in one read
+    after generation finishes, which keeps long (reasoning-sized) requests
+    clear of idle read timeouts.
+    """
+    with client.messages.stream(**kwargs) as stream:
+        return stream.get_final_message()
+
+
 class ClaudeProvider(LLMProvider):
     """Claude (Anthropic) LLM provider.
 
     Uses the tool use pattern for structured output — Claude "calls" a tool
     with the response data, guaranteeing valid JSON matching the schema.
 
+    Sync and async clients are created lazily and reused across calls so
+    HTTP connections stay pooled. Use the provider as a (async) context
+    manager, or call ``close()`` / ``close_async()``, to release them.
+
+    Args:
+        api_key: Anthropic API key.
+        max_connections: Max concurrent connections in each client's pool.
+        max_keepalive_connections: Max idle connections kept alive for reuse.
+        timeout: Per-request timeout in seconds.
+        use_aiohttp: Send async requests over aiohttp instead of httpx's
+            default transport, for higher throughput on large concurrent
+            batches. Requires ``pip install "anthropic[aiohttp]"``.
+        max_concurrent_requests: Cap on in-flight async requests across all
+            callers of this provider. ``None`` leaves concurrency to callers.
     """
 
     provider_name = "anthropic"
+    _transient_errors = _TRANSIENT_ANTHROPIC_ERRORS
+    _log_label = "Claude"
+
+    def __init__(
+        self,
+        api_key: str = "",
+        *,
+        max_connections: int = _DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: int = _DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+        timeout: float = _DEFAULT_TIMEOUT_SECONDS,
+        use_aiohttp: bool = False,
+        max_concurrent_requests: int | None = None,
+    ) -> None:
+        if use_aiohttp and not HAS_AIOHTTP:
+            raise ImportError(
+                "httpx-aiohttp is required for the aiohttp transport. "
+                'Install with: pip install "anthropic[aiohttp]"'
+            )
+        self._max_connections = max_connections
+        self._max_keepalive_connections = max_keepalive_connections
+        self._timeout = timeout
+        self._use_aiohttp = use_aiohttp
+        self.max_concurrent_requests = max_concurrent_requests
 
-    def __init__(self, api_key: str = "") -> None:
         if not api_key:
             raise ValueError(
                 "Anthropic API key not found. Set it via:\n"
@@ -88,38 +176,6 @@ class ClaudeProvider(LLMProvider):
             )
         super().__init__(api_key)
 
-    def _with_retry(self, fn, max_retries: int = _MAX_API_RETRIES):
-        """Retry a sync API call on transient errors with exponential backoff."""
-        for attempt in range(max_retries + 1):
-            try:
-                return fn()
-            except _TRANSIENT_ANTHROPIC_ERRORS as e:
-                if attempt == max_retries:
-                    raise
-                wait = (2**attempt) + random.random()
-                logger.warning(
-                    f"[Claude] Transient error (attempt {attempt + 1}/{max_retries + 1}): "
-                    f"{type(e).__name__}: {e}. Retrying in {wait:.1f}s"
-                )
-                time.sleep(wait)
-
-    async def _with_retry_async(self, fn, max_retries: int = _MAX_API_RETRIES):
-        """Retry an async API call on transient errors with exponential backoff."""
-        import asyncio
-
-        for attempt in range(max_retries + 1):
-            try:
-                return await fn()
-            except _TRANSIENT_ANTHROPIC_ERRORS as e:
-                if attempt == max_retries:
-                    raise
-                wait = (2**attempt) + random.random()
-                logger.warning(
-                    f"[Claude] Transient error (attempt {attempt + 1}/{max_retries + 1}): "
-                    f"{type(e).__name__}: {e}. Retrying in {wait:.1f}s"
-                )
-                await asyncio.sleep(wait)
-
     @property
     def default_simple_model(self) -> str:
         return "claude-haiku-4-5-20251001"
@@ -132,12 +188,46 @@ class ClaudeProvider(LLMProvider):
     def default_research_model(self) -> str:
         return "claude-sonnet-4-5-20250929"
 
+    def _http_limits(self) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=self._max_connections,
+            max_keepalive_connections=self._max_keepalive_connections,
+        )
+
+    def _http_timeout(self) -> httpx.Timeout:
+        return httpx.Timeout(self._timeout, connect=_CONNECT_TIMEOUT_SECONDS)
+
     def _get_client(self) -> anthropic.Anthropic:
-        return anthropic.Anthropic(api_key=self._api_key)
+        # SDK-level retries are disabled: transient errors are retried by
+        # _with_retry, and stacking both multiplies attempts per call.
+        if self._cached_sync_client is None:
+            self._cached_sync_client = anthropic.Anthropic(
+                api_key=self._api_key,
+                max_retries=0,
+                http_client=anthropic.DefaultHttpxClient(
+                    limits=self._http_limits(),
+                    timeout=self._http_timeout(),
+                ),
+            )
+        return self._cached_sync_client
 
     def _get_async_client(self) -> anthropic.AsyncAnthropic:
         if self._cached_async_client is None:
-            self._cached_async_client = anthropic.AsyncAnthropic(api_key=self._api_key)
+            # Closing the SDK client (close_async) also closes the aiohttp
+            # session when that transport is in use.
+            http_client_cls = (
+                anthropic.DefaultAioHttpClient
+                if self._use_aiohttp
+                else anthropic.DefaultAsyncHttpxClient
+            )
+            self._cached_async_client = anthropic.AsyncAnthropic(
+                api_key=self._api_key,
+                max_retries=0,
+                http_client=http_client_cls(
+                    limits=self._http_limits(),
+                    timeout=self._http_timeout(),
+                ),
+            )
         return self._cached_async_client
 
     def simple_call(
@@ -161,7 +251,8 @@ class ClaudeProvider(LLMProvider):
         )
 
         response = self._with_retry(
-            lambda: client.messages.create(
+            lambda: _stream_message(
+                client,
                 model=model,
                 max_tokens=max_tokens or 4096,
                 tools=[tool],
@@ -234,18 +325,24 @@ class ClaudeProvider(LLMProvider):
 
         effective_prompt = prompt
         if previous_errors:
-            effective_prompt = f"{previous_errors}\n\n---\n\n{prompt}"
+            effective_prompt = _prepend_errors(previous_errors, prompt)
+
+        # Static request fields are built once and shared by every attempt
+        request_kwargs = {
+            "model": model,
+            "max_tokens": 16384,
+            "tools": [tool],
+            "tool_choice": {"type": "tool", "name": schema_name},
+        }
 
         def _call(ep: str) -> dict:
             # Acquire rate limit capacity before each API call
             self._acquire_rate_limit(ep, model, max_output=16384)
 
             response = self._with_retry(
-                lambda: client.messages.create(
-                    model=model,
-                    max_tokens=16384,
-                    tools=[tool],
-                    tool_choice={"type": "tool", "name": schema_name},
+                lambda: _stream_message(
+                    client,
+                    **request_kwargs,
                     messages=[{"role": "user", "content": ep}],
                 )
             )
@@ -293,15 +390,31 @@ class ClaudeProvider(LLMProvider):
 
         effective_prompt = prompt
         if previous_errors:
-            effective_prompt = f"{previous_errors}\n\n---\n\n{prompt}"
+            effective_prompt = _prepend_errors(previous_errors, prompt)
+
+        # Insertion-ordered set of source URLs across all attempts
+        all_sources: dict[str, None] = {}
 
-        all_sources: list[str] = []
+        # Static request fields are built once and shared by every attempt
+        research_suffix = (
+            f"\n\nAfter researching, call the '{schema_name}' tool "
+            "with your structured findings."
+        )
+        request_kwargs = {
+            "model": model,
+            "max_tokens": 16384,
+            "tools": [
+                {
+                    "type": "web_search_20250305",
+                    "name": "web_search",
+                    "max_uses": 5,
+                },
+                output_tool,
+            ],
+        }
 
         def _call(ep: str) -> dict:
-            research_prompt = (
-                f"{ep}\n\n"
-                f"After researching, call the '{schema_name}' tool with your structured findings."
-            )
+            research_prompt = ep + research_suffix
 
             # Acquire rate limit capacity before each API call
             self._acquire_rate_limit(research_prompt, model, max_output=16384)
@@ -310,29 +423,20 @@ class ClaudeProvider(LLMProvider):
 
             response = self._with_retry(
                 lambda: client.messages.create(
-                    model=model,
-                    max_tokens=16384,
-                    tools=[
-                        {
-                            "type": "web_search_20250305",
-                            "name": "web_search",
-                            "max_uses": 5,
-                        },
-                        output_tool,
-                    ],
+                    **request_kwargs,
                     messages=[{"role": "user", "content": research_prompt}],
                 )
             )
 
             structured_data = None
-            sources: list[str] = []
+            sources: dict[str, None] = {}
 
             for block in response.content:
                 if block.type == "web_search_tool_result":
                     if hasattr(block, "content") and block.content:
                         for res in block.content:
                             if hasattr(res, "url"):
-                                sources.append(res.url)
+                                sources[res.url] = None
 
                 if block.type == "tool_use" and block.name == schema_name:
                     structured_data = block.input
@@ -341,9 +445,9 @@ class ClaudeProvider(LLMProvider):
                     if hasattr(block, "citations") and block.citations:
                         for citation in block.citations:
                             if hasattr(citation, "url"):
-                                sources.append(citation.url)
+                                sources[citation.url] = None
 
-            all_sources.extend(sources)
+            all_sources.update(sources)
             logger.info(f"[Claude] Web search completed, found {len(sources)} sources")
 
             if log:
@@ -352,7 +456,7 @@ class ClaudeProvider(LLMProvider):
                     request={"model": model, "prompt_length": len(research_prompt)},
                     response=response,
                     provider="claude",
-                    sources=list(set(sources)),
+                    sources=list(sources),
                 )
 
             return structured_data or {}
@@ -367,4 +471,4 @@ class ClaudeProvider(LLMProvider):
             initial_prompt=effective_prompt if previous_errors else None,
         )
 
-        return result, list(set(all_sources))
+        return result, list(all_sources)
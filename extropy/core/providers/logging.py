@@ -1,9 +1,49 @@
-"""Shared logging helpers for LLM providers."""
+"""Shared logging helpers for LLM providers.
 
+Request/response logs are appended as JSON lines to a single file per
+process (``logs/llm_<start_timestamp>_<pid>.jsonl``). Entries are written
+by a background daemon thread, in batches, so API calls never block on
+serialization or disk I/O. Entries still queued at interpreter exit are
+drained, and the log file closed, by an ``atexit`` hook. Serialization
+uses orjson when it is installed and falls back to the stdlib ``json``
+module otherwise. Use ``split_log_file`` to expand a JSONL log back into
+one JSON file per call.
+"""
+
+import atexit
+import dataclasses
 import json
+import logging
+import os
+import queue
+import re
+import threading
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, TextIO
+
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+logger = logging.getLogger(__name__)
+
+# Max entries coalesced into a single write()/flush()
+_LOG_BATCH_SIZE = 64
+
+_log_queue: "queue.Queue[tuple]" = queue.Queue()
+_log_worker: threading.Thread | None = None
+_log_worker_lock = threading.Lock()
+_log_file: TextIO | None = None
+_log_file_pid: int | None = None
+
+# First line that is not blank, a "#" heading or a "---" separator, with
+# surrounding whitespace excluded from the capture
+_SUMMARY_LINE_RE = re.compile(r"^[^\S\n]*(?!#|---)(\S(?:.*\S)?)[^\S\n]*$", re.MULTILINE)
 
 
 def get_logs_dir() -> Path:
@@ -13,57 +53,192 @@ def get_logs_dir() -> Path:
     return logs_dir
 
 
-def log_request_response(
-    function_name: str,
-    request: dict,
-    response: Any,
-    provider: str = "",
-    sources: list[str] | None = None,
-) -> None:
-    """Log full request and response to a JSON file."""
-    logs_dir = get_logs_dir()
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
-    prefix = f"{provider}_" if provider else ""
-    log_file = logs_dir / f"{timestamp}_{prefix}{function_name}.json"
+def _get_log_file() -> TextIO:
+    """Open this process's JSONL log file on first use."""
+    global _log_file, _log_file_pid
+    pid = os.getpid()
+    if _log_file is None or _log_file_pid != pid:
+        started = datetime.now().strftime("%Y%m%d_%H%M%S")
+        log_path = get_logs_dir() / f"llm_{started}_{pid}.jsonl"
+        # Kept open for the life of the process; closed by close_logs()
+        _log_file = open(log_path, "a", encoding="utf-8")  # noqa: SIM115
+        _log_file_pid = pid
+    return _log_file
+
 
-    response_dict = None
+def _json_default(obj: Any) -> Any:
+    """Serialize values json/orjson cannot encode natively."""
+    if hasattr(obj, "model_dump"):
+        return obj.model_dump(mode="json", warnings=False)
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return dataclasses.asdict(obj)
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    if isinstance(obj, (set, frozenset, tuple)):
+        return list(obj)
+    if isinstance(obj, bytes):
+        return obj.decode("utf-8", errors="replace")
+    if isinstance(obj, Path):
+        return str(obj)
+    return repr(obj)
+
+
+def _serialize_response(response: Any) -> Any:
+    """Convert an SDK response object into JSON-friendly data."""
     if hasattr(response, "model_dump"):
         try:
-            response_dict = response.model_dump(mode="json", warnings=False)
+            return response.model_dump(mode="json", warnings=False)
         except Exception:
-            response_dict = str(response)
-    elif hasattr(response, "__dict__"):
-        response_dict = str(response)
-    else:
-        response_dict = str(response)
+            return str(response)
+    return str(response)
+
 
+def _format_log_line(
+    logged_at: float,
+    function_name: str,
+    request: dict,
+    response: Any,
+    provider: str,
+    sources: list[str] | None,
+) -> str:
+    """Serialize one log entry as a JSON line."""
     log_data = {
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": datetime.fromtimestamp(logged_at).isoformat(),
         "function": function_name,
         "provider": provider,
         "request": request,
-        "response": response_dict,
+        "response": _serialize_response(response),
         "sources_extracted": sources or [],
     }
+    if HAS_ORJSON:
+        return orjson.dumps(
+            log_data,
+            default=_json_default,
+            option=orjson.OPT_NON_STR_KEYS
+            | orjson.OPT_SERIALIZE_NUMPY
+            | orjson.OPT_APPEND_NEWLINE,
+        ).decode()
+    return json.dumps(log_data, default=_json_default, separators=(",", ":")) + "\n"
+
+
+def _drain_log_queue() -> None:
+    """Worker loop: write queued log entries in batches until exit."""
+    while True:
+        batch = [_log_queue.get()]
+        while len(batch) < _LOG_BATCH_SIZE:
+            try:
+                batch.append(_log_queue.get_nowait())
+            except queue.Empty:
+                break
+        try:
+            lines = []
+            for entry in batch:
+                try:
+                    lines.append(_format_log_line(*entry))
+                except Exception:
+                    logger.exception("Failed to serialize LLM request log")
+            log_file = _get_log_file()
+            log_file.write("".join(lines))
+            log_file.flush()
+        except Exception:
+            logger.exception("Failed to write LLM request log")
+        finally:
+            for _ in batch:
+                _log_queue.task_done()
+
+
+def _ensure_log_worker() -> None:
+    """Start the background log writer thread on first use."""
+    global _log_worker
+    if _log_worker is not None and _log_worker.is_alive():
+        return
+    with _log_worker_lock:
+        if _log_worker is None or not _log_worker.is_alive():
+            _log_worker = threading.Thread(
+                target=_drain_log_queue, name="extropy-llm-log", daemon=True
+            )
+            _log_worker.start()
+
+
+def flush_logs() -> None:
+    """Block until every queued log entry has been written."""
+    if _log_worker is not None and _log_worker.is_alive():
+        _log_queue.join()
+
+
+def close_logs() -> None:
+    """Write every queued log entry, then close the log file.
+
+    Logging again afterwards reopens a new log file.
+    """
+    global _log_file, _log_file_pid
+    flush_logs()
+    if _log_file is not None:
+        _log_file.close()
+        _log_file = None
+        _log_file_pid = None
+
+
+atexit.register(close_logs)
+
+
+def split_log_file(log_path: Path | str, out_dir: Path | str) -> list[Path]:
+    """Expand a JSONL log into one pretty-printed JSON file per call.
 
-    with open(log_file, "w") as f:
-        json.dump(log_data, f, indent=2, default=str)
+    Args:
+        log_path: Path to an ``llm_*.jsonl`` log file.
+        out_dir: Directory to write the per-call files into.
+
+    Returns:
+        Paths of the files written, in log order.
+    """
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    written = []
+    with open(log_path, encoding="utf-8") as f:
+        for i, line in enumerate(f):
+            if not line.strip():
+                continue
+            entry = json.loads(line)
+            timestamp = datetime.fromisoformat(entry["timestamp"])
+            prefix = f"{entry['provider']}_" if entry.get("provider") else ""
+            name = (
+                f"{timestamp.strftime('%Y%m%d_%H%M%S_%f')}_{i:06d}_"
+                f"{prefix}{entry['function']}.json"
+            )
+            path = out_dir / name
+            path.write_text(json.dumps(entry, indent=2), encoding="utf-8")
+            written.append(path)
+    return written
+
+
+def log_request_response(
+    function_name: str,
+    request: dict,
+    response: Any,
+    provider: str = "",
+    sources: list[str] | None = None,
+) -> None:
+    """Queue the full request and response to be logged to the JSONL log.
+
+    Returns immediately; timestamp formatting, serialization and the file
+    write all happen on the background log writer thread.
+    """
+    _ensure_log_worker()
+    _log_queue.put((time.time(), function_name, request, response, provider, sources))
 
 
 def extract_error_summary(error_msg: str) -> str:
-    """Extract a concise error summary from validation error message."""
-    if not error_msg:
+    """Extract a concise error summary from validation error message.
+
+    The summary comes from the first line that is not blank, a ``#``
+    heading, or a ``---`` separator.
+    """
+    match = _SUMMARY_LINE_RE.search(error_msg) if error_msg else None
+    if match is None:
         return "validation error"
 
-    lines = error_msg.strip().split("\n")
-    for line in lines:
-        line = line.strip()
-        if line and not line.startswith("#") and not line.startswith("---"):
-            if "ERROR in" in line:
-                return line[:60]
-            elif "Problem:" in line:
-                return line.replace("Problem:", "").strip()[:60]
-            elif line:
-                return line[:60]
-
-    return "validation error"
+    line = match.group(1)
+    if "Problem:" in line and "ERROR in" not in line:
+        return line.replace("Problem:", "").strip()[:60]
+    return line[:60]
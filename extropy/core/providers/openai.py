@@ -2,25 +2,110 @@
 
 import json
 import logging
-import random
 import time
+from typing import Any
 
+import httpx
 import openai
 from openai import OpenAI, AsyncOpenAI
 
-from .base import LLMProvider, TokenUsage, ValidatorCallback, RetryCallback
+from .base import (
+    LLMProvider,
+    TokenUsage,
+    ValidatorCallback,
+    RetryCallback,
+    _prepend_errors,
+)
+from .cache import LLMCache, make_cache_key
 from .logging import log_request_response, extract_error_summary
 
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 _TRANSIENT_OPENAI_ERRORS = (
     openai.APIConnectionError,
+    openai.APITimeoutError,
     openai.InternalServerError,
     openai.RateLimitError,
 )
-_MAX_API_RETRIES = 3
 
 
 logger = logging.getLogger(__name__)
 
+# Connection pool sizing for the shared HTTP clients. The SDK default caps
+# in-flight requests at 100, which throttles large simulation batches.
+_DEFAULT_MAX_CONNECTIONS = 1000
+_DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 500
+
+# Batch API job states after which polling stops
+_BATCH_TERMINAL_STATES = frozenset({"completed", "failed", "expired", "cancelled"})
+
+
+def _loads(text: str | bytes) -> Any:
+    """Parse a JSON payload, using orjson when it is installed."""
+    if HAS_ORJSON:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def _extract_text_and_sources(
+    response, with_sources: bool = False
+) -> tuple[str | None, list[str]]:
+    """Scan a Responses API response for its output text and source URLs.
+
+    Returns the first ``output_text`` content and, when with_sources is set,
+    every web search source and ``url_citation`` URL in output order.
+    Without with_sources the scan stops at the first output text.
+    """
+    text = None
+    sources: list[str] = []
+    for item in response.output:
+        item_type = getattr(item, "type", None)
+        if item_type == "message":
+            for content_item in item.content:
+                if (
+                    text is None
+                    and getattr(content_item, "type", None) == "output_text"
+                ):
+                    text = getattr(content_item, "text", None)
+                    if not with_sources:
+                        return text, sources
+                if with_sources:
+                    for annotation in getattr(content_item, "annotations", None) or ():
+                        if getattr(annotation, "type", None) == "url_citation":
+                            url = getattr(annotation, "url", None)
+                            if url:
+                                sources.append(url)
+        elif with_sources and item_type == "web_search_call":
+            action = getattr(item, "action", None)
+            for source in getattr(action, "sources", None) or ():
+                if isinstance(source, dict):
+                    url = source.get("url")
+                else:
+                    url = getattr(source, "url", None)
+                if url:
+                    sources.append(url)
+    return text, sources
+
+
+def _extract_batch_body_text(body: dict, use_chat: bool) -> str | None:
+    """Extract output text from a raw (JSON) response body in a batch result."""
+    if use_chat:
+        choices = body.get("choices") or []
+        if choices:
+            return (choices[0].get("message") or {}).get("content") or None
+        return None
+    for item in body.get("output") or []:
+        if item.get("type") == "message":
+            for content_item in item.get("content") or []:
+                if content_item.get("type") == "output_text":
+                    return content_item.get("text")
+    return None
+
 
 class OpenAIProvider(LLMProvider):
     """OpenAI LLM provider supporting both Responses API and Chat Completions API.
@@ -34,9 +119,23 @@ class OpenAIProvider(LLMProvider):
 
     Azure-hosted models (e.g. DeepSeek-V3.2, Kimi-K2.5) only support Chat Completions,
     so Azure providers default to chat_completions when created via the factory.
+
+    Sync and async clients are created lazily and reused across calls so
+    HTTP connections stay pooled. Use the provider as a (async) context
+    manager, or call ``close()`` / ``close_async()``, to release them.
+
+    ``max_concurrent_requests`` caps in-flight async requests across all
+    callers of the provider, so unbounded fan-outs queue instead of
+    tripping rate limits.
+
+    Pass an ``LLMCache`` as ``cache`` to reuse structured results of identical
+    simple_call / simple_call_async / reasoning_call requests instead of
+    hitting the API again.
     """
 
     provider_name = "openai"
+    _transient_errors = _TRANSIENT_OPENAI_ERRORS
+    _log_label = "OpenAI"
 
     def __init__(
         self,
@@ -46,12 +145,20 @@ class OpenAIProvider(LLMProvider):
         api_version: str = "",
         azure_deployment: str = "",
         api_format: str = "responses",
+        cache: LLMCache | None = None,
+        max_connections: int = _DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: int = _DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+        max_concurrent_requests: int | None = None,
     ) -> None:
         self._is_azure = bool(azure_endpoint)
         self._azure_endpoint = azure_endpoint
         self._api_version = api_version
         self._azure_deployment = azure_deployment
         self._api_format = api_format
+        self._cache = cache
+        self._max_connections = max_connections
+        self._max_keepalive_connections = max_keepalive_connections
+        self.max_concurrent_requests = max_concurrent_requests
 
         if not api_key:
             if self._is_azure:
@@ -77,6 +184,19 @@ class OpenAIProvider(LLMProvider):
             return self._azure_deployment
         return default
 
+    def _cache_lookup(self, **request) -> tuple[str | None, dict | None]:
+        """Return (cache key, cached result); both None when caching is off.
+
+        The key covers the endpoint and API format as well as the request,
+        so providers sharing one cache never serve each other's results.
+        """
+        if self._cache is None:
+            return None, None
+        key = make_cache_key(
+            endpoint=self._azure_endpoint, api_format=self._api_format, **request
+        )
+        return key, self._cache.get(key)
+
     @staticmethod
     def _extract_output_text(response) -> str | None:
         """Extract the output text content from an OpenAI Responses API response.
@@ -86,16 +206,7 @@ class OpenAIProvider(LLMProvider):
         Returns:
             Raw text string, or None if not found.
         """
-        for item in response.output:
-            if hasattr(item, "type") and item.type == "message":
-                for content_item in item.content:
-                    if (
-                        hasattr(content_item, "type")
-                        and content_item.type == "output_text"
-                    ):
-                        if hasattr(content_item, "text"):
-                            return content_item.text
-        return None
+        return _extract_text_and_sources(response)[0]
 
     @staticmethod
     def _extract_chat_completions_text(response) -> str | None:
@@ -160,38 +271,6 @@ class OpenAIProvider(LLMProvider):
             params["max_tokens"] = max_tokens
         return params
 
-    def _with_retry(self, fn, max_retries: int = _MAX_API_RETRIES):
-        """Retry a sync API call on transient errors with exponential backoff."""
-        for attempt in range(max_retries + 1):
-            try:
-                return fn()
-            except _TRANSIENT_OPENAI_ERRORS as e:
-                if attempt == max_retries:
-                    raise
-                wait = (2**attempt) + random.random()
-                logger.warning(
-                    f"[OpenAI] Transient error (attempt {attempt + 1}/{max_retries + 1}): "
-                    f"{type(e).__name__}: {e}. Retrying in {wait:.1f}s"
-                )
-                time.sleep(wait)
-
-    async def _with_retry_async(self, fn, max_retries: int = _MAX_API_RETRIES):
-        """Retry an async API call on transient errors with exponential backoff."""
-        import asyncio
-
-        for attempt in range(max_retries + 1):
-            try:
-                return await fn()
-            except _TRANSIENT_OPENAI_ERRORS as e:
-                if attempt == max_retries:
-                    raise
-                wait = (2**attempt) + random.random()
-                logger.warning(
-                    f"[OpenAI] Transient error (attempt {attempt + 1}/{max_retries + 1}): "
-                    f"{type(e).__name__}: {e}. Retrying in {wait:.1f}s"
-                )
-                await asyncio.sleep(wait)
-
     @property
     def default_simple_model(self) -> str:
         return "gpt-5-mini"
@@ -204,19 +283,36 @@ class OpenAIProvider(LLMProvider):
     def default_research_model(self) -> str:
         return "gpt-5"
 
+    def _http_limits(self) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=self._max_connections,
+            max_keepalive_connections=self._max_keepalive_connections,
+        )
+
     def _get_client(self) -> OpenAI:
-        if self._is_azure:
-            from openai import AzureOpenAI
+        # SDK-level retries are disabled: transient errors are retried by
+        # _with_retry, and stacking both multiplies attempts per call.
+        if self._cached_sync_client is None:
+            http_client = openai.DefaultHttpxClient(limits=self._http_limits())
+            if self._is_azure:
+                from openai import AzureOpenAI
 
-            return AzureOpenAI(
-                api_key=self._api_key,
-                azure_endpoint=self._azure_endpoint,
-                api_version=self._api_version,
-            )
-        return OpenAI(api_key=self._api_key)
+                self._cached_sync_client = AzureOpenAI(
+                    api_key=self._api_key,
+                    azure_endpoint=self._azure_endpoint,
+                    api_version=self._api_version,
+                    max_retries=0,
+                    http_client=http_client,
+                )
+            else:
+                self._cached_sync_client = OpenAI(
+                    api_key=self._api_key, max_retries=0, http_client=http_client
+                )
+        return self._cached_sync_client
 
     def _get_async_client(self) -> AsyncOpenAI:
         if self._cached_async_client is None:
+            http_client = openai.DefaultAsyncHttpxClient(limits=self._http_limits())
             if self._is_azure:
                 from openai import AsyncAzureOpenAI
 
@@ -224,9 +320,13 @@ class OpenAIProvider(LLMProvider):
                     api_key=self._api_key,
                     azure_endpoint=self._azure_endpoint,
                     api_version=self._api_version,
+                    max_retries=0,
+                    http_client=http_client,
                 )
             else:
-                self._cached_async_client = AsyncOpenAI(api_key=self._api_key)
+                self._cached_async_client = AsyncOpenAI(
+                    api_key=self._api_key, max_retries=0, http_client=http_client
+                )
         return self._cached_async_client
 
     def simple_call(
@@ -239,6 +339,15 @@ class OpenAIProvider(LLMProvider):
         max_tokens: int | None = None,
     ) -> dict:
         model = self._resolve_model(model, self.default_simple_model)
+        cache_key, cached = self._cache_lookup(
+            model=model,
+            prompt=prompt,
+            schema_name=schema_name,
+            schema=response_schema,
+            max_tokens=max_tokens,
+        )
+        if cached is not None:
+            return cached
         client = self._get_client()
 
         # Acquire rate limit capacity before making the call
@@ -276,7 +385,7 @@ class OpenAIProvider(LLMProvider):
             raw_text = self._extract_chat_completions_text(response)
         else:
             raw_text = self._extract_output_text(response)
-        structured_data = json.loads(raw_text) if raw_text else None
+        structured_data = _loads(raw_text) if raw_text else None
 
         if log:
             log_request_response(
@@ -286,6 +395,9 @@ class OpenAIProvider(LLMProvider):
                 provider="openai",
             )
 
+        if cache_key is not None and structured_data:
+            self._cache.set(cache_key, structured_data)
+
         return structured_data or {}
 
     async def simple_call_async(
@@ -297,6 +409,15 @@ class OpenAIProvider(LLMProvider):
         max_tokens: int | None = None,
     ) -> tuple[dict, TokenUsage]:
         model = self._resolve_model(model, self.default_simple_model)
+        cache_key, cached = self._cache_lookup(
+            model=model,
+            prompt=prompt,
+            schema_name=schema_name,
+            schema=response_schema,
+            max_tokens=max_tokens,
+        )
+        if cached is not None:
+            return cached, TokenUsage()
         client = self._get_async_client()
 
         use_chat = self._api_format == "chat_completions"
@@ -324,7 +445,7 @@ class OpenAIProvider(LLMProvider):
             raw_text = self._extract_chat_completions_text(response)
         else:
             raw_text = self._extract_output_text(response)
-        structured_data = json.loads(raw_text) if raw_text else None
+        structured_data = _loads(raw_text) if raw_text else None
 
         # Extract token usage
         usage = TokenUsage()
@@ -340,8 +461,133 @@ class OpenAIProvider(LLMProvider):
                     output_tokens=getattr(response.usage, "output_tokens", 0) or 0,
                 )
 
+        if cache_key is not None and structured_data:
+            self._cache.set(cache_key, structured_data)
+
         return structured_data or {}, usage
 
+    def batch_simple_call(
+        self,
+        prompts: list[tuple[str, dict]],
+        *,
+        schema_name: str = "response",
+        model: str | None = None,
+        max_tokens: int | None = None,
+        poll_interval: float = 30.0,
+        timeout: float | None = None,
+    ) -> list[dict]:
+        """Run many simple_call requests as one OpenAI Batch API job.
+
+        Batch jobs cost about half as much as individual requests but may
+        take up to the 24h completion window, so use this only for offline
+        workloads where latency does not matter.
+
+        Args:
+            prompts: (prompt, response_schema) pairs.
+            schema_name: Schema name shared by all requests.
+            model: Model override (defaults to the simple model).
+            max_tokens: Max output tokens per request.
+            poll_interval: Seconds between job status checks.
+            timeout: Give up (and cancel the job) after this many seconds.
+
+        Returns:
+            Structured results in input order; ``{}`` for any request that
+            failed or produced no output.
+
+        Raises:
+            RuntimeError: If the job fails, expires, is cancelled or times out.
+        """
+        if not prompts:
+            return []
+
+        model = self._resolve_model(model, self.default_simple_model)
+        client = self._get_client()
+        use_chat = self._api_format == "chat_completions"
+        if use_chat:
+            endpoint = "/v1/chat/completions"
+            build_params = self._build_chat_completions_params
+        else:
+            endpoint = "/v1/responses"
+            build_params = self._build_responses_params
+
+        lines = [
+            json.dumps(
+                {
+                    "custom_id": str(i),
+                    "method": "POST",
+                    "url": endpoint,
+                    "body": build_params(
+                        model, prompt, schema, schema_name, max_tokens
+                    ),
+                }
+            )
+            for i, (prompt, schema) in enumerate(prompts)
+        ]
+        input_file = self._with_retry(
+            lambda: client.files.create(
+                file=("batch_input.jsonl", "\n".join(lines).encode("utf-8")),
+                purpose="batch",
+            )
+        )
+        batch = self._with_retry(
+            lambda: client.batches.create(
+                input_file_id=input_file.id,
+                endpoint=endpoint,
+                completion_window="24h",
+            )
+        )
+        logger.info(
+            f"[LLM] batch_simple_call submitted {len(prompts)} requests - batch={batch.id}"
+        )
+
+        deadline = None if timeout is None else time.time() + timeout
+        while batch.status not in _BATCH_TERMINAL_STATES:
+            remaining = None if deadline is None else deadline - time.time()
+            if remaining is not None and remaining <= 0:
+                self._cancel_batch(client, batch.id)
+                raise RuntimeError(
+                    f"Batch {batch.id} did not finish within {timeout:.0f}s"
+                )
+            # Never sleep past the deadline
+            time.sleep(
+                poll_interval if remaining is None else min(poll_interval, remaining)
+            )
+            batch = self._with_retry(lambda: client.batches.retrieve(batch.id))
+
+        if batch.status != "completed":
+            raise RuntimeError(f"Batch {batch.id} ended with status '{batch.status}'")
+
+        results: list[dict] = [{} for _ in prompts]
+        if not batch.output_file_id:
+            return results
+
+        output = self._with_retry(lambda: client.files.content(batch.output_file_id))
+        for line in output.text.splitlines():
+            if not line.strip():
+                continue
+            # A malformed line only costs its own slot, never the whole
+            # (already paid for) batch; its slot stays {} like a missing body
+            try:
+                entry = _loads(line)
+                body = (entry.get("response") or {}).get("body") or {}
+                raw_text = _extract_batch_body_text(body, use_chat)
+                if raw_text:
+                    results[int(entry["custom_id"])] = _loads(raw_text)
+            except (ValueError, TypeError, KeyError, IndexError, AttributeError) as e:
+                logger.warning(
+                    f"[LLM] batch {batch.id}: skipping unreadable result line "
+                    f"({type(e).__name__}: {e}): {line[:200]}"
+                )
+
+        return results
+
+    def _cancel_batch(self, client, batch_id: str) -> None:
+        """Best-effort cancel of a batch job that is being abandoned."""
+        try:
+            self._with_retry(lambda: client.batches.cancel(batch_id))
+        except Exception as e:
+            logger.warning(f"[LLM] Failed to cancel batch {batch_id}: {e}")
+
     def reasoning_call(
         self,
         prompt: str,
@@ -356,34 +602,49 @@ class OpenAIProvider(LLMProvider):
         on_retry: RetryCallback | None = None,
     ) -> dict:
         model = self._resolve_model(model, self.default_reasoning_model)
-        client = self._get_client()
 
         effective_prompt = prompt
         if previous_errors:
-            effective_prompt = f"{previous_errors}\n\n---\n\n{prompt}"
+            effective_prompt = _prepend_errors(previous_errors, prompt)
+
+        cache_key, cached = self._cache_lookup(
+            model=model,
+            prompt=effective_prompt,
+            schema_name=schema_name,
+            schema=response_schema,
+            reasoning_effort=reasoning_effort,
+        )
+        # A cached result may come from a caller with a different (or no)
+        # validator, so it is only served if it passes this one
+        if cached is not None and (validator is None or validator(cached)[0]):
+            return cached
+        client = self._get_client()
+
+        # Static request fields are built once and shared by every attempt
+        base_params = {
+            "model": model,
+            "reasoning": {"effort": reasoning_effort},
+            "text": {
+                "format": {
+                    "type": "json_schema",
+                    "name": schema_name,
+                    "strict": True,
+                    "schema": response_schema,
+                }
+            },
+        }
 
         def _call(ep: str) -> dict:
             # Acquire rate limit capacity before each API call
             self._acquire_rate_limit(ep, model, max_output=16384)
 
-            request_params = {
-                "model": model,
-                "reasoning": {"effort": reasoning_effort},
-                "input": [{"role": "user", "content": ep}],
-                "text": {
-                    "format": {
-                        "type": "json_schema",
-                        "name": schema_name,
-                        "strict": True,
-                        "schema": response_schema,
-                    }
-                },
-            }
+            # Shallow copy: the logger keeps a reference to each attempt's params
+            request_params = {**base_params, "input": [{"role": "user", "content": ep}]}
             response = self._with_retry(
                 lambda: client.responses.create(**request_params)
             )
             raw_text = self._extract_output_text(response)
-            structured_data = json.loads(raw_text) if raw_text else None
+            structured_data = _loads(raw_text) if raw_text else None
             if log:
                 log_request_response(
                     function_name="reasoning_call",
@@ -393,7 +654,7 @@ class OpenAIProvider(LLMProvider):
                 )
             return structured_data or {}
 
-        return self._retry_with_validation(
+        result, passed = self._retry_with_validation_status(
             call_fn=_call,
             prompt=prompt,
             validator=validator,
@@ -403,6 +664,13 @@ class OpenAIProvider(LLMProvider):
             initial_prompt=effective_prompt if previous_errors else None,
         )
 
+        # Only cache results that passed validation, so a bad answer is
+        # never replayed for the same request
+        if cache_key is not None and result and passed:
+            self._cache.set(cache_key, result)
+
+        return result
+
     def agentic_research(
         self,
         prompt: str,
@@ -421,64 +689,43 @@ class OpenAIProvider(LLMProvider):
 
         effective_prompt = prompt
         if previous_errors:
-            effective_prompt = f"{previous_errors}\n\n---\n\n{prompt}"
+            effective_prompt = _prepend_errors(previous_errors, prompt)
 
-        all_sources: list[str] = []
+        # Insertion-ordered set of source URLs across all attempts
+        all_sources: dict[str, None] = {}
+
+        # Static request fields are built once and shared by every attempt
+        base_params = {
+            "model": model,
+            "tools": [{"type": "web_search"}],
+            "reasoning": {"effort": reasoning_effort},
+            "text": {
+                "format": {
+                    "type": "json_schema",
+                    "name": schema_name,
+                    "strict": True,
+                    "schema": response_schema,
+                }
+            },
+            "include": ["web_search_call.action.sources"],
+        }
 
         def _call(ep: str) -> dict:
             # Acquire rate limit capacity before each API call
             self._acquire_rate_limit(ep, model, max_output=16384)
 
-            request_params = {
-                "model": model,
-                "input": ep,
-                "tools": [{"type": "web_search"}],
-                "reasoning": {"effort": reasoning_effort},
-                "text": {
-                    "format": {
-                        "type": "json_schema",
-                        "name": schema_name,
-                        "strict": True,
-                        "schema": response_schema,
-                    }
-                },
-                "include": ["web_search_call.action.sources"],
-            }
+            # Shallow copy: the logger keeps a reference to each attempt's params
+            request_params = {**base_params, "input": ep}
 
             response = self._with_retry(
                 lambda: client.responses.create(**request_params)
             )
 
-            raw_text = self._extract_output_text(response)
-            structured_data = json.loads(raw_text) if raw_text else None
-            sources: list[str] = []
-
-            for item in response.output:
-                if hasattr(item, "type") and item.type == "web_search_call":
-                    if hasattr(item, "action") and item.action:
-                        if hasattr(item.action, "sources") and item.action.sources:
-                            for source in item.action.sources:
-                                if isinstance(source, dict):
-                                    if "url" in source:
-                                        sources.append(source["url"])
-                                elif hasattr(source, "url"):
-                                    sources.append(source.url)
-
-                if hasattr(item, "type") and item.type == "message":
-                    for content_item in item.content:
-                        if (
-                            hasattr(content_item, "annotations")
-                            and content_item.annotations
-                        ):
-                            for annotation in content_item.annotations:
-                                if (
-                                    hasattr(annotation, "type")
-                                    and annotation.type == "url_citation"
-                                ):
-                                    if hasattr(annotation, "url"):
-                                        sources.append(annotation.url)
-
-            all_sources.extend(sources)
+            raw_text, urls = _extract_text_and_sources(response, with_sources=True)
+            structured_data = _loads(raw_text) if raw_text else None
+
+            sources = dict.fromkeys(urls)
+            all_sources.update(sources)
 
             if log:
                 log_request_response(
@@ -486,7 +733,7 @@ class OpenAIProvider(LLMProvider):
                     request=request_params,
                     response=response,
                     provider="openai",
-                    sources=list(set(sources)),
+                    sources=list(sources),
                 )
 
             return structured_data or {}
@@ -501,4 +748,4 @@ class OpenAIProvider(LLMProvider):
             initial_prompt=effective_prompt if previous_errors else None,
         )
 
-        return result, list(set(all_sources))
+        return result, list(all_sources)
@@ -23,6 +23,7 @@ Usage:
 
 import asyncio
 import logging
+import threading
 import time
 from dataclasses import dataclass, field
 
@@ -36,13 +37,18 @@ class TokenBucket:
     """Token bucket for rate limiting.
 
     Tokens refill continuously at `refill_rate` per second,
-    up to `capacity`. Each acquire() consumes tokens.
+    up to `capacity`. Each acquire() consumes tokens. Refill, acquire and
+    release are serialized by a lock, so one bucket can be shared across
+    threads.
     """
 
     capacity: float
     refill_rate: float  # tokens per second
     tokens: float = field(init=False)
     last_refill: float = field(init=False)
+    _lock: threading.Lock = field(
+        init=False, repr=False, compare=False, default_factory=threading.Lock
+    )
 
     def __post_init__(self):
         self.tokens = self.capacity
@@ -61,20 +67,32 @@ class TokenBucket:
         Returns:
             0.0 if acquired, or positive float = seconds to wait
         """
-        self._refill()
-        if self.tokens >= amount:
-            self.tokens -= amount
-            return 0.0
-        # Calculate wait time
-        deficit = amount - self.tokens
+        with self._lock:
+            self._refill()
+            if self.tokens >= amount:
+                self.tokens -= amount
+                return 0.0
+            # Calculate wait time
+            deficit = amount - self.tokens
         return deficit / self.refill_rate if self.refill_rate > 0 else 60.0
 
+    def release(self, amount: float) -> None:
+        """Return tokens taken by an acquire that was abandoned (capped to capacity)."""
+        with self._lock:
+            self.tokens = min(self.capacity, self.tokens + amount)
+
+    def drain(self) -> None:
+        """Empty the bucket, forcing callers to wait for a refill."""
+        with self._lock:
+            self.tokens = 0
+
     def update_capacity(self, new_capacity: float) -> None:
         """Update bucket capacity (e.g., from response headers)."""
-        self._refill()
-        self.capacity = new_capacity
-        self.refill_rate = new_capacity / 60.0  # per-minute limits
-        self.tokens = min(self.tokens, new_capacity)
+        with self._lock:
+            self._refill()
+            self.capacity = new_capacity
+            self.refill_rate = new_capacity / 60.0  # per-minute limits
+            self.tokens = min(self.tokens, new_capacity)
 
 
 class RateLimiter:
@@ -141,6 +159,9 @@ class RateLimiter:
             self.itpm_bucket = None
             self.otpm_bucket = None
 
+        # Serializes multi-bucket acquires across threads
+        self._lock = threading.Lock()
+
         # Track stats
         self.total_acquired = 0
         self.total_wait_time = 0.0
@@ -179,42 +200,22 @@ class RateLimiter:
 
         return max(1, int(min(rpm_concurrent, tpm_concurrent)))
 
-    async def acquire(
+    def _try_acquire_all(
         self,
-        estimated_input_tokens: int = 600,
-        estimated_output_tokens: int = 200,
+        estimated_input_tokens: int,
+        estimated_output_tokens: int,
+        total_wait: float,
     ) -> float:
-        """Wait until we have capacity, then consume.
+        """Take capacity from every bucket at once, or from none of them.
 
-        Args:
-            estimated_input_tokens: Estimated input tokens for the request
-            estimated_output_tokens: Estimated output tokens for the request
+        Runs under the limiter's lock so concurrent callers (threads sharing
+        a provider) cannot interleave between the check and the release.
 
         Returns:
-            Actual wait time in seconds (0 if no wait needed)
+            0.0 if acquired, or positive float = seconds to wait
         """
-        total_wait = 0.0
-
-        # Cap estimates to bucket capacity to avoid infinite loops
-        # (can't acquire more than capacity, so just use capacity as upper bound)
-        if self._has_split_tokens:
-            estimated_input_tokens = min(
-                estimated_input_tokens, int(self.itpm_bucket.capacity * 0.9)
-            )
-            estimated_output_tokens = min(
-                estimated_output_tokens, int(self.otpm_bucket.capacity * 0.9)
-            )
-        else:
-            max_total = int(self.tpm_bucket.capacity * 0.9)
-            if estimated_input_tokens + estimated_output_tokens > max_total:
-                # Scale down proportionally
-                ratio = max_total / (estimated_input_tokens + estimated_output_tokens)
-                estimated_input_tokens = int(estimated_input_tokens * ratio)
-                estimated_output_tokens = int(estimated_output_tokens * ratio)
-
         estimated_total = estimated_input_tokens + estimated_output_tokens
-
-        while True:
+        with self._lock:
             # Check RPM bucket
             rpm_wait = self.rpm_bucket.try_acquire(1.0)
 
@@ -226,23 +227,15 @@ class RateLimiter:
                 if rpm_wait == 0.0 and itpm_wait == 0.0 and otpm_wait == 0.0:
                     self.total_acquired += 1
                     self.total_wait_time += total_wait
-                    return total_wait
+                    return 0.0
 
                 # Release what was acquired (capped to capacity)
                 if rpm_wait == 0.0:
-                    self.rpm_bucket.tokens = min(
-                        self.rpm_bucket.capacity, self.rpm_bucket.tokens + 1.0
-                    )
+                    self.rpm_bucket.release(1.0)
                 if itpm_wait == 0.0:
-                    self.itpm_bucket.tokens = min(
-                        self.itpm_bucket.capacity,
-                        self.itpm_bucket.tokens + float(estimated_input_tokens),
-                    )
+                    self.itpm_bucket.release(float(estimated_input_tokens))
                 if otpm_wait == 0.0:
-                    self.otpm_bucket.tokens = min(
-                        self.otpm_bucket.capacity,
-                        self.otpm_bucket.tokens + float(estimated_output_tokens),
-                    )
+                    self.otpm_bucket.release(float(estimated_output_tokens))
 
                 wait_time = max(rpm_wait, itpm_wait, otpm_wait)
             else:
@@ -252,21 +245,58 @@ class RateLimiter:
                 if rpm_wait == 0.0 and tpm_wait == 0.0:
                     self.total_acquired += 1
                     self.total_wait_time += total_wait
-                    return total_wait
+                    return 0.0
 
                 # Release what was acquired (capped to capacity)
                 if rpm_wait == 0.0:
-                    self.rpm_bucket.tokens = min(
-                        self.rpm_bucket.capacity, self.rpm_bucket.tokens + 1.0
-                    )
+                    self.rpm_bucket.release(1.0)
                 if tpm_wait == 0.0:
-                    self.tpm_bucket.tokens = min(
-                        self.tpm_bucket.capacity,
-                        self.tpm_bucket.tokens + float(estimated_total),
-                    )
+                    self.tpm_bucket.release(float(estimated_total))
 
                 wait_time = max(rpm_wait, tpm_wait)
 
+        return wait_time
+
+    async def acquire(
+        self,
+        estimated_input_tokens: int = 600,
+        estimated_output_tokens: int = 200,
+    ) -> float:
+        """Wait until we have capacity, then consume.
+
+        Args:
+            estimated_input_tokens: Estimated input tokens for the request
+            estimated_output_tokens: Estimated output tokens for the request
+
+        Returns:
+            Actual wait time in seconds (0 if no wait needed)
+        """
+        total_wait = 0.0
+
+        # Cap estimates to bucket capacity to avoid infinite loops
+        # (can't acquire more than capacity, so just use capacity as upper bound)
+        if self._has_split_tokens:
+            estimated_input_tokens = min(
+                estimated_input_tokens, int(self.itpm_bucket.capacity * 0.9)
+            )
+            estimated_output_tokens = min(
+                estimated_output_tokens, int(self.otpm_bucket.capacity * 0.9)
+            )
+        else:
+            max_total = int(self.tpm_bucket.capacity * 0.9)
+            if estimated_input_tokens + estimated_output_tokens > max_total:
+                # Scale down proportionally
+                ratio = max_total / (estimated_input_tokens + estimated_output_tokens)
+                estimated_input_tokens = int(estimated_input_tokens * ratio)
+                estimated_output_tokens = int(estimated_output_tokens * ratio)
+
+        while True:
+            wait_time = self._try_acquire_all(
+                estimated_input_tokens, estimated_output_tokens, total_wait
+            )
+            if wait_time == 0.0:
+                return total_wait
+
             # Cap single wait to 30 seconds to stay responsive
             wait_time = min(wait_time, 30.0)
             total_wait += wait_time
@@ -314,60 +344,12 @@ class RateLimiter:
                 estimated_input_tokens = int(estimated_input_tokens * ratio)
                 estimated_output_tokens = int(estimated_output_tokens * ratio)
 
-        estimated_total = estimated_input_tokens + estimated_output_tokens
-
         while True:
-            # Check RPM bucket
-            rpm_wait = self.rpm_bucket.try_acquire(1.0)
-
-            if self._has_split_tokens:
-                # Anthropic: check both input and output token buckets
-                itpm_wait = self.itpm_bucket.try_acquire(float(estimated_input_tokens))
-                otpm_wait = self.otpm_bucket.try_acquire(float(estimated_output_tokens))
-
-                if rpm_wait == 0.0 and itpm_wait == 0.0 and otpm_wait == 0.0:
-                    self.total_acquired += 1
-                    self.total_wait_time += total_wait
-                    return total_wait
-
-                # Release what was acquired (capped to capacity)
-                if rpm_wait == 0.0:
-                    self.rpm_bucket.tokens = min(
-                        self.rpm_bucket.capacity, self.rpm_bucket.tokens + 1.0
-                    )
-                if itpm_wait == 0.0:
-                    self.itpm_bucket.tokens = min(
-                        self.itpm_bucket.capacity,
-                        self.itpm_bucket.tokens + float(estimated_input_tokens),
-                    )
-                if otpm_wait == 0.0:
-                    self.otpm_bucket.tokens = min(
-                        self.otpm_bucket.capacity,
-                        self.otpm_bucket.tokens + float(estimated_output_tokens),
-                    )
-
-                wait_time = max(rpm_wait, itpm_wait, otpm_wait)
-            else:
-                # OpenAI: check combined token bucket
-                tpm_wait = self.tpm_bucket.try_acquire(float(estimated_total))
-
-                if rpm_wait == 0.0 and tpm_wait == 0.0:
-                    self.total_acquired += 1
-                    self.total_wait_time += total_wait
-                    return total_wait
-
-                # Release what was acquired (capped to capacity)
-                if rpm_wait == 0.0:
-                    self.rpm_bucket.tokens = min(
-                        self.rpm_bucket.capacity, self.rpm_bucket.tokens + 1.0
-                    )
-                if tpm_wait == 0.0:
-                    self.tpm_bucket.tokens = min(
-                        self.tpm_bucket.capacity,
-                        self.tpm_bucket.tokens + float(estimated_total),
-                    )
-
-                wait_time = max(rpm_wait, tpm_wait)
+            wait_time = self._try_acquire_all(
+                estimated_input_tokens, estimated_output_tokens, total_wait
+            )
+            if wait_time == 0.0:
+                return total_wait
 
             # Cap single wait to 30 seconds to stay responsive
             wait_time = min(wait_time, 30.0)
@@ -412,13 +394,14 @@ class RateLimiter:
                 wait = float(retry_after)
                 logger.warning(f"[RATE_LIMIT] Server requested retry-after={wait}s")
                 # Drain all buckets to force waiting
-                self.rpm_bucket.tokens = 0
-                if self.tpm_bucket:
-                    self.tpm_bucket.tokens = 0
-                if self.itpm_bucket:
-                    self.itpm_bucket.tokens = 0
-                if self.otpm_bucket:
-                    self.otpm_bucket.tokens = 0
+                with self._lock:
+                    self.rpm_bucket.drain()
+                    if self.tpm_bucket:
+                        self.tpm_bucket.drain()
+                    if self.itpm_bucket:
+                        self.itpm_bucket.drain()
+                    if self.otpm_bucket:
+                        self.otpm_bucket.drain()
             except ValueError:
                 pass
 
@@ -13,6 +13,7 @@ from typing import Any
 from ...core.models import Edge, NetworkResult
 from ...utils.callbacks import NetworkProgressCallback
 from ...utils.eval_safe import ConditionError, eval_condition
+from ...utils.seeding import derive_seed
 from .config import NetworkConfig, InfluenceFactorConfig
 from .similarity import (
     compute_similarity,
@@ -810,7 +811,7 @@ def generate_network(
 
         # Generate with current parameters
         # Use a derived seed for reproducibility within calibration
-        iter_rng = random.Random(seed + iteration * 1000)
+        iter_rng = random.Random(derive_seed(seed, "calibration", iteration))
 
         edges, avg_degree, clustering, modularity = _generate_network_single_pass(
             agents,
@@ -8,7 +8,7 @@ from datetime import datetime
 from enum import Enum
 
 import yaml
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 
 class TreatmentType(str, Enum):
@@ -121,6 +121,10 @@ class AttributePhrasing(BaseModel):
     relative: list[RelativePhrasing] = Field(default_factory=list)
     concrete: list[ConcretePhrasing] = Field(default_factory=list)
 
+    # (lists, their lengths, attribute -> phrasing) from the last build. The
+    # lists are held, not just their ids, so a freed id can never be reused.
+    _index: tuple[tuple, tuple, dict] | None = PrivateAttr(default=None)
+
     def get_phrasing(
         self, attr_name: str
     ) -> (
@@ -130,20 +134,28 @@ class AttributePhrasing(BaseModel):
         | ConcretePhrasing
         | None
     ):
-        """Get phrasing for a specific attribute."""
-        for p in self.boolean:
-            if p.attribute == attr_name:
-                return p
-        for p in self.categorical:
-            if p.attribute == attr_name:
-                return p
-        for p in self.relative:
-            if p.attribute == attr_name:
-                return p
-        for p in self.concrete:
-            if p.attribute == attr_name:
-                return p
-        return None
+        """Get phrasing for a specific attribute.
+
+        Lookups go through an index so rendering a whole population does not
+        rescan every phrasing list per attribute. The index is rebuilt
+        whenever a list is reassigned or grows/shrinks; replacing an item in
+        place at the same position is not detected.
+        """
+        lists = (self.boolean, self.categorical, self.relative, self.concrete)
+        lengths = tuple(len(items) for items in lists)
+        cached = self._index
+        if (
+            cached is None
+            or cached[1] != lengths
+            or any(a is not b for a, b in zip(cached[0], lists))
+        ):
+            index = {}
+            for items in lists:
+                for p in items:
+                    # First match wins, in boolean/categorical/relative/concrete order
+                    index.setdefault(p.attribute, p)
+            cached = self._index = (lists, lengths, index)
+        return cached[2].get(attr_name)
 
 
 class PopulationStats(BaseModel):
@@ -9,8 +9,13 @@ Pipeline:
     Step 3: generate_categorical_phrasings() - First-person phrases for categoricals
     Step 4: generate_relative_phrasings() - Z-score bucket phrases for psychological traits
     Step 5: generate_concrete_phrasings() - Templates for numeric values
+
+Steps 2-5 depend only on the spec and Step 1's treatments, so
+generate_persona_config() runs their LLM calls concurrently.
 """
 
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 from ...core.llm import reasoning_call
@@ -756,6 +761,7 @@ def generate_persona_config(
     agents: list[dict[str, Any]] | None = None,
     log: bool = True,
     on_progress: ProgressCallback | None = None,
+    max_concurrency: int = 4,
 ) -> PersonaConfig:
     """Generate persona configuration for a population.
 
@@ -766,11 +772,17 @@ def generate_persona_config(
     - Step 4: Generate relative phrasings
     - Step 5: Generate concrete phrasings
 
+    Steps 2-5 run concurrently once Step 1 has finished.
+
     Args:
         spec: Population specification with attributes
         agents: Optional sampled agents for computing population stats
         log: Whether to log LLM calls
-        on_progress: Optional callback (step, status) for progress updates
+        on_progress: Optional callback (step, status) for progress updates.
+            Steps 2-5 call it from worker threads. Calls are serialized, so
+            it never runs concurrently with itself, but it must not assume
+            it runs on the caller's thread.
+        max_concurrency: Max phrasing steps in flight at once (1 = sequential)
 
     Returns:
         PersonaConfig ready for rendering
@@ -779,24 +791,33 @@ def generate_persona_config(
         PersonaConfigError: If generation fails
     """
 
+    progress_lock = threading.Lock()
+
     def report(step: str, status: str):
         if on_progress:
-            on_progress(step, status)
-
-    # Step 1: Structure
-    treatments, groups, intro = generate_structure(spec, on_progress)
+            with progress_lock:
+                on_progress(step, status)
 
-    # Step 2: Boolean phrasings
-    boolean_phrasings = generate_boolean_phrasings(spec, on_progress)
+    progress = report if on_progress else None
 
-    # Step 3: Categorical phrasings
-    categorical_phrasings = generate_categorical_phrasings(spec, on_progress)
-
-    # Step 4: Relative phrasings
-    relative_phrasings = generate_relative_phrasings(spec, treatments, on_progress)
+    # Step 1: Structure
+    treatments, groups, intro = generate_structure(spec, progress)
+
+    # Steps 2-5: Phrasings (independent of each other, so overlap the calls)
+    with ThreadPoolExecutor(max_workers=max(1, max_concurrency)) as pool:
+        boolean_future = pool.submit(generate_boolean_phrasings, spec, progress)
+        categorical_future = pool.submit(generate_categorical_phrasings, spec, progress)
+        relative_future = pool.submit(
+            generate_relative_phrasings, spec, treatments, progress
+        )
+        concrete_future = pool.submit(
+            generate_concrete_phrasings, spec, treatments, progress
+        )
 
-    # Step 5: Concrete phrasings
-    concrete_phrasings = generate_concrete_phrasings(spec, treatments, on_progress)
+        boolean_phrasings = boolean_future.result()
+        categorical_phrasings = categorical_future.result()
+        relative_phrasings = relative_future.result()
+        concrete_phrasings = concrete_future.result()
 
     # Combine all phrasings
     phrasings = AttributePhrasing(
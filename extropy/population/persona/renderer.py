@@ -5,8 +5,10 @@ Pure computation — no LLM calls.
 """
 
 import re
+from functools import lru_cache
 from typing import Any
 
+from ...utils.templates import template_fields
 from .config import (
     PersonaConfig,
     BooleanPhrasing,
@@ -16,18 +18,24 @@ from .config import (
 )
 
 
+@lru_cache(maxsize=4096)
 def _normalize_value(value: str) -> str:
     """Normalize categorical option values for comparison."""
     return value.strip().lower().replace("-", "_").replace(" ", "_")
 
 
+@lru_cache(maxsize=1024)
+def _raw_token_pattern(option: str) -> re.Pattern[str]:
+    """Compiled word-boundary pattern for a raw categorical option token."""
+    normalized_option = option.lower().replace("_", " ")
+    # Word-boundary match avoids false positives inside other words.
+    return re.compile(r"\b" + re.escape(normalized_option) + r"\b")
+
+
 def _contains_raw_option_token(phrase: str, option: str) -> bool:
     """Detect whether phrase contains the raw categorical token text."""
     normalized_phrase = phrase.lower().replace("_", " ")
-    normalized_option = option.lower().replace("_", " ")
-    # Word-boundary match avoids false positives inside other words.
-    pattern = r"\b" + re.escape(normalized_option) + r"\b"
-    return re.search(pattern, normalized_phrase) is not None
+    return _raw_token_pattern(option).search(normalized_phrase) is not None
 
 
 def _format_time(decimal_hours: float, use_12hr: bool = True) -> str:
@@ -146,7 +154,7 @@ def _format_categorical_value(value: Any, phrasing: CategoricalPhrasing) -> str:
 
     str_value = str(value)
     normalized_value = _normalize_value(str_value)
-    null_option_norms = {_normalize_value(o) for o in phrasing.null_options}
+    null_option_norms = frozenset(map(_normalize_value, phrasing.null_options))
 
     selected_key = None
     selected_phrase = None
@@ -253,45 +261,49 @@ def render_persona_section(
     return "\n\n".join(lines)
 
 
+# Time-related attribute name patterns
+_TIME_ATTRS = ("start_time", "departure_time", "arrival_time", "end_time")
+
+
+def _format_intro_value(key: str, value: Any) -> str:
+    """Format one attribute value for the narrative intro."""
+    if value is None:
+        return "unknown"
+    if isinstance(value, bool):
+        return "yes" if value else "no"
+    if isinstance(value, (int, float)):
+        # Check if this looks like a time attribute
+        is_time = any(t in key.lower() for t in _TIME_ATTRS)
+        if is_time and 0 <= float(value) <= 24:
+            return _format_time(float(value), use_12hr=True)
+        if isinstance(value, float) and value == int(value):
+            return f"{int(value):,}" if value >= 1000 else str(int(value))
+        if isinstance(value, float):
+            # Round to 1 decimal for most floats, 2 for small values
+            if value >= 100:
+                return f"{value:,.0f}"
+            if value >= 1:
+                return f"{value:.1f}"
+            return f"{value:.2f}"
+        return f"{value:,}" if value >= 1000 else str(value)
+    if isinstance(value, str):
+        # Make categorical values readable
+        return value.replace("_", " ")
+    return str(value)
+
+
 def render_intro(agent: dict[str, Any], config: PersonaConfig) -> str:
-    """Render the narrative intro section."""
-    # Time-related attribute name patterns
-    time_attrs = {"start_time", "departure_time", "arrival_time", "end_time"}
+    """Render the narrative intro section.
 
+    Only the attributes the intro template references are formatted.
+    """
+    template = config.intro_template
     try:
-        # Format values for template
-        formatted = {}
-        for key, value in agent.items():
-            if value is None:
-                formatted[key] = "unknown"
-            elif isinstance(value, bool):
-                formatted[key] = "yes" if value else "no"
-            elif isinstance(value, (int, float)):
-                # Check if this looks like a time attribute
-                is_time = any(t in key.lower() for t in time_attrs)
-                if is_time and 0 <= float(value) <= 24:
-                    formatted[key] = _format_time(float(value), use_12hr=True)
-                elif isinstance(value, float) and value == int(value):
-                    formatted[key] = (
-                        f"{int(value):,}" if value >= 1000 else str(int(value))
-                    )
-                elif isinstance(value, float):
-                    # Round to 1 decimal for most floats, 2 for small values
-                    if value >= 100:
-                        formatted[key] = f"{value:,.0f}"
-                    elif value >= 1:
-                        formatted[key] = f"{value:.1f}"
-                    else:
-                        formatted[key] = f"{value:.2f}"
-                else:
-                    formatted[key] = f"{value:,}" if value >= 1000 else str(value)
-            elif isinstance(value, str):
-                # Make categorical values readable
-                formatted[key] = value.replace("_", " ")
-            else:
-                formatted[key] = str(value)
-
-        intro = config.intro_template.format(**formatted)
+        fields = template_fields(template)
+        keys = agent.keys() if fields is None else [k for k in fields if k in agent]
+        formatted = {key: _format_intro_value(key, agent[key]) for key in keys}
+
+        intro = template.format_map(formatted)
         return f"## Who I Am\n\n{intro}"
     except (KeyError, ValueError) as e:
         return f"## Who I Am\n\n[Error rendering intro: {e}]"
@@ -32,7 +32,11 @@ from ...utils.eval_safe import (
     FormulaError,
     ConditionError,
 )
-from .distributions import sample_distribution, coerce_to_type
+from .distributions import (
+    sample_distribution,
+    sample_distribution_batch,
+    coerce_to_type,
+)
 from .modifiers import apply_modifiers_and_sample
 
 __all__ = [
@@ -52,6 +56,7 @@ __all__ = [
     "ConditionError",
     # Lower-level functions (for testing/extension)
     "sample_distribution",
+    "sample_distribution_batch",
     "coerce_to_type",
     "apply_modifiers_and_sample",
 ]
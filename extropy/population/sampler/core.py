@@ -8,10 +8,13 @@ import json
 import logging
 import random
 import sqlite3
+from collections import ChainMap
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+import numpy as np
+
 from ...core.models import (
     PopulationSpec,
     AttributeSpec,
@@ -19,9 +22,15 @@ from ...core.models import (
     SamplingResult,
 )
 from ...utils.callbacks import ItemProgressCallback
-from .distributions import sample_distribution, coerce_to_type
+from .distributions import (
+    coerce_to_type,
+    is_static_distribution,
+    sample_distribution,
+    sample_distribution_batch,
+)
 from .modifiers import apply_modifiers_and_sample
 from ...utils.eval_safe import eval_formula, FormulaError
+from ...utils.seeding import make_rng
 
 logger = logging.getLogger(__name__)
 
@@ -89,11 +98,17 @@ def sample_population(
         attr.name: [] for attr in spec.attributes if attr.type in ("int", "float")
     }
 
+    # Attributes that need no agent context are drawn for all agents up front,
+    # from their own stream derived from the seed
+    presampled = _presample_static_attributes(
+        spec, attr_map, make_rng(seed, "sampler-batch"), n
+    )
+
     agents: list[dict[str, Any]] = []
 
     for i in range(n):
         agent = _sample_single_agent(
-            spec, attr_map, rng, i, id_width, stats, numeric_values
+            spec, attr_map, rng, i, id_width, stats, numeric_values, presampled
         )
         agents.append(agent)
 
@@ -117,6 +132,38 @@ def sample_population(
     return SamplingResult(agents=agents, meta=meta, stats=stats)
 
 
+def _presample_static_attributes(
+    spec: PopulationSpec,
+    attr_map: dict[str, AttributeSpec],
+    rng: np.random.Generator,
+    n: int,
+) -> dict[str, list[Any]]:
+    """Draw every agent's value for attributes that need no agent context.
+
+    Covers independent attributes, and conditional ones without modifiers,
+    whose distribution has no formula parameters. Each is sampled with a
+    single vectorized draw instead of one RNG call per agent.
+    """
+    presampled: dict[str, list[Any]] = {}
+    if n <= 0:
+        return presampled
+
+    for attr_name in spec.sampling_order:
+        attr = attr_map.get(attr_name)
+        if attr is None:
+            continue
+        sampling = attr.sampling
+        if sampling.strategy == "derived" or sampling.distribution is None:
+            continue
+        if sampling.strategy == "conditional" and sampling.modifiers:
+            continue
+        if not is_static_distribution(sampling.distribution):
+            continue
+        presampled[attr_name] = sample_distribution_batch(sampling.distribution, rng, n)
+
+    return presampled
+
+
 def _sample_single_agent(
     spec: PopulationSpec,
     attr_map: dict[str, AttributeSpec],
@@ -125,8 +172,13 @@ def _sample_single_agent(
     id_width: int,
     stats: SamplingStats,
     numeric_values: dict[str, list[float]],
+    presampled: dict[str, list[Any]] | None = None,
 ) -> dict[str, Any]:
-    """Sample a single agent following the sampling order."""
+    """Sample a single agent following the sampling order.
+
+    Values for attributes in presampled are taken from there instead of
+    being drawn from rng.
+    """
     agent: dict[str, Any] = {"_id": f"agent_{index:0{id_width}d}"}
 
     for attr_name in spec.sampling_order:
@@ -136,7 +188,10 @@ def _sample_single_agent(
             continue
 
         try:
-            value = _sample_attribute(attr, rng, agent, stats)
+            if presampled and attr_name in presampled:
+                value = presampled[attr_name][index]
+            else:
+                value = _sample_attribute(attr, rng, agent, stats)
         except FormulaError as e:
             raise SamplingError(
                 f"Agent {index}: Failed to sample '{attr_name}': {e}"
@@ -253,13 +308,9 @@ def _finalize_stats(
     for name, values in numeric_values.items():
         if not values:
             continue
-        mean = sum(values) / len(values)
-        stats.attribute_means[name] = mean
-        if len(values) > 1:
-            variance = sum((v - mean) ** 2 for v in values) / (len(values) - 1)
-            stats.attribute_stds[name] = variance**0.5
-        else:
-            stats.attribute_stds[name] = 0.0
+        arr = np.asarray(values, dtype=float)
+        stats.attribute_means[name] = float(arr.mean())
+        stats.attribute_stds[name] = float(arr.std(ddof=1)) if len(arr) > 1 else 0.0
 
 
 def _check_expression_constraints(
@@ -282,10 +333,13 @@ def _check_expression_constraints(
             if constraint.type == "expression" and constraint.expression:
                 violation_count = 0
                 for agent in agents:
-                    # Add 'value' to context for constraints that reference it
-                    context = dict(agent)
-                    if attr.name in agent:
-                        context["value"] = agent[attr.name]
+                    # Add 'value' to context for constraints that reference it,
+                    # layered over the agent rather than copying it
+                    context = (
+                        ChainMap({"value": agent[attr.name]}, agent)
+                        if attr.name in agent
+                        else agent
+                    )
 
                     try:
                         if not eval_condition(constraint.expression, context):
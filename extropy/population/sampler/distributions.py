@@ -9,10 +9,13 @@ Handles sampling from all 6 distribution types:
 - boolean: Bernoulli trial with probability_true
 """
 
+import math
 import random
 import re
 from typing import Any
 
+import numpy as np
+
 from ...core.models import (
     NormalDistribution,
     LognormalDistribution,
@@ -61,6 +64,128 @@ def sample_distribution(
         raise ValueError(f"Unknown distribution type: {type(dist)}")
 
 
+# Distribution fields that make a parameter depend on the agent being sampled
+_FORMULA_FIELDS = ("mean_formula", "std_formula", "min_formula", "max_formula")
+
+
+def is_static_distribution(dist: Distribution) -> bool:
+    """Whether a distribution can be sampled without any agent context."""
+    return all(getattr(dist, field, None) is None for field in _FORMULA_FIELDS)
+
+
+def sample_distribution_batch(
+    dist: Distribution,
+    rng: np.random.Generator,
+    size: int,
+) -> list[Any]:
+    """
+    Draw ``size`` values from a static distribution in one vectorized call.
+
+    Produces the same distributions (and bounds handling) as
+    sample_distribution(), for distributions where is_static_distribution()
+    is true.
+
+    Args:
+        dist: Distribution configuration without formula parameters
+        rng: NumPy generator (seeded for reproducibility)
+        size: Number of values to draw
+
+    Returns:
+        List of Python values (float, str, or bool depending on type)
+
+    Raises:
+        ValueError: If the distribution parameters are unusable
+    """
+    if isinstance(dist, NormalDistribution):
+        std = dist.std if dist.std is not None else 1.0
+        values = rng.normal(dist.mean, std, size)
+        return _clamp(values, dist.min, dist.max).tolist()
+    elif isinstance(dist, LognormalDistribution):
+        mu, sigma = _lognormal_log_params(dist.mean, dist.std)
+        values = rng.lognormal(mu, sigma, size)
+        return _clamp(values, dist.min, dist.max).tolist()
+    elif isinstance(dist, UniformDistribution):
+        return rng.uniform(dist.min, dist.max, size).tolist()
+    elif isinstance(dist, BetaDistribution):
+        values = rng.beta(dist.alpha, dist.beta, size)
+        return _scale_beta(values, dist.min, dist.max).tolist()
+    elif isinstance(dist, CategoricalDistribution):
+        p = np.asarray(_checked_weights(dist.weights), dtype=float)
+        indices = rng.choice(len(dist.options), size=size, p=p / p.sum())
+        return [dist.options[i] for i in indices]
+    elif isinstance(dist, BooleanDistribution):
+        return (rng.random(size) < dist.probability_true).tolist()
+    else:
+        raise ValueError(f"Unknown distribution type: {type(dist)}")
+
+
+# Parameter handling below is shared by the scalar and batch samplers so the
+# two paths cannot drift apart; each helper accepts a float or a NumPy array.
+
+
+def _clamp(values: Any, min_bound: float | None, max_bound: float | None) -> Any:
+    """Clamp a value (or array of values) to optional lower/upper bounds."""
+    is_array = isinstance(values, np.ndarray)
+    if min_bound is not None:
+        values = np.maximum(values, min_bound) if is_array else max(values, min_bound)
+    if max_bound is not None:
+        values = np.minimum(values, max_bound) if is_array else min(values, max_bound)
+    return values
+
+
+def _scale_beta(values: Any, min_bound: float | None, max_bound: float | None) -> Any:
+    """Scale beta draws into [min, max] when both bounds are set, else clamp."""
+    if min_bound is not None and max_bound is not None:
+        return min_bound + values * (max_bound - min_bound)
+    return _clamp(values, min_bound, max_bound)
+
+
+def _lognormal_log_params(mean: float, std: float | None) -> tuple[float, float]:
+    """Convert a lognormal's actual mean/std into log-space (mu, sigma).
+
+    A missing std defaults to half the mean.
+
+    Raises:
+        ValueError: If mean is not positive
+    """
+    if mean <= 0:
+        raise ValueError(
+            f"Lognormal distribution requires mean > 0, got {mean}. "
+            "Check the distribution parameters or formula."
+        )
+    if std is None:
+        std = mean * 0.5
+
+    # mu = log(mean^2 / sqrt(mean^2 + std^2))
+    # sigma = sqrt(log(1 + std^2/mean^2))
+    variance = std**2
+    mean_sq = mean**2
+    mu = math.log(mean_sq / math.sqrt(mean_sq + variance))
+    sigma = math.sqrt(math.log(1 + variance / mean_sq))
+    return mu, sigma
+
+
+def _checked_weights(weights: list[float] | None) -> list[float]:
+    """Reject categorical weights neither sampler can draw from.
+
+    random.choices and numpy's choice fail differently (or not at all) on
+    negative, non-finite or all-zero weights, so both paths check here first.
+
+    Raises:
+        ValueError: If weights are empty, negative, non-finite or sum to <= 0
+    """
+    if (
+        not weights
+        or any(not math.isfinite(w) or w < 0 for w in weights)
+        or sum(weights) <= 0
+    ):
+        raise ValueError(
+            f"Categorical weights must be finite, non-negative and sum to > 0, "
+            f"got {weights}. Modifiers may have zeroed all options."
+        )
+    return weights
+
+
 def _resolve_param(
     static_value: float | None,
     formula: str | None,
@@ -141,13 +266,7 @@ def _sample_normal(
         dist.max, getattr(dist, "max_formula", None), agent
     )
 
-    # Apply clamping
-    if min_bound is not None:
-        value = max(value, min_bound)
-    if max_bound is not None:
-        value = min(value, max_bound)
-
-    return value
+    return _clamp(value, min_bound, max_bound)
 
 
 def _sample_lognormal(
@@ -159,35 +278,19 @@ def _sample_lognormal(
 
     Note: The spec provides mean and std as the actual lognormal distribution
     parameters, but Python's lognormvariate expects log-space (mu, sigma).
-    We convert using the standard formulas.
+    We convert using the standard formulas (see _lognormal_log_params).
 
     Supports both static and formula-based bounds:
     - min/max: Static bounds (always applied)
     - min_formula/max_formula: Dynamic bounds evaluated with agent context
     """
-    import math
-
     mean = _resolve_param(dist.mean, dist.mean_formula, agent, "mean")
     std = (
         _resolve_param(dist.std, dist.std_formula, agent, "std")
         if (dist.std is not None or dist.std_formula is not None)
-        else mean * 0.5
+        else None
     )
-
-    # Lognormal requires mean > 0
-    if mean <= 0:
-        raise ValueError(
-            f"Lognormal distribution requires mean > 0, got {mean}. "
-            "Check the distribution parameters or formula."
-        )
-
-    # Convert from actual mean/std to log-space mu/sigma
-    # mu = log(mean^2 / sqrt(mean^2 + std^2))
-    # sigma = sqrt(log(1 + std^2/mean^2))
-    variance = std**2
-    mean_sq = mean**2
-    mu = math.log(mean_sq / math.sqrt(mean_sq + variance))
-    sigma = math.sqrt(math.log(1 + variance / mean_sq))
+    mu, sigma = _lognormal_log_params(mean, std)
 
     value = rng.lognormvariate(mu, sigma)
 
@@ -199,13 +302,7 @@ def _sample_lognormal(
         dist.max, getattr(dist, "max_formula", None), agent
     )
 
-    # Apply clamping
-    if min_bound is not None:
-        value = max(value, min_bound)
-    if max_bound is not None:
-        value = min(value, max_bound)
-
-    return value
+    return _clamp(value, min_bound, max_bound)
 
 
 def _sample_uniform(dist: UniformDistribution, rng: random.Random) -> float:
@@ -236,17 +333,8 @@ def _sample_beta(
         dist.max, getattr(dist, "max_formula", None), agent
     )
 
-    # Scale if both min and max bounds are provided
-    if min_bound is not None and max_bound is not None:
-        value = min_bound + value * (max_bound - min_bound)
-    elif min_bound is not None:
-        # Only min bound - clamp lower
-        value = max(value, min_bound)
-    elif max_bound is not None:
-        # Only max bound - clamp upper
-        value = min(value, max_bound)
-
-    return value
+    # Scale if both min and max bounds are provided, otherwise clamp
+    return _scale_beta(value, min_bound, max_bound)
 
 
 def _sample_categorical(
@@ -265,14 +353,7 @@ def _sample_categorical(
     Returns:
         Selected option string
     """
-    use_weights = weights if weights is not None else dist.weights
-
-    # Validate weights are usable (rng.choices crashes if sum <= 0 or any negative)
-    if not use_weights or sum(use_weights) <= 0:
-        raise ValueError(
-            f"Categorical weights must sum to > 0, got {use_weights}. "
-            "Modifiers may have zeroed all options."
-        )
+    use_weights = _checked_weights(weights if weights is not None else dist.weights)
 
     return rng.choices(dist.options, weights=use_weights, k=1)[0]
 
@@ -8,48 +8,74 @@ Module structure:
 - structural.py: Categories 1-9 (ERROR checks - blocks sampling)
 - semantic.py: Categories 10-12 (WARNING checks - sampling proceeds)
 - llm_response.py: Fail-fast validation for LLM outputs
+
+Exports are loaded lazily (PEP 562) so importing one validator does not
+import the others.
 """
 
-from ...core.models.validation import (
-    Severity,
-    ValidationIssue,
-    ValidationResult,
-)
-
-# Spec validation
-from .spec import validate_spec
-
-# LLM response validation
-from .llm_response import (
-    is_spec_level_constraint,
-    extract_bound_from_constraint,
-    validate_formula_syntax,
-    validate_condition_syntax,
-    validate_distribution_data,
-    validate_modifier_data,
-    validate_independent_response,
-    validate_derived_response,
-    validate_conditional_base_response,
-    validate_modifiers_response,
-)
-
-__all__ = [
-    # Core validation types
-    "Severity",
-    "ValidationIssue",
-    "ValidationResult",
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from ...core.models.validation import (
+        Severity as Severity,
+        ValidationIssue as ValidationIssue,
+        ValidationResult as ValidationResult,
+    )
+
     # Spec validation
-    "validate_spec",
+    from .spec import validate_spec as validate_spec
+
     # LLM response validation
-    "validate_formula_syntax",
-    "validate_condition_syntax",
-    "validate_distribution_data",
-    "validate_modifier_data",
-    "validate_independent_response",
-    "validate_derived_response",
-    "validate_conditional_base_response",
-    "validate_modifiers_response",
-    # Utility functions
-    "is_spec_level_constraint",
-    "extract_bound_from_constraint",
-]
+    from .llm_response import (
+        is_spec_level_constraint as is_spec_level_constraint,
+        extract_bound_from_constraint as extract_bound_from_constraint,
+        validate_formula_syntax as validate_formula_syntax,
+        validate_condition_syntax as validate_condition_syntax,
+        validate_distribution_data as validate_distribution_data,
+        validate_modifier_data as validate_modifier_data,
+        validate_independent_response as validate_independent_response,
+        validate_derived_response as validate_derived_response,
+        validate_conditional_base_response as validate_conditional_base_response,
+        validate_modifiers_response as validate_modifiers_response,
+    )
+
+# Defining module -> public names it provides (loaded on first access).
+# This table is the single source for __all__ and for lazy lookup.
+_LAZY_IMPORTS: dict[str, tuple[str, ...]] = {
+    # Core validation types
+    "...core.models.validation": ("Severity", "ValidationIssue", "ValidationResult"),
+    # Spec validation
+    ".spec": ("validate_spec",),
+    # LLM response validation and utility functions
+    ".llm_response": (
+        "validate_formula_syntax",
+        "validate_condition_syntax",
+        "validate_distribution_data",
+        "validate_modifier_data",
+        "validate_independent_response",
+        "validate_derived_response",
+        "validate_conditional_base_response",
+        "validate_modifiers_response",
+        "is_spec_level_constraint",
+        "extract_bound_from_constraint",
+    ),
+}
+_NAME_TO_MODULE = {
+    name: module for module, names in _LAZY_IMPORTS.items() for name in names
+}
+
+__all__ = list(_NAME_TO_MODULE)
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _NAME_TO_MODULE.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(__all__)
@@ -57,16 +57,24 @@ def _determine_simulation_config(population_size: int) -> SimulationConfig:
     )
 
 
-def _load_network_summary(network_path: Path) -> dict | None:
-    """Load network summary for exposure generation."""
+def _load_network(network_path: Path) -> dict | None:
+    """Load the network JSON, or None if it is missing or unreadable."""
     if not network_path.exists():
         return None
 
     try:
         with open(network_path) as f:
-            network = json.load(f)
+            return json.load(f)
+    except (json.JSONDecodeError, OSError):
+        return None
+
+
+def _summarize_network(network: dict | None) -> dict | None:
+    """Extract the network summary used for exposure generation."""
+    if network is None:
+        return None
 
-        # Extract summary information
+    try:
         edge_types = set()
         node_count = 0
 
@@ -85,7 +93,7 @@ def _load_network_summary(network_path: Path) -> dict | None:
             "node_count": node_count,
             "edge_types": list(edge_types),
         }
-    except (json.JSONDecodeError, KeyError, TypeError):
+    except (KeyError, TypeError):
         return None
 
 
@@ -156,8 +164,10 @@ def create_scenario(
 
     population_spec = PopulationSpec.from_yaml(population_spec_path)
 
-    # Load network summary for exposure generation
-    network_summary = _load_network_summary(network_path)
+    # Load the network once; its summary feeds exposure generation and the
+    # full network is reused for validation
+    network = _load_network(network_path)
+    network_summary = _summarize_network(network)
 
     # =========================================================================
     # Step 1: Parse scenario description
@@ -244,15 +254,7 @@ def create_scenario(
     # We use get_agent_count() to do this safely/robustly.
     agent_count = get_agent_count(agents_path)
 
-    # Load network for validation (needed for edge type reference validation)
-    network = None
-    if network_path.exists():
-        try:
-            with open(network_path) as f:
-                network = json.load(f)
-        except (json.JSONDecodeError, OSError):
-            pass
-
+    # The network loaded above is needed for edge type reference validation
     validation_result = validate_scenario(spec, population_spec, agent_count, network)
 
     # =========================================================================
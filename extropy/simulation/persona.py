@@ -8,9 +8,11 @@ This ensures the LLM sees everything while maintaining readability.
 """
 
 import re
-from typing import Any
+from functools import lru_cache
+from typing import Any, Callable
 
 from ..core.models import PopulationSpec, AttributeSpec
+from ..utils.templates import parse_template, template_fields
 
 
 def is_narrative_safe(attr: AttributeSpec) -> bool:
@@ -199,13 +201,50 @@ def build_characteristics_list(
     return "\n\n".join(sections)
 
 
+@lru_cache(maxsize=128)
+def compile_persona_template(template: str) -> Callable[[dict[str, Any]], str]:
+    """Parse a persona template once into a reusable render function.
+
+    The returned function renders exactly like ``template.format(**agent)``,
+    but the template is only parsed on the first call for a given string.
+    Templates using conversions, attribute/index access or nested format
+    specs fall back to plain ``str.format``.
+    """
+    parsed = parse_template(template)
+
+    if parsed is None or any(
+        field is not None and (conversion or "{" in spec or not field.isidentifier())
+        for _, field, spec, conversion in parsed
+    ):
+        return lambda agent: template.format_map(agent)
+
+    pieces = [(literal, field, spec) for literal, field, spec, _ in parsed]
+
+    def render(agent: dict[str, Any]) -> str:
+        out = []
+        for literal, field, spec in pieces:
+            out.append(literal)
+            if field is not None:
+                out.append(format(agent[field], spec))
+        return "".join(out)
+
+    return render
+
+
 def render_persona(agent: dict[str, Any], template: str) -> str:
     """Render persona string from template and agent attributes.
 
-    Uses Python's str.format() for simple {attribute} placeholder substitution.
+    Uses str.format()-style {attribute} placeholder substitution, with the
+    parsed template cached by compile_persona_template().
     """
+    fields = template_fields(template)
+    if fields is not None:
+        missing = next((field for field in fields if field not in agent), None)
+        if missing is not None:
+            return f"[Template error: missing {missing!r}]"
+
     try:
-        return template.format(**agent)
+        return compile_persona_template(template)(agent)
     except KeyError as e:
         # Missing attribute - return template with missing placeholder noted
         return f"[Template error: missing {e}]"
@@ -359,23 +398,28 @@ def _get_intro_attrs(spec: PopulationSpec) -> set[str]:
     return intro_attrs & spec_attrs
 
 
+# (attribute, label) pairs used by _fallback_persona, in priority order
+_FALLBACK_FIELDS = tuple(
+    (key, key.replace("_", " "))
+    for key in ("role", "occupation", "specialty", "employer_type", "years_experience")
+)
+
+
 def _fallback_persona(agent: dict[str, Any]) -> str:
     """Generate a basic fallback persona when no spec is available."""
-    parts = []
-
     age = agent.get("age")
     gender = agent.get("gender", "person")
 
     if age:
-        parts.append(f"You are a {int(age)}-year-old {gender}.")
+        intro = f"You are a {int(age)}-year-old {gender}."
     else:
-        parts.append(f"You are a {gender}.")
+        intro = f"You are a {gender}."
 
-    # Add a few key attributes
-    for key in ("role", "occupation", "specialty", "employer_type", "years_experience"):
-        if key in agent and agent[key]:
-            parts.append(f"Your {key.replace('_', ' ')} is {agent[key]}.")
-            if len(parts) >= 4:
-                break
+    # Add up to three key attributes
+    details = [
+        f"Your {label} is {agent[key]}."
+        for key, label in _FALLBACK_FIELDS
+        if agent.get(key)
+    ][:3]
 
-    return " ".join(parts)
+    return " ".join([intro, *details])
@@ -40,6 +40,11 @@ def _soft_saturate_probability(raw_probability: float) -> float:
     return 1.0 - (1.0 - _SOFT_SATURATION_MAX) * (1.0 - math.exp(-overflow))
 
 
+def _is_always_true(condition: str) -> bool:
+    """Whether a rule condition is the trivial always-true form."""
+    return condition.lower() == "true" or condition == "1"
+
+
 def evaluate_exposure_rule(
     rule: ExposureRule,
     agent: dict[str, Any],
@@ -60,7 +65,7 @@ def evaluate_exposure_rule(
         return False
 
     # Evaluate condition
-    if rule.when.lower() == "true" or rule.when == "1":
+    if _is_always_true(rule.when):
         return True
 
     try:
@@ -117,24 +122,25 @@ def apply_seed_exposures(
         channel_credibility = get_channel_credibility(scenario, rule.channel)
         event_credibility = scenario.event.credibility
 
-        for i, agent in enumerate(agents):
-            agent_id = agent.get("_id", str(i))
+        # Neither the trivial-condition check nor the record depends on the agent
+        always_applies = _is_always_true(rule.when)
+        exposure = ExposureRecord(
+            timestep=timestep,
+            channel=rule.channel,
+            source_agent_id=None,
+            content=scenario.event.content,
+            credibility=min(1.0, event_credibility * channel_credibility),
+        )
 
-            if not evaluate_exposure_rule(rule, agent, timestep):
+        for i, agent in enumerate(agents):
+            if not always_applies and not evaluate_exposure_rule(rule, agent, timestep):
                 continue
 
             # Probabilistic exposure
             if rng.random() > rule.probability:
                 continue
 
-            exposure = ExposureRecord(
-                timestep=timestep,
-                channel=rule.channel,
-                source_agent_id=None,
-                content=scenario.event.content,
-                credibility=min(1.0, event_credibility * channel_credibility),
-            )
-
+            agent_id = agent.get("_id", str(i))
             state_manager.record_exposure(agent_id, exposure)
             state_manager.log_event(
                 SimulationEvent(
@@ -199,13 +205,14 @@ def calculate_share_probability(
     base_prob = spread_config.share_probability
 
     # Apply modifiers
+    if spread_config.share_modifiers:
+        # Context with both agent and edge attributes, shared by all modifiers
+        context = dict(agent)
+        context["edge_type"] = edge_data.get("type", "unknown")
+        context["edge_weight"] = edge_data.get("weight", 0.5)
+
     for modifier in spread_config.share_modifiers:
         try:
-            # Create context with both agent and edge attributes
-            context = dict(agent)
-            context["edge_type"] = edge_data.get("type", "unknown")
-            context["edge_weight"] = edge_data.get("weight", 0.5)
-
             if eval_condition(modifier.when, context, raise_on_error=True):
                 base_prob = base_prob * modifier.multiply + modifier.add
         except ConditionError:
@@ -284,17 +291,36 @@ def propagate_through_network(
                 sharer_id, neighbor_ids, sharer_public_position
             )
         )
+        if not eligible_ids:
+            continue
+
+        # Every exposure from this sharer is identical (decay depends only on
+        # the hop), so build the record once rather than per edge
+        decay_factor = (
+            (1.0 - scenario.spread.decay_per_hop) ** next_hop
+            if scenario.spread.decay_per_hop > 0
+            else 1.0
+        )
+        exposure = ExposureRecord(
+            timestep=timestep,
+            channel="network",
+            source_agent_id=sharer_id,
+            content=scenario.event.content,
+            credibility=max(0.05, min(1.0, 0.85 * decay_factor)),
+        )
 
-        # Build lookup for edge data
-        neighbor_edge_map = {nid: edge for nid, edge in neighbors}
+        # Walk neighbors in network order so a given seed always draws the
+        # same random numbers for the same edges. Duplicate edges collapse
+        # to one attempt per neighbor, keyed on the last edge's data.
+        edge_by_neighbor = {nid: edge for nid, edge in neighbors}
+        for neighbor_id, edge_data in edge_by_neighbor.items():
+            if neighbor_id not in eligible_ids:
+                continue
 
-        for neighbor_id in eligible_ids:
             neighbor_agent = agent_map.get(neighbor_id)
             if not neighbor_agent:
                 continue
 
-            edge_data = neighbor_edge_map[neighbor_id]
-
             # Calculate share probability for this edge
             prob = calculate_share_probability(
                 sharer_agent,
@@ -314,19 +340,6 @@ def propagate_through_network(
                 continue
 
             # Record exposure (even if already aware - for multi-touch)
-            decay_factor = (
-                (1.0 - scenario.spread.decay_per_hop) ** next_hop
-                if scenario.spread.decay_per_hop > 0
-                else 1.0
-            )
-            exposure = ExposureRecord(
-                timestep=timestep,
-                channel="network",
-                source_agent_id=sharer_id,
-                content=scenario.event.content,
-                credibility=max(0.05, min(1.0, 0.85 * decay_factor)),
-            )
-
             state_manager.record_exposure(neighbor_id, exposure)
             state_manager.log_event(
                 SimulationEvent(
@@ -9,6 +9,8 @@ Modules:
 - expressions: AST parsing and syntax validation
 - distributions: Distribution parameter validation
 - eval_safe: Safe expression evaluation
+- seeding: Independent random streams derived from one seed
+- templates: Cached str.format template parsing
 """
 
 from .graphs import topological_sort, CircularDependencyError
@@ -29,6 +31,7 @@ from .distributions import (
     validate_options_not_empty,
 )
 from .eval_safe import (
+    compile_expression,
     eval_safe,
     eval_formula,
     eval_condition,
@@ -36,6 +39,8 @@ from .eval_safe import (
     ConditionError,
     SAFE_BUILTINS,
 )
+from .seeding import derive_seed, make_rng
+from .templates import parse_template, template_fields
 from .paths import (
     resolve_relative_to,
     make_relative_to,
@@ -60,12 +65,19 @@ __all__ = [
     "validate_beta_params",
     "validate_options_not_empty",
     # Eval
+    "compile_expression",
     "eval_safe",
     "eval_formula",
     "eval_condition",
     "FormulaError",
     "ConditionError",
     "SAFE_BUILTINS",
+    # Seeding
+    "derive_seed",
+    "make_rng",
+    # Templates
+    "parse_template",
+    "template_fields",
     # Paths
     "resolve_relative_to",
     "make_relative_to",
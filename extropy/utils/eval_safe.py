@@ -6,7 +6,8 @@ preventing attribute access, imports, and other dangerous operations.
 
 import ast
 import operator
-from typing import Any
+from functools import lru_cache
+from typing import Any, Callable
 
 # Safe builtins allowed in formula/condition evaluation
 SAFE_BUILTINS = {
@@ -183,6 +184,22 @@ def _eval_ast(node: ast.AST, context: dict[str, Any]) -> Any:
     raise FormulaError(f"Unsupported expression element: {type(node).__name__}")
 
 
+@lru_cache(maxsize=1024)
+def compile_expression(expression: str) -> Callable[[dict[str, Any]], Any]:
+    """
+    Parse an expression once into a reusable evaluator.
+
+    Formulas and conditions come from a spec and are evaluated for every
+    agent (or edge), so the parse is cached per expression string. The
+    returned function applies the same restrictions as eval_safe().
+
+    Raises:
+        SyntaxError: If the expression cannot be parsed
+    """
+    tree = ast.parse(expression, mode="eval")
+    return lambda context: _eval_ast(tree, context)
+
+
 def eval_safe(expression: str, context: dict[str, Any]) -> Any:
     """
     Safely evaluate a Python expression with restricted builtins.
@@ -203,12 +220,8 @@ def eval_safe(expression: str, context: dict[str, Any]) -> Any:
         >>> eval_safe("role == 'chief'", {"role": "resident"})
         False
     """
-    # Merge context into local namespace
-    local_vars = dict(context)
-
     try:
-        tree = ast.parse(expression, mode="eval")
-        return _eval_ast(tree, local_vars)
+        return compile_expression(expression)(context)
     except Exception as e:
         raise FormulaError(f"Failed to evaluate '{expression}': {e}") from e
 
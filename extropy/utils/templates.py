@@ -0,0 +1,59 @@
+"""str.format template parsing shared by the persona renderers.
+
+Persona templates are rendered once per agent, so their parse is cached
+per template string and every consumer (field checks, compiled renderers)
+works from the same parsed pieces.
+"""
+
+import re
+import string
+from functools import lru_cache
+
+# Top-level name of a str.format field ("a" for "a.b" or "a[0]")
+_FIELD_ROOT_RE = re.compile(r"[^.\[]*")
+
+TemplatePiece = tuple[str, str | None, str | None, str | None]
+
+
+@lru_cache(maxsize=256)
+def parse_template(template: str) -> tuple[TemplatePiece, ...] | None:
+    """
+    Parse a str.format template into (literal, field, spec, conversion) pieces.
+
+    Args:
+        template: A str.format-style template
+
+    Returns:
+        The pieces as yielded by ``string.Formatter().parse``, or None if the
+        template cannot be parsed
+    """
+    try:
+        return tuple(string.Formatter().parse(template))
+    except ValueError:
+        return None
+
+
+@lru_cache(maxsize=256)
+def template_fields(template: str) -> tuple[str, ...] | None:
+    """
+    Names a template references, in order of first use.
+
+    Only the top-level name of each field is kept ("a" for "{a.b}"), and
+    positional fields ("{}", "{0}") are skipped.
+
+    Returns:
+        The field names, or None if the template cannot be parsed
+
+    Example:
+        >>> template_fields("{age}-year-old {city.name}, aged {age}")
+        ('age', 'city')
+    """
+    pieces = parse_template(template)
+    if pieces is None:
+        return None
+    roots = (
+        _FIELD_ROOT_RE.match(field).group()
+        for _, field, _, _ in pieces
+        if field is not None
+    )
+    return tuple(dict.fromkeys(root for root in roots if root.isidentifier()))
@@ -1,4 +1,10 @@
-"""Shared fixtures and configuration for Extropy tests."""
+"""Shared fixtures and configuration for Extropy tests.
+
+Test data whose validity is not under test may be built with
+``Model.model_construct(...)`` to skip Pydantic validation. Use the normal
+constructor wherever the object feeds a validator under test or relies
+on validators to normalize its fields.
+"""
 
 import random
 from datetime import datetime
@@ -161,9 +167,13 @@ def conditional_attribute_spec() -> AttributeSpec:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def minimal_population_spec() -> PopulationSpec:
-    """A minimal valid population spec for testing."""
+    """A minimal valid population spec for testing.
+
+    Built once per session and shared; treat it as read-only and request
+    minimal_population_spec_mut to modify a copy.
+    """
     return PopulationSpec(
         meta=SpecMeta(
             description="Test population",
@@ -225,8 +235,17 @@ def minimal_population_spec() -> PopulationSpec:
 
 
 @pytest.fixture
+def minimal_population_spec_mut(minimal_population_spec) -> PopulationSpec:
+    """A private deep copy of minimal_population_spec for tests that mutate it."""
+    return minimal_population_spec.model_copy(deep=True)
+
+
+@pytest.fixture(scope="session")
 def complex_population_spec() -> PopulationSpec:
-    """A more complex population spec with derived and conditional attributes."""
+    """A more complex population spec with derived and conditional attributes.
+
+    Built once per session and shared; treat it as read-only.
+    """
     return PopulationSpec(
         meta=SpecMeta(
             description="Complex test population",
@@ -340,7 +359,7 @@ def complex_population_spec() -> PopulationSpec:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def ten_agents() -> list[dict]:
     """Ten agents with varied attributes for propagation/integration tests."""
     roles = ["junior", "mid", "senior"]
@@ -349,7 +368,7 @@ def ten_agents() -> list[dict]:
     ]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def linear_network() -> dict:
     """Chain network: a0-a1-a2-...-a9."""
     return {
@@ -362,7 +381,7 @@ def linear_network() -> dict:
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def star_network() -> dict:
     """Star network: a0 is hub, a1-a9 are spokes."""
     return {
@@ -375,7 +394,7 @@ def star_network() -> dict:
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_agents() -> list[dict]:
     """Sample agent data for network tests."""
     return [
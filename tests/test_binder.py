@@ -16,19 +16,26 @@ def _grounding() -> GroundingInfo:
     return GroundingInfo(level="low", method="estimated")
 
 
+# Built once; bind_constraints only reads context attrs, so copies can
+# share the nested sampling/grounding models
+_CONTEXT_TEMPLATE = AttributeSpec(
+    name="context",
+    type="float",
+    category="universal",
+    description="Context attr",
+    sampling=SamplingConfig(
+        strategy="independent",
+        distribution=NormalDistribution(mean=0.0, std=1.0),
+        depends_on=[],
+    ),
+    grounding=_grounding(),
+    constraints=[],
+)
+
+
 def _context_attr(name: str) -> AttributeSpec:
-    return AttributeSpec(
-        name=name,
-        type="float",
-        category="universal",
-        description=f"Context attr {name}",
-        sampling=SamplingConfig(
-            strategy="independent",
-            distribution=NormalDistribution(mean=0.0, std=1.0),
-            depends_on=[],
-        ),
-        grounding=_grounding(),
-        constraints=[],
+    return _CONTEXT_TEMPLATE.model_copy(
+        update={"name": name, "description": f"Context attr {name}"}
     )
 
 
@@ -2,47 +2,49 @@
 
 from pathlib import Path
 
+import pytest
 from typer.testing import CliRunner
 
 from extropy.cli.app import app
 from extropy.cli.commands.validate import _is_scenario_file
 
-runner = CliRunner()
+
+@pytest.fixture(scope="module")
+def runner() -> CliRunner:
+    """One CliRunner shared by every CLI test in this module."""
+    return CliRunner()
 
 
 class TestConfigCommand:
     """Tests for the config command."""
 
-    def test_config_show(self):
+    def test_config_show(self, runner):
         result = runner.invoke(app, ["config", "show"])
         assert result.exit_code == 0
         assert "Pipeline" in result.output
         assert "Simulation" in result.output
 
-    def test_config_set_invalid_key(self):
-        result = runner.invoke(app, ["config", "set", "invalid.key", "value"])
-        assert result.exit_code == 1
-        assert "Unknown key" in result.output
-
-    def test_config_set_invalid_int_value(self):
-        result = runner.invoke(app, ["config", "set", "simulation.rate_tier", "abc"])
-        assert result.exit_code == 1
-        assert "Invalid integer" in result.output
-
-    def test_config_set_missing_args(self):
-        result = runner.invoke(app, ["config", "set"])
-        assert result.exit_code == 1
-
-    def test_config_unknown_action(self):
-        result = runner.invoke(app, ["config", "unknown_action"])
+    @pytest.mark.parametrize(
+        "args, expected_text",
+        [
+            (["config", "set", "invalid.key", "value"], "Unknown key"),
+            (["config", "set", "simulation.rate_tier", "abc"], "Invalid integer"),
+            (["config", "set"], None),
+            (["config", "unknown_action"], "Unknown action"),
+        ],
+        ids=["invalid_key", "invalid_int_value", "missing_args", "unknown_action"],
+    )
+    def test_config_error(self, runner, args, expected_text):
+        result = runner.invoke(app, args)
         assert result.exit_code == 1
-        assert "Unknown action" in result.output
+        if expected_text is not None:
+            assert expected_text in result.output
 
 
 class TestValidateCommand:
     """Tests for the validate command."""
 
-    def test_validate_nonexistent_file(self):
+    def test_validate_nonexistent_file(self, runner):
         result = runner.invoke(app, ["validate", "/nonexistent/path.yaml"])
         assert result.exit_code != 0
 
@@ -55,7 +57,7 @@ class TestValidateCommand:
 class TestVersionFlag:
     """Test the --version flag."""
 
-    def test_version_output(self):
+    def test_version_output(self, runner):
         result = runner.invoke(app, ["--version"])
         assert result.exit_code == 0
         assert "extropy" in result.output
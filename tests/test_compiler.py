@@ -4,20 +4,77 @@ Tests the 5-step compilation pipeline and auto-configuration logic.
 """
 
 import json
-from unittest.mock import patch
+from types import SimpleNamespace
+from unittest.mock import MagicMock
 
 import pytest
 
 from extropy.core.models.scenario import (
+    Event,
     EventType,
+    ExposureChannel,
+    ExposureRule,
+    InteractionConfig,
+    InteractionType,
+    OutcomeConfig,
+    OutcomeDefinition,
+    OutcomeType,
+    SeedExposure,
+    SpreadConfig,
     TimestepUnit,
 )
+from extropy.scenario import compiler
 from extropy.scenario.compiler import (
     _generate_scenario_name,
     _determine_simulation_config,
     create_scenario,
 )
 
+# Canned results for the mocked LLM-backed compiler steps. create_scenario
+# only reads these, so every test shares the same instances.
+_EVENT = Event(
+    type=EventType.PRODUCT_LAUNCH,
+    content="New product launching.",
+    source="Test Corp",
+    credibility=0.9,
+    ambiguity=0.2,
+    emotional_valence=0.3,
+)
+
+_SEED_EXPOSURE = SeedExposure(
+    channels=[
+        ExposureChannel(
+            name="broadcast",
+            description="Mass broadcast",
+            reach="broadcast",
+            credibility_modifier=1.0,
+        ),
+    ],
+    rules=[
+        ExposureRule(channel="broadcast", timestep=0, when="true", probability=0.8),
+    ],
+)
+
+_INTERACTION = (
+    InteractionConfig(
+        primary_model=InteractionType.PASSIVE_OBSERVATION,
+        description="Agents observe each other",
+    ),
+    SpreadConfig(share_probability=0.3),
+)
+
+_OUTCOMES = OutcomeConfig(
+    suggested_outcomes=[
+        OutcomeDefinition(
+            name="adoption",
+            description="Whether the agent adopts the product",
+            type=OutcomeType.CATEGORICAL,
+            required=True,
+            options=["adopt", "reject"],
+        ),
+    ],
+)
+
 
 class TestGenerateScenarioName:
     """Test scenario name generation from descriptions."""
@@ -79,8 +136,26 @@ class TestCreateScenario:
     """Test the full create_scenario pipeline with mocked LLM calls."""
 
     @pytest.fixture
-    def mock_files(self, minimal_population_spec, tmp_path):
-        """Create mock input files for the compiler."""
+    def pipeline(self, monkeypatch):
+        """Replace the LLM-backed compiler steps with mocks of canned results."""
+        steps = SimpleNamespace(
+            parse_scenario=MagicMock(return_value=_EVENT),
+            generate_seed_exposure=MagicMock(return_value=_SEED_EXPOSURE),
+            determine_interaction_model=MagicMock(return_value=_INTERACTION),
+            define_outcomes=MagicMock(return_value=_OUTCOMES),
+        )
+        for name, mock in vars(steps).items():
+            monkeypatch.setattr(compiler, name, mock)
+        return steps
+
+    @pytest.fixture(scope="session")
+    def mock_files(self, minimal_population_spec, tmp_path_factory):
+        """Create mock input files for the compiler.
+
+        create_scenario only reads these, so they are written once per session.
+        """
+        tmp_path = tmp_path_factory.mktemp("compiler_inputs")
+
         # Save population spec
         pop_path = tmp_path / "population.yaml"
         minimal_population_spec.to_yaml(pop_path)
@@ -111,80 +186,10 @@ class TestCreateScenario:
 
         return pop_path, agents_path, network_path
 
-    @patch("extropy.scenario.compiler.parse_scenario")
-    @patch("extropy.scenario.compiler.generate_seed_exposure")
-    @patch("extropy.scenario.compiler.determine_interaction_model")
-    @patch("extropy.scenario.compiler.define_outcomes")
-    def test_creates_valid_scenario(
-        self,
-        mock_outcomes,
-        mock_interaction,
-        mock_exposure,
-        mock_parse,
-        mock_files,
-    ):
+    def test_creates_valid_scenario(self, pipeline, mock_files):
         """Test that create_scenario produces a valid ScenarioSpec."""
-        from extropy.core.models.scenario import (
-            Event,
-            SeedExposure,
-            ExposureChannel,
-            ExposureRule,
-            InteractionConfig,
-            InteractionType,
-            SpreadConfig,
-            OutcomeConfig,
-            OutcomeDefinition,
-            OutcomeType,
-        )
-
         pop_path, agents_path, network_path = mock_files
 
-        # Configure mocks
-        mock_parse.return_value = Event(
-            type=EventType.PRODUCT_LAUNCH,
-            content="New product launching.",
-            source="Test Corp",
-            credibility=0.9,
-            ambiguity=0.2,
-            emotional_valence=0.3,
-        )
-
-        mock_exposure.return_value = SeedExposure(
-            channels=[
-                ExposureChannel(
-                    name="broadcast",
-                    description="Mass broadcast",
-                    reach="broadcast",
-                    credibility_modifier=1.0,
-                ),
-            ],
-            rules=[
-                ExposureRule(
-                    channel="broadcast", timestep=0, when="true", probability=0.8
-                ),
-            ],
-        )
-
-        mock_interaction.return_value = (
-            InteractionConfig(
-                primary_model=InteractionType.PASSIVE_OBSERVATION,
-                description="Agents observe each other",
-            ),
-            SpreadConfig(share_probability=0.3),
-        )
-
-        mock_outcomes.return_value = OutcomeConfig(
-            suggested_outcomes=[
-                OutcomeDefinition(
-                    name="adoption",
-                    description="Whether the agent adopts the product",
-                    type=OutcomeType.CATEGORICAL,
-                    required=True,
-                    options=["adopt", "reject"],
-                ),
-            ],
-        )
-
         spec, validation_result = create_scenario(
             description="Test product launch scenario",
             population_spec_path=pop_path,
@@ -197,71 +202,25 @@ class TestCreateScenario:
         assert len(spec.seed_exposure.rules) == 1
         assert spec.simulation.max_timesteps == 50  # small population
 
-    @patch("extropy.scenario.compiler.parse_scenario")
-    @patch("extropy.scenario.compiler.generate_seed_exposure")
-    @patch("extropy.scenario.compiler.determine_interaction_model")
-    @patch("extropy.scenario.compiler.define_outcomes")
-    def test_progress_callback_called(
-        self,
-        mock_outcomes,
-        mock_interaction,
-        mock_exposure,
-        mock_parse,
-        mock_files,
-    ):
-        """Test that progress callback is invoked for each step."""
-        from extropy.core.models.scenario import (
-            Event,
-            SeedExposure,
-            ExposureChannel,
-            ExposureRule,
-            InteractionConfig,
-            InteractionType,
-            SpreadConfig,
-            OutcomeConfig,
-            OutcomeDefinition,
-            OutcomeType,
-        )
-
+    def test_network_summary_passed_to_steps(self, pipeline, mock_files):
+        """The network is summarized once for the exposure and interaction steps."""
         pop_path, agents_path, network_path = mock_files
 
-        mock_parse.return_value = Event(
-            type=EventType.PRODUCT_LAUNCH,
-            content="Test event content",
-            source="Test Corp",
-            credibility=0.9,
-            ambiguity=0.2,
-            emotional_valence=0.0,
-        )
-        mock_exposure.return_value = SeedExposure(
-            channels=[
-                ExposureChannel(
-                    name="b",
-                    description="Broadcast",
-                    reach="broadcast",
-                    credibility_modifier=1.0,
-                )
-            ],
-            rules=[ExposureRule(channel="b", timestep=0, when="true", probability=1.0)],
-        )
-        mock_interaction.return_value = (
-            InteractionConfig(
-                primary_model=InteractionType.PASSIVE_OBSERVATION,
-                description="Agents observe each other",
-            ),
-            SpreadConfig(share_probability=0.3),
-        )
-        mock_outcomes.return_value = OutcomeConfig(
-            suggested_outcomes=[
-                OutcomeDefinition(
-                    name="x",
-                    description="Boolean outcome",
-                    type=OutcomeType.BOOLEAN,
-                    required=True,
-                ),
-            ],
+        create_scenario(
+            description="Test",
+            population_spec_path=pop_path,
+            agents_path=agents_path,
+            network_path=network_path,
         )
 
+        summary = pipeline.generate_seed_exposure.call_args.args[2]
+        assert summary == {"node_count": 10, "edge_types": ["colleague"]}
+        assert pipeline.determine_interaction_model.call_args.args[2] == summary
+
+    def test_progress_callback_called(self, pipeline, mock_files):
+        """Test that progress callback is invoked for each step."""
+        pop_path, agents_path, network_path = mock_files
+
         progress_calls = []
 
         def on_progress(step, status):
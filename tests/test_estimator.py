@@ -211,20 +211,19 @@ class TestPricing:
         assert p.input_per_mtok > 0
         assert p.output_per_mtok > 0
 
-    def test_resolve_openai_default(self):
-        assert resolve_default_model("openai", "reasoning") == "gpt-5"
-        assert resolve_default_model("openai", "simple") == "gpt-5-mini"
-
-    def test_resolve_claude_default(self):
-        assert (
-            resolve_default_model("claude", "reasoning") == "claude-sonnet-4-5-20250929"
-        )
-        assert resolve_default_model("claude", "simple") == "claude-haiku-4-5-20251001"
-
-    def test_resolve_unknown_provider_falls_back(self):
-        model = resolve_default_model("unknown_provider", "reasoning")
-        # Should fall back to openai defaults
-        assert model == "gpt-5"
+    @pytest.mark.parametrize(
+        "provider, tier, expected",
+        [
+            ("openai", "reasoning", "gpt-5"),
+            ("openai", "simple", "gpt-5-mini"),
+            ("claude", "reasoning", "claude-sonnet-4-5-20250929"),
+            ("claude", "simple", "claude-haiku-4-5-20251001"),
+            # Unknown providers fall back to openai defaults
+            ("unknown_provider", "reasoning", "gpt-5"),
+        ],
+    )
+    def test_resolve_default_model(self, provider, tier, expected):
+        assert resolve_default_model(provider, tier) == expected
 
     def test_model_pricing_frozen(self):
         p = ModelPricing(input_per_mtok=1.0, output_per_mtok=2.0)
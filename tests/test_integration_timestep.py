@@ -6,7 +6,8 @@ Functions under test in extropy/simulation/engine.py.
 """
 
 from datetime import datetime
-from unittest.mock import patch
+from functools import cache
+from unittest.mock import MagicMock
 
 import pytest
 
@@ -18,6 +19,15 @@ from extropy.core.models import (
     ReasoningResponse,
     SimulationRunConfig,
 )
+from extropy.core.models.population import (
+    AttributeSpec,
+    GroundingInfo,
+    GroundingSummary,
+    NormalDistribution,
+    PopulationSpec,
+    SamplingConfig,
+    SpecMeta,
+)
 from extropy.simulation.reasoning import BatchTokenUsage
 from extropy.core.models.scenario import (
     Event,
@@ -36,6 +46,7 @@ from extropy.core.models.scenario import (
     SpreadConfig,
     TimestepUnit,
 )
+from extropy.simulation import engine as engine_module
 from extropy.simulation.engine import SimulationEngine
 
 
@@ -142,18 +153,12 @@ def _make_engine(scenario, agents, network, tmp_path):
     )
 
 
+@cache
 def _minimal_pop_spec():
-    """Inline minimal population spec to avoid fixture dependency."""
-    from extropy.core.models.population import (
-        AttributeSpec,
-        GroundingInfo,
-        GroundingSummary,
-        NormalDistribution,
-        PopulationSpec,
-        SamplingConfig,
-        SpecMeta,
-    )
+    """Inline minimal population spec to avoid fixture dependency.
 
+    Built once and shared by every test; the engine only reads it.
+    """
     return PopulationSpec(
         meta=SpecMeta(
             description="Test population",
@@ -211,6 +216,14 @@ def _mock_batch_reason(responses_map=None, default_response=None):
     return mock_fn
 
 
+@pytest.fixture
+def mock_batch(monkeypatch):
+    """Replace the engine's batch_reason_agents with a MagicMock."""
+    mock = MagicMock()
+    monkeypatch.setattr(engine_module, "batch_reason_agents", mock)
+    return mock
+
+
 # ============================================================================
 # Engine Initialization
 # ============================================================================
@@ -269,7 +282,6 @@ class TestEngineInit:
 class TestSingleTimestep:
     """Test a single timestep execution with mocked LLM."""
 
-    @patch("extropy.simulation.engine.batch_reason_agents")
     def test_seed_exposure_then_reasoning(
         self, mock_batch, ten_agents, linear_network, tmp_path
     ):
@@ -302,7 +314,6 @@ class TestSingleTimestep:
             assert state.position == "adopt"
             assert state.sentiment == 0.5
 
-    @patch("extropy.simulation.engine.batch_reason_agents")
     def test_no_reasoning_without_exposure(
         self, mock_batch, ten_agents, linear_network, tmp_path
     ):
@@ -333,7 +344,6 @@ class TestSingleTimestep:
         # No agents to reason → batch_reason_agents is never called
         mock_batch.assert_not_called()
 
-    @patch("extropy.simulation.engine.batch_reason_agents")
     def test_memory_entry_saved(self, mock_batch, ten_agents, linear_network, tmp_path):
         """Reasoning produces a memory entry for each agent."""
         mock_batch.side_effect = _mock_batch_reason()
@@ -357,7 +367,6 @@ class TestSingleTimestep:
         assert len(traces) == 1
         assert traces[0].summary == "Positive initial reaction."
 
-    @patch("extropy.simulation.engine.batch_reason_agents")
     def test_flip_resistance_applied(
         self, mock_batch, ten_agents, linear_network, tmp_path
     ):
@@ -427,7 +436,6 @@ class TestSingleTimestep:
         # But sharing also gated because conviction is very_uncertain
         assert state.will_share is False
 
-    @patch("extropy.simulation.engine.batch_reason_agents")
     def test_conviction_gated_sharing(
         self, mock_batch, ten_agents, linear_network, tmp_path
     ):
@@ -467,7 +475,6 @@ class TestSingleTimestep:
 class TestMultiTimestepDynamics:
     """Test multi-timestep simulation behavior."""
 
-    @patch("extropy.simulation.engine.batch_reason_agents")
     def test_information_cascade_through_chain(
         self, mock_batch, ten_agents, linear_network, tmp_path
     ):
@@ -525,7 +532,6 @@ class TestMultiTimestepDynamics:
         rate = engine.state_manager.get_exposure_rate()
         assert rate > 0.1  # At minimum a0 and a1 are aware
 
-    @patch("extropy.simulation.engine.batch_reason_agents")
     def test_stopping_condition_triggers(
         self, mock_batch, ten_agents, star_network, tmp_path
     ):
@@ -561,7 +567,6 @@ class TestMultiTimestepDynamics:
         assert result.total_timesteps < 50
         assert result.stopped_reason is not None
 
-    @patch("extropy.simulation.engine.batch_reason_agents")
     def test_isolated_agent_never_exposed(self, mock_batch, tmp_path):
         """Agent with no network edges never gets network exposure."""
         mock_batch.side_effect = _mock_batch_reason(
@@ -612,7 +617,6 @@ class TestMultiTimestepDynamics:
         iso_state = engine.state_manager.get_agent_state("isolated")
         assert iso_state.aware is False
 
-    @patch("extropy.simulation.engine.batch_reason_agents")
     def test_exposure_rate_never_decreases(
         self, mock_batch, ten_agents, star_network, tmp_path
     ):
@@ -16,8 +16,8 @@ from extropy.simulation.state import StateManager
 
 
 def _make_exposure(timestep=0, channel="broadcast", source_agent_id=None):
-    """Factory for ExposureRecord."""
-    return ExposureRecord(
+    """Factory for ExposureRecord (unvalidated; the fields are known-good)."""
+    return ExposureRecord.model_construct(
         timestep=timestep,
         channel=channel,
         source_agent_id=source_agent_id,
@@ -27,8 +27,8 @@ def _make_exposure(timestep=0, channel="broadcast", source_agent_id=None):
 
 
 def _make_memory(timestep=0, sentiment=0.5, conviction=0.5, summary="Test thought"):
-    """Factory for MemoryEntry."""
-    return MemoryEntry(
+    """Factory for MemoryEntry (unvalidated; the fields are known-good)."""
+    return MemoryEntry.model_construct(
         timestep=timestep,
         sentiment=sentiment,
         conviction=conviction,
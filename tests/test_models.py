@@ -25,6 +25,11 @@ from extropy.core.models.population import (
     HydratedAttribute,
     SufficiencyResult,
 )
+from extropy.core.models.simulation import (
+    ConvictionLevel,
+    float_to_conviction,
+    score_to_conviction_float,
+)
 
 
 class TestDistributions:
@@ -514,48 +519,36 @@ class TestConvictionFunctions:
 
     def test_score_to_conviction_float_very_uncertain(self):
         """Test score_to_conviction_float for very_uncertain range (0-15)."""
-        from extropy.core.models.simulation import score_to_conviction_float
-
         assert score_to_conviction_float(0) == 0.1
         assert score_to_conviction_float(7) == 0.1
         assert score_to_conviction_float(15) == 0.1
 
     def test_score_to_conviction_float_leaning(self):
         """Test score_to_conviction_float for leaning range (16-35)."""
-        from extropy.core.models.simulation import score_to_conviction_float
-
         assert score_to_conviction_float(16) == 0.3
         assert score_to_conviction_float(25) == 0.3
         assert score_to_conviction_float(35) == 0.3
 
     def test_score_to_conviction_float_moderate(self):
         """Test score_to_conviction_float for moderate range (36-60)."""
-        from extropy.core.models.simulation import score_to_conviction_float
-
         assert score_to_conviction_float(36) == 0.5
         assert score_to_conviction_float(50) == 0.5
         assert score_to_conviction_float(60) == 0.5
 
     def test_score_to_conviction_float_firm(self):
         """Test score_to_conviction_float for firm range (61-85)."""
-        from extropy.core.models.simulation import score_to_conviction_float
-
         assert score_to_conviction_float(61) == 0.7
         assert score_to_conviction_float(75) == 0.7
         assert score_to_conviction_float(85) == 0.7
 
     def test_score_to_conviction_float_absolute(self):
         """Test score_to_conviction_float for absolute range (86-100)."""
-        from extropy.core.models.simulation import score_to_conviction_float
-
         assert score_to_conviction_float(86) == 0.9
         assert score_to_conviction_float(95) == 0.9
         assert score_to_conviction_float(100) == 0.9
 
     def test_score_to_conviction_float_boundaries(self):
         """Test score_to_conviction_float at bucket boundaries."""
-        from extropy.core.models.simulation import score_to_conviction_float
-
         # Test all critical boundaries
         assert score_to_conviction_float(15) == 0.1  # very_uncertain upper
         assert score_to_conviction_float(16) == 0.3  # leaning lower
@@ -568,14 +561,10 @@ class TestConvictionFunctions:
 
     def test_score_to_conviction_float_none(self):
         """Test score_to_conviction_float with None returns None."""
-        from extropy.core.models.simulation import score_to_conviction_float
-
         assert score_to_conviction_float(None) is None
 
     def test_score_to_conviction_float_accepts_float(self):
         """Test score_to_conviction_float accepts float inputs."""
-        from extropy.core.models.simulation import score_to_conviction_float
-
         # Floats should be cast to int
         assert score_to_conviction_float(15.9) == 0.1
         assert score_to_conviction_float(16.1) == 0.3
@@ -583,11 +572,6 @@ class TestConvictionFunctions:
 
     def test_float_to_conviction_exact_matches(self):
         """Test float_to_conviction for exact conviction map values."""
-        from extropy.core.models.simulation import (
-            float_to_conviction,
-            ConvictionLevel,
-        )
-
         assert float_to_conviction(0.1) == ConvictionLevel.VERY_UNCERTAIN
         assert float_to_conviction(0.3) == ConvictionLevel.LEANING
         assert float_to_conviction(0.5) == ConvictionLevel.MODERATE
@@ -596,11 +580,6 @@ class TestConvictionFunctions:
 
     def test_float_to_conviction_nearest_rounding(self):
         """Test float_to_conviction rounds to nearest level."""
-        from extropy.core.models.simulation import (
-            float_to_conviction,
-            ConvictionLevel,
-        )
-
         # Test values between levels round to nearest
         # Levels: 0.1, 0.3, 0.5, 0.7, 0.9
         assert (
@@ -639,11 +618,6 @@ class TestConvictionFunctions:
 
     def test_float_to_conviction_extreme_values(self):
         """Test float_to_conviction with values outside normal range."""
-        from extropy.core.models.simulation import (
-            float_to_conviction,
-            ConvictionLevel,
-        )
-
         # Very low values should round to very_uncertain
         assert float_to_conviction(0.0) == ConvictionLevel.VERY_UNCERTAIN
         assert float_to_conviction(0.05) == ConvictionLevel.VERY_UNCERTAIN
@@ -654,18 +628,10 @@ class TestConvictionFunctions:
 
     def test_float_to_conviction_none(self):
         """Test float_to_conviction with None returns None."""
-        from extropy.core.models.simulation import float_to_conviction
-
         assert float_to_conviction(None) is None
 
     def test_conviction_round_trip_via_score(self):
         """Test round-trip conversion score -> float -> label."""
-        from extropy.core.models.simulation import (
-            score_to_conviction_float,
-            float_to_conviction,
-            ConvictionLevel,
-        )
-
         # Test that converting a score to float and back to label works
         assert (
             float_to_conviction(score_to_conviction_float(10))
@@ -686,3 +652,25 @@ class TestConvictionFunctions:
             float_to_conviction(score_to_conviction_float(95))
             == ConvictionLevel.ABSOLUTE
         )
+
+
+class TestPackageExports:
+    """Tests for the lazily loaded extropy.core.models namespace."""
+
+    def test_all_names_resolve(self):
+        import extropy.core.models as models
+
+        assert len(models.__all__) == len(set(models.__all__))
+        for name in models.__all__:
+            assert getattr(models, name) is not None, name
+
+    def test_dir_matches_all(self):
+        import extropy.core.models as models
+
+        assert dir(models) == sorted(models.__all__)
+
+    def test_unknown_name_raises_attribute_error(self):
+        import extropy.core.models as models
+
+        with pytest.raises(AttributeError):
+            models.NotAModel
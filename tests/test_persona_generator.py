@@ -122,3 +122,31 @@ def test_generate_categorical_phrasings_accepts_normalized_option_tokens(monkeyp
 
     assert len(result) == 1
     assert set(result[0].phrases.keys()) == {"Drama", "Reality_TV"}
+
+
+def test_generate_persona_config_runs_phrasing_steps_concurrently(monkeypatch):
+    import threading
+
+    spec = _minimal_categorical_spec()
+    # Every phrasing step must be in flight at once to pass the barrier
+    barrier = threading.Barrier(4, timeout=5)
+
+    def _step(result):
+        def _run(*_args):
+            barrier.wait()
+            return result
+
+        return _run
+
+    monkeypatch.setattr(
+        generator, "generate_structure", lambda *_args: ([], [], "I am a tester.")
+    )
+    monkeypatch.setattr(generator, "generate_boolean_phrasings", _step([]))
+    monkeypatch.setattr(generator, "generate_categorical_phrasings", _step([]))
+    monkeypatch.setattr(generator, "generate_relative_phrasings", _step([]))
+    monkeypatch.setattr(generator, "generate_concrete_phrasings", _step([]))
+
+    config = generator.generate_persona_config(spec)
+
+    assert config.intro_template == "I am a tester."
+    assert config.phrasings.categorical == []
@@ -57,3 +57,75 @@ def test_categorical_non_null_options_render_normally():
 
     rendered = _format_categorical_value("moderator", phrasing)
     assert rendered == "I moderate one or more communities"
+
+
+def _intro_config(template: str):
+    from extropy.population.persona.config import AttributePhrasing, PersonaConfig
+
+    return PersonaConfig(
+        population_description="Test population",
+        intro_template=template,
+        treatments=[],
+        groups=[],
+        phrasings=AttributePhrasing(),
+    )
+
+
+def test_intro_formats_only_template_fields():
+    from extropy.population.persona.renderer import render_intro
+
+    agent = {
+        "age": 42.0,
+        "occupation": "bus_driver",
+        # Unused by the template; would fail float formatting if touched
+        "trust_score": float("nan"),
+    }
+    intro = render_intro(agent, _intro_config("I'm {age}, a {occupation}."))
+
+    assert intro == "## Who I Am\n\nI'm 42, a bus driver."
+
+
+def test_intro_missing_field_reports_error():
+    from extropy.population.persona.renderer import render_intro
+
+    intro = render_intro({"age": 42}, _intro_config("I live in {city}."))
+
+    assert intro == "## Who I Am\n\n[Error rendering intro: 'city']"
+
+
+def test_phrasing_lookup_tracks_list_changes():
+    from extropy.population.persona.config import (
+        AttributePhrasing,
+        BooleanPhrasing,
+        ConcretePhrasing,
+    )
+
+    phrasings = AttributePhrasing(
+        boolean=[
+            BooleanPhrasing(
+                attribute="has_car", true_phrase="I own a car", false_phrase="I don't"
+            )
+        ],
+        concrete=[ConcretePhrasing(attribute="has_car", template="{value}")],
+    )
+
+    assert isinstance(phrasings.get_phrasing("has_car"), BooleanPhrasing)
+    assert phrasings.get_phrasing("commute_miles") is None
+
+    commute = ConcretePhrasing(
+        attribute="commute_miles", template="I drive {value} miles"
+    )
+    phrasings.concrete = [*phrasings.concrete, commute]
+    assert phrasings.get_phrasing("commute_miles") is commute
+    assert "_index" not in phrasings.model_dump()
+
+    copied = phrasings.model_copy(update={"concrete": []})
+    assert copied.get_phrasing("commute_miles") is None
+    assert phrasings.get_phrasing("commute_miles") is commute
+
+    # In-place growth and shrinkage are picked up too
+    bike = ConcretePhrasing(attribute="bike_miles", template="I ride {value} miles")
+    phrasings.concrete.append(bike)
+    assert phrasings.get_phrasing("bike_miles") is bike
+    phrasings.concrete.remove(bike)
+    assert phrasings.get_phrasing("bike_miles") is None
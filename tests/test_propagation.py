@@ -10,7 +10,7 @@ from datetime import datetime
 
 import pytest
 
-from extropy.core.models import AgentState, ExposureRecord
+from extropy.core.models import AgentState, ExposureRecord, SimulationEventType
 from extropy.core.models.scenario import (
     Event,
     EventType,
@@ -29,6 +29,7 @@ from extropy.core.models.scenario import (
     SpreadModifier,
     TimestepUnit,
 )
+from extropy.simulation import propagation
 from extropy.simulation.propagation import (
     apply_seed_exposures,
     calculate_share_probability,
@@ -108,6 +109,11 @@ def _make_scenario(
     )
 
 
+def _state_manager(agents: list[dict]) -> StateManager:
+    """Fresh in-memory StateManager; these tests never reopen the database."""
+    return StateManager(":memory:", agents=agents)
+
+
 # ============================================================================
 # Exposure Rule Evaluation
 # ============================================================================
@@ -185,10 +191,10 @@ class TestGetChannelCredibility:
 class TestApplySeedExposures:
     """Test apply_seed_exposures(timestep, scenario, agents, state_manager, rng)."""
 
-    def test_all_agents_exposed_broadcast(self, tmp_path, ten_agents, rng):
+    def test_all_agents_exposed_broadcast(self, ten_agents, rng):
         """probability=1.0, when='true' → all 10 agents exposed."""
         scenario = _make_scenario()
-        sm = StateManager(tmp_path / "test.db", agents=ten_agents)
+        sm = _state_manager(ten_agents)
 
         count = apply_seed_exposures(0, scenario, ten_agents, sm, rng)
 
@@ -198,18 +204,44 @@ class TestApplySeedExposures:
             assert state.aware is True
             assert state.exposure_count == 1
 
-    def test_no_exposure_wrong_timestep(self, tmp_path, ten_agents, rng):
+    def test_no_exposure_wrong_timestep(self, ten_agents, rng):
         """Rule at timestep=5, called at timestep=0 → no exposures."""
         rules = [
             ExposureRule(channel="broadcast", timestep=5, when="true", probability=1.0),
         ]
         scenario = _make_scenario(rules=rules)
-        sm = StateManager(tmp_path / "test.db", agents=ten_agents)
+        sm = _state_manager(ten_agents)
 
         count = apply_seed_exposures(0, scenario, ten_agents, sm, rng)
         assert count == 0
 
-    def test_conditional_exposure(self, tmp_path, ten_agents, rng):
+    @pytest.mark.parametrize(
+        "when, expected_evals", [("true", 0), ("1", 0), ("age > 0", 10)]
+    )
+    def test_only_conditional_rules_are_evaluated(
+        self, ten_agents, rng, monkeypatch, when, expected_evals
+    ):
+        """Always-true rules skip per-agent condition evaluation entirely."""
+        calls = []
+        real_eval = propagation.eval_condition
+
+        def counting_eval(*args, **kwargs):
+            calls.append(args[0])
+            return real_eval(*args, **kwargs)
+
+        monkeypatch.setattr(propagation, "eval_condition", counting_eval)
+        rules = [
+            ExposureRule(channel="broadcast", timestep=0, when=when, probability=1.0),
+        ]
+        scenario = _make_scenario(rules=rules)
+        sm = _state_manager(ten_agents)
+
+        count = apply_seed_exposures(0, scenario, ten_agents, sm, rng)
+
+        assert count == 10
+        assert len(calls) == expected_evals
+
+    def test_conditional_exposure(self, ten_agents, rng):
         """Only agents matching condition get exposed."""
         # ten_agents: roles cycle junior, mid, senior. Seniors at indices 2,5,8
         rules = [
@@ -221,7 +253,7 @@ class TestApplySeedExposures:
             ),
         ]
         scenario = _make_scenario(rules=rules)
-        sm = StateManager(tmp_path / "test.db", agents=ten_agents)
+        sm = _state_manager(ten_agents)
 
         count = apply_seed_exposures(0, scenario, ten_agents, sm, rng)
 
@@ -234,13 +266,13 @@ class TestApplySeedExposures:
             else:
                 assert state.aware is False
 
-    def test_probabilistic_exposure(self, tmp_path, ten_agents):
+    def test_probabilistic_exposure(self, ten_agents):
         """prob=0.5, seeded rng → deterministic subset."""
         rules = [
             ExposureRule(channel="broadcast", timestep=0, when="true", probability=0.5),
         ]
         scenario = _make_scenario(rules=rules)
-        sm = StateManager(tmp_path / "test.db", agents=ten_agents)
+        sm = _state_manager(ten_agents)
         rng = random.Random(42)
 
         count = apply_seed_exposures(0, scenario, ten_agents, sm, rng)
@@ -249,12 +281,12 @@ class TestApplySeedExposures:
         assert 0 < count < 10
 
         # Deterministic: same seed, same result
-        sm2 = StateManager(tmp_path / "test2.db", agents=ten_agents)
+        sm2 = _state_manager(ten_agents)
         rng2 = random.Random(42)
         count2 = apply_seed_exposures(0, scenario, ten_agents, sm2, rng2)
         assert count == count2
 
-    def test_credibility_calculation(self, tmp_path, rng):
+    def test_credibility_calculation(self, rng):
         """Exposure credibility = event_credibility * channel_credibility_modifier."""
         agents = [{"_id": "a0", "age": 30}]
         channels = [
@@ -269,7 +301,7 @@ class TestApplySeedExposures:
             ExposureRule(channel="email", timestep=0, when="true", probability=1.0),
         ]
         scenario = _make_scenario(rules=rules, channels=channels, event_credibility=0.9)
-        sm = StateManager(tmp_path / "test.db", agents=agents)
+        sm = _state_manager(agents)
 
         apply_seed_exposures(0, scenario, agents, sm, rng)
 
@@ -277,11 +309,11 @@ class TestApplySeedExposures:
         assert len(state.exposures) == 1
         assert state.exposures[0].credibility == pytest.approx(0.72)  # 0.9 * 0.8
 
-    def test_already_aware_agent_gets_new_exposure(self, tmp_path, rng):
+    def test_already_aware_agent_gets_new_exposure(self, rng):
         """An already-aware agent still receives additional exposures."""
         agents = [{"_id": "a0", "age": 30}]
         scenario = _make_scenario()
-        sm = StateManager(tmp_path / "test.db", agents=agents)
+        sm = _state_manager(agents)
 
         # First exposure
         apply_seed_exposures(0, scenario, agents, sm, rng)
@@ -493,10 +525,10 @@ class TestPropagateNetwork:
             timestep=timestep,
         )
 
-    def test_single_sharer_star(self, tmp_path, ten_agents, star_network):
+    def test_single_sharer_star(self, ten_agents, star_network):
         """Hub shares to all spokes."""
         scenario = _make_scenario(share_probability=1.0)
-        sm = StateManager(tmp_path / "test.db", agents=ten_agents)
+        sm = _state_manager(ten_agents)
         rng = random.Random(42)
 
         self._setup_sharer(sm, "a0")
@@ -511,10 +543,10 @@ class TestPropagateNetwork:
             state = sm.get_agent_state(f"a{i}")
             assert state.aware is True
 
-    def test_no_sharers_no_propagation(self, tmp_path, ten_agents, star_network):
+    def test_no_sharers_no_propagation(self, ten_agents, star_network):
         """No agents with will_share=True → zero propagation."""
         scenario = _make_scenario(share_probability=1.0)
-        sm = StateManager(tmp_path / "test.db", agents=ten_agents)
+        sm = _state_manager(ten_agents)
         rng = random.Random(42)
 
         count = propagate_through_network(
@@ -522,10 +554,10 @@ class TestPropagateNetwork:
         )
         assert count == 0
 
-    def test_single_hop_in_chain(self, tmp_path, ten_agents, linear_network):
+    def test_single_hop_in_chain(self, ten_agents, linear_network):
         """In a chain, a0 sharing reaches a1 only (one hop per timestep call)."""
         scenario = _make_scenario(share_probability=1.0)
-        sm = StateManager(tmp_path / "test.db", agents=ten_agents)
+        sm = _state_manager(ten_agents)
         rng = random.Random(42)
 
         self._setup_sharer(sm, "a0")
@@ -539,10 +571,10 @@ class TestPropagateNetwork:
         assert sm.get_agent_state("a1").aware is True
         assert sm.get_agent_state("a2").aware is False
 
-    def test_peer_credibility_is_085(self, tmp_path, ten_agents, linear_network):
+    def test_peer_credibility_is_085(self, ten_agents, linear_network):
         """Network exposures have credibility = 0.85."""
         scenario = _make_scenario(share_probability=1.0)
-        sm = StateManager(tmp_path / "test.db", agents=ten_agents)
+        sm = _state_manager(ten_agents)
         rng = random.Random(42)
 
         self._setup_sharer(sm, "a0")
@@ -554,12 +586,10 @@ class TestPropagateNetwork:
         assert state.exposures[0].channel == "network"
         assert state.exposures[0].source_agent_id == "a0"
 
-    def test_already_aware_still_gets_exposure(
-        self, tmp_path, ten_agents, linear_network
-    ):
+    def test_already_aware_still_gets_exposure(self, ten_agents, linear_network):
         """Already-aware agents still receive new exposures (multi-touch)."""
         scenario = _make_scenario(share_probability=1.0)
-        sm = StateManager(tmp_path / "test.db", agents=ten_agents)
+        sm = _state_manager(ten_agents)
         rng = random.Random(42)
 
         # Make a1 already aware via seed
@@ -576,10 +606,10 @@ class TestPropagateNetwork:
         state = sm.get_agent_state("a1")
         assert state.exposure_count == 2  # seed + network
 
-    def test_probabilistic_sharing(self, tmp_path, ten_agents, star_network):
+    def test_probabilistic_sharing(self, ten_agents, star_network):
         """share_prob=0.5 with seeded rng → deterministic subset."""
         scenario = _make_scenario(share_probability=0.5)
-        sm = StateManager(tmp_path / "test.db", agents=ten_agents)
+        sm = _state_manager(ten_agents)
         rng = random.Random(42)
 
         self._setup_sharer(sm, "a0")
@@ -590,13 +620,65 @@ class TestPropagateNetwork:
         # With prob=0.5 and 9 neighbors, expect some but not all
         assert 0 < count < 9
 
-    def test_max_hops_blocks_deeper_reshares(
-        self, tmp_path, ten_agents, linear_network
+    @pytest.mark.parametrize("reorder", [False, True])
+    def test_seeded_sharing_follows_network_order(
+        self, ten_agents, star_network, reorder
     ):
+        """Seeded draws map to edges in network order, not eligibility order."""
+        scenario = _make_scenario(share_probability=0.5)
+
+        def exposed_agents(sm):
+            return [f"a{i}" for i in range(1, 10) if sm.get_agent_state(f"a{i}").aware]
+
+        baseline = _state_manager(ten_agents)
+        self._setup_sharer(baseline, "a0")
+        propagate_through_network(
+            1, scenario, ten_agents, star_network, baseline, random.Random(42)
+        )
+
+        sm = _state_manager(ten_agents)
+        self._setup_sharer(sm, "a0")
+        if reorder:
+            unshared = sm.get_unshared_neighbors
+            sm.get_unshared_neighbors = lambda *args: unshared(*args)[::-1]
+        propagate_through_network(
+            1, scenario, ten_agents, star_network, sm, random.Random(42)
+        )
+
+        assert exposed_agents(sm) == exposed_agents(baseline)
+
+    def test_duplicate_edges_share_once_with_last_edge_data(self, ten_agents):
+        """Duplicate edges give one share attempt, using the last edge's data."""
+        scenario = _make_scenario(share_probability=1.0)
+        network = {
+            "meta": {"node_count": 10},
+            "nodes": [{"id": f"a{i}"} for i in range(10)],
+            "edges": [
+                {"source": "a0", "target": "a1", "type": "acquaintance"},
+                {"source": "a1", "target": "a0", "type": "family"},
+            ],
+        }
+        sm = _state_manager(ten_agents)
+        self._setup_sharer(sm, "a0")
+
+        count = propagate_through_network(
+            1, scenario, ten_agents, network, sm, random.Random(42)
+        )
+
+        assert count == 1
+        assert sm.get_agent_state("a1").exposure_count == 1
+        network_events = [
+            e
+            for e in sm.export_timeline()
+            if e["event_type"] == SimulationEventType.NETWORK_EXPOSURE.value
+        ]
+        assert [e["details"]["edge_type"] for e in network_events] == ["family"]
+
+    def test_max_hops_blocks_deeper_reshares(self, ten_agents, linear_network):
         """Agents beyond max_hops should not receive propagated exposures."""
         scenario = _make_scenario(share_probability=1.0)
         scenario.spread.max_hops = 1
-        sm = StateManager(tmp_path / "test.db", agents=ten_agents)
+        sm = _state_manager(ten_agents)
         rng = random.Random(42)
 
         # Seed a0, then allow only a0 to share.
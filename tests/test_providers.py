@@ -4,11 +4,14 @@ Tests response extraction, retry on transient errors,
 validation-retry exhaustion, and source URL extraction.
 """
 
+import json
+from types import SimpleNamespace
 from unittest.mock import patch, MagicMock, AsyncMock
 
 import pytest
 
 from extropy.core.providers.base import LLMProvider, TokenUsage
+from extropy.core.providers.cache import LLMCache
 from extropy.core.providers.openai import OpenAIProvider
 from extropy.core.providers.claude import ClaudeProvider
 
@@ -31,6 +34,11 @@ def _make_openai_provider(**overrides):
         "_api_version": "",
         "_azure_deployment": "",
         "_api_format": "responses",
+        "_cache": None,
+        "_max_connections": 1000,
+        "_max_keepalive_connections": 500,
+        "_cached_sync_client": None,
+        "_cached_async_client": None,
     }
     defaults.update(overrides)
     for k, v in defaults.items():
@@ -41,7 +49,15 @@ def _make_openai_provider(**overrides):
 def _make_claude_provider(**overrides):
     """Create a ClaudeProvider via __new__ with all required attrs set."""
     provider = ClaudeProvider.__new__(ClaudeProvider)
-    defaults = {"_api_key": "test-key"}
+    defaults = {
+        "_api_key": "test-key",
+        "_cached_sync_client": None,
+        "_cached_async_client": None,
+        "_max_connections": 1000,
+        "_max_keepalive_connections": 500,
+        "_timeout": 600.0,
+        "_use_aiohttp": False,
+    }
     defaults.update(overrides)
     for k, v in defaults.items():
         setattr(provider, k, v)
@@ -105,6 +121,13 @@ def _make_claude_response(
     return response
 
 
+def _make_claude_stream(response):
+    """Wrap a mock response as the context manager ``messages.stream`` returns."""
+    stream = MagicMock()
+    stream.__enter__.return_value.get_final_message.return_value = response
+    return stream
+
+
 # =============================================================================
 # OpenAI Provider Tests
 # =============================================================================
@@ -165,6 +188,21 @@ class TestOpenAISimpleCall:
         )
         assert result == {}
 
+    @pytest.mark.parametrize("has_orjson", [True, False])
+    def test_json_parsing_backends_agree(self, has_orjson):
+        import json
+
+        from extropy.core.providers import openai as openai_provider
+
+        if has_orjson and not openai_provider.HAS_ORJSON:
+            pytest.skip("orjson not installed")
+
+        payload = '{"name": "caf\u00e9", "values": [1, 2.5, null, true]}'
+        with patch.object(openai_provider, "HAS_ORJSON", has_orjson):
+            assert openai_provider._loads(payload) == json.loads(payload)
+            with pytest.raises(ValueError):
+                openai_provider._loads("{not json")
+
 
 class TestOpenAIRetry:
     """Test OpenAI transient error retry."""
@@ -275,6 +313,395 @@ class TestOpenAIValidationRetry:
         assert len(retry_calls) == 2
         assert "EXHAUSTED" in retry_calls[-1][1]
 
+    @patch.object(OpenAIProvider, "_get_client")
+    def test_retry_reuses_static_request_fields(self, mock_get_client):
+        provider = _make_openai_provider()
+
+        mock_client = MagicMock()
+        mock_client.responses.create.side_effect = [
+            _make_openai_response('{"status": "bad"}'),
+            _make_openai_response('{"status": "good"}'),
+        ]
+        mock_get_client.return_value = mock_client
+
+        result = provider.reasoning_call(
+            prompt="base prompt",
+            response_schema={"type": "object", "properties": {}},
+            validator=lambda d: (d["status"] == "good", "FIX STATUS"),
+            log=False,
+        )
+
+        assert result == {"status": "good"}
+        first, second = mock_client.responses.create.call_args_list
+        assert first.kwargs["text"] is second.kwargs["text"]
+        assert first.kwargs["input"][0]["content"] == "base prompt"
+        assert second.kwargs["input"][0]["content"] == (
+            "FIX STATUS\n\n---\n\nbase prompt"
+        )
+
+
+class TestOpenAIResponseCache:
+    """Test LLMCache reuse of identical OpenAI requests."""
+
+    SCHEMA = {"type": "object", "properties": {}}
+
+    @patch.object(OpenAIProvider, "_get_client")
+    def test_simple_call_hit_skips_api(self, mock_get_client):
+        cache = LLMCache()
+        provider = _make_openai_provider(_cache=cache)
+        mock_client = MagicMock()
+        mock_client.responses.create.return_value = _make_openai_response(
+            '{"result": "ok"}'
+        )
+        mock_get_client.return_value = mock_client
+
+        first = provider.simple_call("same", self.SCHEMA, log=False)
+        first["result"] = "mutated"
+        second = provider.simple_call("same", self.SCHEMA, log=False)
+
+        assert second == {"result": "ok"}
+        assert mock_client.responses.create.call_count == 1
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    @patch.object(OpenAIProvider, "_get_client")
+    def test_different_schema_misses(self, mock_get_client):
+        provider = _make_openai_provider(_cache=LLMCache())
+        mock_client = MagicMock()
+        mock_client.responses.create.return_value = _make_openai_response()
+        mock_get_client.return_value = mock_client
+
+        provider.simple_call("same", self.SCHEMA, log=False)
+        provider.simple_call("same", self.SCHEMA, schema_name="other", log=False)
+
+        assert mock_client.responses.create.call_count == 2
+
+    @patch.object(OpenAIProvider, "_get_client")
+    def test_reasoning_call_caches_only_valid_results(self, mock_get_client):
+        provider = _make_openai_provider(_cache=LLMCache())
+        mock_client = MagicMock()
+        mock_client.responses.create.return_value = _make_openai_response(
+            '{"status": "bad"}'
+        )
+        mock_get_client.return_value = mock_client
+
+        def validator(data):
+            return data["status"] == "good", "bad status"
+
+        for _ in range(2):
+            provider.reasoning_call(
+                "p", self.SCHEMA, validator=validator, max_retries=0, log=False
+            )
+        assert mock_client.responses.create.call_count == 2
+
+        mock_client.responses.create.return_value = _make_openai_response(
+            '{"status": "good"}'
+        )
+        for _ in range(2):
+            result = provider.reasoning_call(
+                "p", self.SCHEMA, validator=validator, max_retries=0, log=False
+            )
+        assert result == {"status": "good"}
+        assert mock_client.responses.create.call_count == 3
+
+    @patch.object(OpenAIProvider, "_get_client")
+    def test_reasoning_call_revalidates_cache_hits(self, mock_get_client):
+        provider = _make_openai_provider(_cache=LLMCache())
+        mock_client = MagicMock()
+        mock_client.responses.create.return_value = _make_openai_response(
+            '{"status": "ok"}'
+        )
+        mock_get_client.return_value = mock_client
+        validations = []
+
+        def strict(data):
+            validations.append(data)
+            return data["status"] == "good", "bad status"
+
+        provider.reasoning_call("p", self.SCHEMA, log=False)
+        provider.reasoning_call(
+            "p", self.SCHEMA, validator=strict, max_retries=0, log=False
+        )
+
+        # The unvalidated cached result fails the stricter validator, so the
+        # second call goes to the API; each result is validated exactly once
+        assert mock_client.responses.create.call_count == 2
+        assert len(validations) == 2
+
+    @patch.object(OpenAIProvider, "_get_client")
+    def test_endpoint_is_part_of_cache_key(self, mock_get_client):
+        cache = LLMCache()
+        mock_client = MagicMock()
+        mock_client.responses.create.return_value = _make_openai_response()
+        mock_get_client.return_value = mock_client
+
+        _make_openai_provider(_cache=cache).reasoning_call("p", self.SCHEMA, log=False)
+        _make_openai_provider(
+            _cache=cache, _azure_endpoint="https://example.openai.azure.com"
+        ).reasoning_call("p", self.SCHEMA, log=False)
+
+        assert mock_client.responses.create.call_count == 2
+
+    @pytest.mark.asyncio
+    @patch.object(OpenAIProvider, "_get_async_client")
+    async def test_async_hit_reports_no_usage(self, mock_get_async_client):
+        provider = _make_openai_provider(_cache=LLMCache())
+        mock_client = MagicMock()
+        mock_client.responses.create = AsyncMock(
+            return_value=_make_openai_response('{"a": 1}')
+        )
+        mock_get_async_client.return_value = mock_client
+
+        await provider.simple_call_async("p", self.SCHEMA)
+        result, usage = await provider.simple_call_async("p", self.SCHEMA)
+
+        assert result == {"a": 1}
+        assert usage == TokenUsage()
+        assert mock_client.responses.create.await_count == 1
+
+    def test_memory_cache_evicts_oldest(self):
+        cache = LLMCache(max_entries=2)
+        for key in ("a", "b", "c"):
+            cache.set(key, {"k": key})
+
+        assert cache.get("a") is None
+        assert cache.get("c") == {"k": "c"}
+
+    def test_disk_cache_requires_diskcache(self, tmp_path):
+        with patch("extropy.core.providers.cache.HAS_DISKCACHE", False):
+            with pytest.raises(ImportError, match="diskcache"):
+                LLMCache(directory=str(tmp_path))
+
+
+class TestOpenAIAgenticResearch:
+    """Test OpenAI agentic_research text and source extraction."""
+
+    @patch.object(OpenAIProvider, "_get_client")
+    def test_extracts_search_sources_and_citations(self, mock_get_client):
+        provider = _make_openai_provider()
+
+        search_call = MagicMock()
+        search_call.type = "web_search_call"
+        source_obj = MagicMock()
+        source_obj.url = "https://example.com/obj"
+        search_call.action.sources = [{"url": "https://example.com/dict"}, source_obj]
+
+        citation = MagicMock()
+        citation.type = "url_citation"
+        citation.url = "https://example.com/cited"
+        response = _make_openai_response('{"finding": "x"}')
+        response.output[0].content[0].annotations = [citation]
+        response.output.insert(0, search_call)
+
+        mock_client = MagicMock()
+        mock_client.responses.create.return_value = response
+        mock_get_client.return_value = mock_client
+
+        result, sources = provider.agentic_research(
+            prompt="research",
+            response_schema={"type": "object", "properties": {}},
+            log=False,
+        )
+
+        assert result == {"finding": "x"}
+        assert sources == [
+            "https://example.com/dict",
+            "https://example.com/obj",
+            "https://example.com/cited",
+        ]
+
+    @patch.object(OpenAIProvider, "_get_client")
+    def test_sources_deduplicated_across_retries(self, mock_get_client):
+        provider = _make_openai_provider()
+
+        def make_response(urls, status):
+            citations = []
+            for url in urls:
+                citation = MagicMock()
+                citation.type = "url_citation"
+                citation.url = url
+                citations.append(citation)
+            response = _make_openai_response(json.dumps({"status": status}))
+            response.output[0].content[0].annotations = citations
+            return response
+
+        mock_client = MagicMock()
+        mock_client.responses.create.side_effect = [
+            make_response(["https://a.com", "https://b.com", "https://a.com"], "bad"),
+            make_response(["https://b.com", "https://c.com"], "good"),
+        ]
+        mock_get_client.return_value = mock_client
+
+        result, sources = provider.agentic_research(
+            prompt="research",
+            response_schema={"type": "object", "properties": {}},
+            validator=lambda d: (d["status"] == "good", "retry"),
+            log=False,
+        )
+
+        assert result == {"status": "good"}
+        assert sources == ["https://a.com", "https://b.com", "https://c.com"]
+
+
+class TestOpenAIBatchSimpleCall:
+    """Test OpenAI Batch API submission, polling and result ordering."""
+
+    @staticmethod
+    def _result_line(custom_id, text):
+        body = {
+            "output": [
+                {
+                    "type": "message",
+                    "content": [{"type": "output_text", "text": text}],
+                }
+            ]
+        }
+        return json.dumps({"custom_id": custom_id, "response": {"body": body}})
+
+    @patch("time.sleep")
+    @patch.object(OpenAIProvider, "_get_client")
+    def test_polls_until_complete_and_orders_results(self, mock_get_client, _):
+        provider = _make_openai_provider()
+        mock_client = MagicMock()
+        mock_client.files.create.return_value = MagicMock(id="file-in")
+        mock_client.batches.create.return_value = MagicMock(
+            id="batch-1", status="validating"
+        )
+        mock_client.batches.retrieve.side_effect = [
+            MagicMock(id="batch-1", status="in_progress"),
+            MagicMock(id="batch-1", status="completed", output_file_id="file-out"),
+        ]
+        mock_client.files.content.return_value = MagicMock(
+            text="\n".join(
+                [self._result_line("1", '{"n": 1}'), self._result_line("0", '{"n": 0}')]
+            )
+        )
+        mock_get_client.return_value = mock_client
+
+        schema = {"type": "object", "properties": {}}
+        results = provider.batch_simple_call(
+            [("a", schema), ("b", schema), ("c", schema)]
+        )
+
+        assert results == [{"n": 0}, {"n": 1}, {}]
+        assert mock_client.batches.retrieve.call_count == 2
+        upload = mock_client.files.create.call_args.kwargs
+        assert upload["purpose"] == "batch"
+        first_line = json.loads(upload["file"][1].decode().splitlines()[0])
+        assert first_line["url"] == "/v1/responses"
+        assert first_line["body"]["input"] == "a"
+
+    @patch.object(OpenAIProvider, "_get_client")
+    def test_malformed_result_lines_leave_empty_slots(self, mock_get_client):
+        provider = _make_openai_provider()
+        mock_client = MagicMock()
+        mock_client.batches.create.return_value = MagicMock(
+            id="b", status="completed", output_file_id="file-out"
+        )
+        mock_client.files.content.return_value = MagicMock(
+            text="\n".join(
+                [
+                    self._result_line("0", "not json"),
+                    "{broken envelope",
+                    self._result_line("2", '{"n": 2}'),
+                ]
+            )
+        )
+        mock_get_client.return_value = mock_client
+
+        results = provider.batch_simple_call([("a", {}), ("b", {}), ("c", {})])
+
+        assert results == [{}, {}, {"n": 2}]
+
+    @patch.object(OpenAIProvider, "_get_client")
+    def test_timeout_raised_even_if_cancel_fails(self, mock_get_client):
+        provider = _make_openai_provider()
+        mock_client = MagicMock()
+        mock_client.batches.create.return_value = MagicMock(
+            id="b", status="in_progress"
+        )
+        mock_client.batches.retrieve.return_value = MagicMock(
+            id="b", status="in_progress"
+        )
+        mock_client.batches.cancel.side_effect = ValueError("cancel failed")
+        mock_get_client.return_value = mock_client
+
+        now = [1000.0]
+        sleeps = []
+
+        def fake_sleep(seconds):
+            sleeps.append(seconds)
+            now[0] += seconds
+
+        with (
+            patch("time.time", side_effect=lambda: now[0]),
+            patch("time.sleep", side_effect=fake_sleep),
+        ):
+            with pytest.raises(RuntimeError, match="did not finish within 50s"):
+                provider.batch_simple_call(
+                    [("a", {})], poll_interval=30.0, timeout=50.0
+                )
+
+        # The second sleep is capped at the 20s left before the deadline
+        assert sleeps == [30.0, 20.0]
+        mock_client.batches.cancel.assert_called_once_with("b")
+
+    @patch.object(OpenAIProvider, "_get_client")
+    def test_failed_batch_raises(self, mock_get_client):
+        provider = _make_openai_provider()
+        mock_client = MagicMock()
+        mock_client.batches.create.return_value = MagicMock(id="b", status="failed")
+        mock_get_client.return_value = mock_client
+
+        with pytest.raises(RuntimeError, match="failed"):
+            provider.batch_simple_call([("a", {"type": "object"})])
+
+
+class TestOpenAIClientCaching:
+    """Test that OpenAI clients are created once and reused."""
+
+    def test_sync_client_is_cached(self):
+        provider = OpenAIProvider(api_key="test-key")
+        assert provider._get_client() is provider._get_client()
+
+    def test_azure_sync_client_is_cached(self):
+        from openai import AzureOpenAI
+
+        provider = OpenAIProvider(
+            api_key="test-key",
+            azure_endpoint="https://test.openai.azure.com/",
+            api_version="2025-03-01-preview",
+        )
+        client = provider._get_client()
+        assert isinstance(client, AzureOpenAI)
+        assert provider._get_client() is client
+
+    def test_async_client_is_shared(self):
+        provider = OpenAIProvider(api_key="test-key")
+        client = provider._get_async_client()
+        assert provider._get_async_client() is client
+        assert client.max_retries == 0
+
+    def test_sdk_retries_disabled(self):
+        provider = OpenAIProvider(api_key="test-key")
+        assert provider._get_client().max_retries == 0
+
+    def test_pool_settings_applied(self):
+        provider = OpenAIProvider(
+            api_key="test-key", max_connections=250, max_keepalive_connections=50
+        )
+        limits = provider._http_limits()
+        assert limits.max_connections == 250
+        assert limits.max_keepalive_connections == 50
+
+    def test_close_releases_sync_client(self):
+        provider = OpenAIProvider(api_key="test-key")
+        client = provider._get_client()
+
+        provider.close()
+
+        assert client.is_closed()
+        assert provider._cached_sync_client is None
+
 
 # =============================================================================
 # Claude Provider Tests
@@ -289,8 +716,8 @@ class TestClaudeSimpleCall:
         provider = _make_claude_provider()
 
         mock_client = MagicMock()
-        mock_client.messages.create.return_value = _make_claude_response(
-            {"result": "ok"}
+        mock_client.messages.stream.return_value = _make_claude_stream(
+            _make_claude_response({"result": "ok"})
         )
         mock_get_client.return_value = mock_client
 
@@ -301,6 +728,7 @@ class TestClaudeSimpleCall:
         )
 
         assert result == {"result": "ok"}
+        mock_client.messages.create.assert_not_called()
 
 
 class TestClaudeRetry:
@@ -367,6 +795,347 @@ class TestClaudeAgenticResearch:
         assert result == {"finding": "something"}
         assert "https://example.com/source1" in sources
 
+    @patch.object(ClaudeProvider, "_get_client")
+    def test_sources_deduplicated_across_retries(self, mock_get_client):
+        provider = _make_claude_provider()
+
+        def make_response(urls, status):
+            results = []
+            for url in urls:
+                res = MagicMock()
+                res.url = url
+                results.append(res)
+            search_block = MagicMock()
+            search_block.type = "web_search_tool_result"
+            search_block.content = results
+            tool_block = MagicMock()
+            tool_block.type = "tool_use"
+            tool_block.name = "research_data"
+            tool_block.input = {"status": status}
+            response = MagicMock()
+            response.content = [search_block, tool_block]
+            return response
+
+        mock_client = MagicMock()
+        mock_client.messages.create.side_effect = [
+            make_response(["https://a.com", "https://b.com", "https://a.com"], "bad"),
+            make_response(["https://b.com", "https://c.com"], "good"),
+        ]
+        mock_get_client.return_value = mock_client
+
+        result, sources = provider.agentic_research(
+            prompt="research something",
+            response_schema={"type": "object", "properties": {}},
+            validator=lambda d: (d["status"] == "good", "retry"),
+            log=False,
+        )
+
+        assert result == {"status": "good"}
+        assert sources == ["https://a.com", "https://b.com", "https://c.com"]
+
+
+class TestClaudeReasoningCall:
+    """Test Claude reasoning_call request construction across retries."""
+
+    @patch.object(ClaudeProvider, "_get_client")
+    def test_retry_reuses_static_request_fields(self, mock_get_client):
+        provider = _make_claude_provider()
+
+        mock_client = MagicMock()
+        mock_client.messages.stream.side_effect = [
+            _make_claude_stream(_make_claude_response({"status": "bad"})),
+            _make_claude_stream(_make_claude_response({"status": "good"})),
+        ]
+        mock_get_client.return_value = mock_client
+
+        result = provider.reasoning_call(
+            prompt="base prompt",
+            response_schema={"type": "object", "properties": {}},
+            validator=lambda d: (d["status"] == "good", "FIX STATUS"),
+            log=False,
+        )
+
+        assert result == {"status": "good"}
+        first, second = mock_client.messages.stream.call_args_list
+        assert first.kwargs["tools"] is second.kwargs["tools"]
+        assert first.kwargs["messages"][0]["content"] == "base prompt"
+        assert second.kwargs["messages"][0]["content"] == (
+            "FIX STATUS\n\n---\n\nbase prompt"
+        )
+
+
+class TestClaudeStructuredTool:
+    """Test structured-output tool construction and caching."""
+
+    def test_strips_additional_properties(self):
+        from extropy.core.providers.claude import _make_structured_tool
+
+        schema = {
+            "type": "object",
+            "additionalProperties": False,
+            "properties": {"a": {"type": "object", "additionalProperties": False}},
+        }
+        tool = _make_structured_tool("response", schema)
+        assert "additionalProperties" not in tool["input_schema"]
+        assert "additionalProperties" not in tool["input_schema"]["properties"]["a"]
+
+    def test_same_schema_object_is_cached(self):
+        from extropy.core.providers.claude import _make_structured_tool
+
+        schema = {"type": "object", "properties": {}}
+        assert _make_structured_tool("response", schema) is _make_structured_tool(
+            "response", schema
+        )
+        assert _make_structured_tool("other", schema)["name"] == "other"
+
+    def test_equal_but_distinct_schemas_not_shared(self):
+        from extropy.core.providers.claude import _make_structured_tool
+
+        tool_a = _make_structured_tool("response", {"type": "object"})
+        tool_b = _make_structured_tool("response", {"type": "object"})
+        assert tool_a == tool_b
+        assert tool_a is not tool_b
+
+
+class TestClaudeClientCaching:
+    """Test that Claude clients are reused and released cleanly."""
+
+    def test_sync_client_is_cached(self):
+        provider = ClaudeProvider(api_key="test-key")
+        assert provider._get_client() is provider._get_client()
+
+    def test_async_client_is_cached(self):
+        provider = ClaudeProvider(api_key="test-key")
+        assert provider._get_async_client() is provider._get_async_client()
+
+    def test_pool_settings_applied_to_clients(self):
+        provider = ClaudeProvider(
+            api_key="test-key",
+            max_connections=250,
+            max_keepalive_connections=50,
+            timeout=30.0,
+        )
+        limits = provider._http_limits()
+        assert limits.max_connections == 250
+        assert limits.max_keepalive_connections == 50
+        assert provider._get_client()._client.timeout.read == 30.0
+        assert provider._get_async_client()._client.timeout.read == 30.0
+
+    def test_rate_limiter_created_once_across_threads(self):
+        from concurrent.futures import ThreadPoolExecutor
+
+        provider = ClaudeProvider(api_key="test-key")
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            limiters = list(
+                pool.map(lambda _: provider._ensure_rate_limiter("m"), range(32))
+            )
+        assert all(limiter is limiters[0] for limiter in limiters)
+
+    def test_default_timeout_and_retries(self):
+        provider = ClaudeProvider(api_key="test-key")
+        for client in (provider._get_client(), provider._get_async_client()):
+            assert client.max_retries == 0
+            assert client._client.timeout.read == 600.0
+            assert client._client.timeout.connect == 5.0
+
+    def test_aiohttp_without_extra_raises(self):
+        with patch("extropy.core.providers.claude.HAS_AIOHTTP", False):
+            with pytest.raises(ImportError, match="aiohttp"):
+                ClaudeProvider(api_key="test-key", use_aiohttp=True)
+
+    def test_close_releases_sync_client(self):
+        provider = ClaudeProvider(api_key="test-key")
+        mock_client = MagicMock()
+        provider._cached_sync_client = mock_client
+
+        provider.close()
+
+        mock_client.close.assert_called_once()
+        assert provider._cached_sync_client is None
+
+    def test_context_manager_closes_clients(self):
+        import asyncio
+
+        sync_client = MagicMock()
+        async_client = MagicMock()
+        async_client.close = AsyncMock()
+
+        with ClaudeProvider(api_key="test-key") as provider:
+            provider._cached_sync_client = sync_client
+        sync_client.close.assert_called_once()
+
+        async def _run():
+            async with ClaudeProvider(api_key="test-key") as provider:
+                provider._cached_async_client = async_client
+            return provider
+
+        provider = asyncio.run(_run())
+        async_client.close.assert_awaited_once()
+        assert provider._cached_async_client is None
+
+    def test_close_async_is_idempotent(self):
+        import asyncio
+
+        provider = ClaudeProvider(api_key="test-key")
+        async_client = MagicMock()
+        async_client.close = AsyncMock()
+        provider._cached_async_client = async_client
+
+        async def _run():
+            await provider.close_async()
+            await provider.close_async()
+
+        asyncio.run(_run())
+        async_client.close.assert_awaited_once()
+
+    def test_close_async_tolerates_closed_loop(self):
+        import asyncio
+
+        provider = ClaudeProvider(api_key="test-key")
+        async_client = MagicMock()
+        async_client.close = AsyncMock(side_effect=RuntimeError("Event loop is closed"))
+        provider._cached_async_client = async_client
+
+        asyncio.run(provider.close_async())
+        assert provider._cached_async_client is None
+
+
+# =============================================================================
+# Request logging Tests
+# =============================================================================
+
+
+class TestRequestLogging:
+    """Test the background request/response log writer."""
+
+    def test_log_written_by_background_worker(self, tmp_path, monkeypatch):
+        import json
+
+        from extropy.core.providers import logging as provider_logging
+        from extropy.core.providers.logging import close_logs, log_request_response
+
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(provider_logging, "_log_file", None)
+        response = MagicMock()
+        response.model_dump.return_value = {"id": "resp_1"}
+
+        log_request_response(
+            function_name="simple_call",
+            request={"model": "test"},
+            response=response,
+            provider="claude",
+        )
+        close_logs()
+
+        log_files = list((tmp_path / "logs").glob("llm_*.jsonl"))
+        assert len(log_files) == 1
+        lines = log_files[0].read_text().splitlines()
+        assert len(lines) == 1
+        data = json.loads(lines[0])
+        assert data["provider"] == "claude"
+        assert data["request"] == {"model": "test"}
+        assert data["response"] == {"id": "resp_1"}
+        assert provider_logging._log_file is None
+
+    def test_response_serialized_off_caller_thread(self, tmp_path, monkeypatch):
+        import threading
+
+        from extropy.core.providers import logging as provider_logging
+        from extropy.core.providers.logging import close_logs, log_request_response
+
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(provider_logging, "_log_file", None)
+        dump_threads = []
+
+        def model_dump(**kwargs):
+            dump_threads.append(threading.current_thread())
+            return {}
+
+        response = MagicMock()
+        response.model_dump.side_effect = model_dump
+
+        log_request_response("simple_call", {}, response, provider="openai")
+        close_logs()
+
+        assert len(dump_threads) == 1
+        assert dump_threads[0] is not threading.current_thread()
+
+    @pytest.mark.parametrize("has_orjson", [True, False])
+    def test_format_log_line(self, has_orjson):
+        import json
+        from datetime import datetime
+
+        from extropy.core.providers import logging as provider_logging
+
+        if has_orjson and not provider_logging.HAS_ORJSON:
+            pytest.skip("orjson not installed")
+
+        with patch.object(provider_logging, "HAS_ORJSON", has_orjson):
+            line = provider_logging._format_log_line(
+                datetime(2026, 1, 1, 12, 0, 0).timestamp(),
+                "simple_call",
+                {
+                    "model": "test",
+                    "sent_at": datetime(2026, 1, 1),
+                    "tags": {"a"},
+                    "usage": TokenUsage(input_tokens=3),
+                },
+                "raw response",
+                "openai",
+                ["https://example.com"],
+            )
+
+        assert line.endswith("\n")
+        assert ", " not in line and '": ' not in line
+        data = json.loads(line)
+        assert data["timestamp"] == "2026-01-01T12:00:00"
+        assert data["request"]["sent_at"] == "2026-01-01T00:00:00"
+        assert data["request"]["tags"] == ["a"]
+        assert data["request"]["usage"] == {"input_tokens": 3, "output_tokens": 0}
+        assert data["response"] == "raw response"
+        assert data["sources_extracted"] == ["https://example.com"]
+
+    def test_split_log_file(self, tmp_path):
+        import json
+
+        from extropy.core.providers.logging import split_log_file
+
+        log_path = tmp_path / "llm.jsonl"
+        entries = [
+            {"timestamp": "2026-01-01T12:00:00", "function": fn, "provider": "openai"}
+            for fn in ("simple_call", "reasoning_call")
+        ]
+        log_path.write_text("".join(json.dumps(e) + "\n" for e in entries))
+
+        paths = split_log_file(log_path, tmp_path / "split")
+
+        assert [p.name for p in paths] == [
+            "20260101_120000_000000_000000_openai_simple_call.json",
+            "20260101_120000_000000_000001_openai_reasoning_call.json",
+        ]
+        assert json.loads(paths[1].read_text()) == entries[1]
+
+
+class TestExtractErrorSummary:
+    """Test validation error summarization for retry callbacks."""
+
+    @pytest.mark.parametrize(
+        "error_msg, expected",
+        [
+            ("", "validation error"),
+            ("## Header\n---\n\n", "validation error"),
+            ("# Errors\n---\nERROR in income: bad std", "ERROR in income: bad std"),
+            ("## Fix\n  Problem:  weights do not sum to 1", "weights do not sum to 1"),
+            ("\n  plain message  \nsecond line", "plain message"),
+            ("x" * 100, "x" * 60),
+            ("  # Heading\r\n----\r\n\tdetail line \r\nmore", "detail line"),
+        ],
+    )
+    def test_summaries(self, error_msg, expected):
+        from extropy.core.providers.logging import extract_error_summary
+
+        assert extract_error_summary(error_msg) == expected
+
 
 # =============================================================================
 # Base Provider validation-retry Tests
@@ -678,6 +1447,149 @@ class TestBaseRetryWithValidation:
         assert prompts_received[0] == "base prompt"
 
 
+class TestCallWithBackoff:
+    """Test the shared transient-error backoff helpers."""
+
+    def test_non_transient_error_not_retried(self):
+        from extropy.core.providers.base import _call_with_backoff
+
+        calls = 0
+
+        def fails():
+            nonlocal calls
+            calls += 1
+            raise ValueError("not transient")
+
+        with patch("time.sleep") as mock_sleep:
+            with pytest.raises(ValueError):
+                _call_with_backoff(fails, transient_errors=(ConnectionError,))
+
+        assert calls == 1
+        mock_sleep.assert_not_called()
+
+    def test_backoff_delay_is_capped_and_jittered(self):
+        from extropy.core.providers.base import _backoff_delay
+
+        delays = [_backoff_delay(10, 0.5, 2.0, 30.0) for _ in range(50)]
+        assert all(15.0 <= d <= 30.0 for d in delays)
+        assert len(set(delays)) > 1
+
+    def test_retry_after_header_is_honoured(self):
+        from extropy.core.providers.base import _call_with_backoff
+
+        class RateLimited(Exception):
+            response = SimpleNamespace(headers={"retry-after": "7"})
+
+        calls = 0
+
+        def flaky():
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                raise RateLimited("429")
+            return "ok"
+
+        with patch("time.sleep") as mock_sleep:
+            result = _call_with_backoff(flaky, transient_errors=(RateLimited,))
+
+        assert result == "ok"
+        assert mock_sleep.call_args.args[0] >= 7.0
+
+    def test_async_retries_transient_error(self):
+        import asyncio
+
+        from extropy.core.providers.base import _call_with_backoff_async
+
+        calls = 0
+
+        async def flaky():
+            nonlocal calls
+            calls += 1
+            if calls < 3:
+                raise ConnectionError("reset")
+            return "ok"
+
+        with patch("asyncio.sleep", new=AsyncMock()) as mock_sleep:
+            result = asyncio.run(
+                _call_with_backoff_async(flaky, transient_errors=(ConnectionError,))
+            )
+
+        assert result == "ok"
+        assert mock_sleep.await_count == 2
+
+
+class TestBaseBatchSimpleCallAsync:
+    """Test the bounded-concurrency batch_simple_call_async helper."""
+
+    def test_preserves_order_and_bounds_concurrency(self):
+        import asyncio
+
+        in_flight = 0
+        peak = 0
+
+        async def fake_simple_call_async(prompt, response_schema, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            if prompt == "bad":
+                raise ValueError("boom")
+            return {"prompt": prompt}, TokenUsage(input_tokens=1)
+
+        provider = _make_claude_provider()
+        provider.simple_call_async = fake_simple_call_async
+
+        prompts = [(f"p{i}", {}) for i in range(6)] + [("bad", {})]
+        results = asyncio.run(
+            provider.batch_simple_call_async(prompts, max_concurrency=2)
+        )
+
+        assert peak == 2
+        assert [r[0]["prompt"] for r in results[:6]] == [f"p{i}" for i in range(6)]
+        assert isinstance(results[6], ValueError)
+
+
+class TestProviderRequestSlots:
+    """Test the provider-wide cap on in-flight async requests."""
+
+    def test_caps_in_flight_requests_across_event_loops(self):
+        import asyncio
+
+        provider = _make_openai_provider(max_concurrent_requests=2)
+        in_flight = 0
+        peak = 0
+
+        async def fake_request():
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return "ok"
+
+        async def fan_out():
+            return await asyncio.gather(
+                *(provider._with_retry_async(fake_request) for _ in range(6))
+            )
+
+        # Each asyncio.run() starts a new loop; the semaphore must follow it
+        for _ in range(2):
+            assert asyncio.run(fan_out()) == ["ok"] * 6
+        assert peak == 2
+
+    def test_unbounded_by_default(self):
+        import asyncio
+
+        provider = _make_openai_provider()
+
+        async def fake_request():
+            return "ok"
+
+        assert asyncio.run(provider._with_retry_async(fake_request)) == "ok"
+        assert provider._request_semaphore is None
+
+
 # =============================================================================
 # Azure OpenAI Provider Tests
 # =============================================================================
@@ -834,6 +1746,63 @@ class TestProviderFactoryAzure:
             _create_provider("azure_openai")
 
 
+class TestPipelineProviderCache:
+    """Test that pipeline steps share one cached provider."""
+
+    @pytest.fixture(autouse=True)
+    def _reset_cache(self):
+        from extropy.config import reset_config
+        from extropy.core import providers
+
+        providers.close_pipeline_provider()
+        yield
+        providers.close_pipeline_provider()
+        reset_config()
+
+    @patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"})
+    def test_provider_reused_across_calls(self):
+        from extropy.config import ExtropyConfig, configure
+        from extropy.core.providers import get_pipeline_provider
+
+        configure(ExtropyConfig())
+        assert get_pipeline_provider() is get_pipeline_provider()
+
+    @patch.dict(
+        "os.environ", {"OPENAI_API_KEY": "test-key", "ANTHROPIC_API_KEY": "test-key"}
+    )
+    def test_provider_rebuilt_when_config_changes(self):
+        from extropy.config import ExtropyConfig, configure
+        from extropy.core.providers import get_pipeline_provider
+
+        config = ExtropyConfig()
+        configure(config)
+        first = get_pipeline_provider()
+        first._cached_sync_client = MagicMock()
+        sync_client = first._cached_sync_client
+
+        config.pipeline.provider = "claude"
+        second = get_pipeline_provider()
+
+        assert isinstance(second, ClaudeProvider)
+        sync_client.close.assert_called_once()
+
+    @patch.dict("os.environ", {"OPENAI_API_KEY": "old-key"})
+    def test_provider_rebuilt_when_api_key_changes(self):
+        import os
+
+        from extropy.config import ExtropyConfig, configure
+        from extropy.core.providers import get_pipeline_provider
+
+        configure(ExtropyConfig())
+        first = get_pipeline_provider()
+
+        os.environ["OPENAI_API_KEY"] = "new-key"
+        second = get_pipeline_provider()
+
+        assert second is not first
+        assert second._api_key == "new-key"
+
+
 # =============================================================================
 # Chat Completions API Tests
 # =============================================================================
@@ -119,3 +119,24 @@ class TestRateLimiter:
     def test_tpm_override(self):
         limiter = RateLimiter.for_provider("openai", tier=1, tpm_override=999_999)
         assert limiter.tpm == 999_999
+
+    def test_acquire_sync_is_thread_safe(self):
+        """Concurrent acquires never lose token updates or exceed RPM."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        limiter = RateLimiter(rpm=100, tpm=10_000_000, provider="openai", model="t")
+
+        # Freeze the clock so no tokens refill while the threads race
+        frozen = max(limiter.rpm_bucket.last_refill, limiter.tpm_bucket.last_refill)
+        with patch("time.monotonic", return_value=frozen):
+            with patch("time.sleep", side_effect=AssertionError("over capacity")):
+                with ThreadPoolExecutor(max_workers=20) as pool:
+                    waits = list(
+                        pool.map(lambda _: limiter.acquire_sync(10, 10), range(100))
+                    )
+
+            assert waits == [0.0] * 100
+            assert limiter.total_acquired == 100
+            assert limiter.rpm_bucket.tokens == 0
+            assert limiter.tpm_bucket.tokens == 10_000_000 - 100 * 20
+            assert limiter.rpm_bucket.try_acquire(1.0) > 0
@@ -1,8 +1,10 @@
 """Tests for the population sampler module."""
 
+import random
 import tempfile
 from pathlib import Path
 
+import numpy as np
 import pytest
 
 from extropy.core.models.population import (
@@ -16,6 +18,8 @@ from extropy.core.models.population import (
     LognormalDistribution,
     CategoricalDistribution,
     BetaDistribution,
+    BooleanDistribution,
+    UniformDistribution,
     Modifier,
     Constraint,
 )
@@ -25,12 +29,16 @@ from extropy.population.sampler.core import (
     save_sqlite,
     SamplingResult,
     SamplingError,
+    SamplingStats,
 )
 from extropy.population.sampler.distributions import (
+    is_static_distribution,
     sample_distribution,
+    sample_distribution_batch,
     coerce_to_type,
 )
 from extropy.utils.eval_safe import (
+    compile_expression,
     eval_safe,
     eval_formula,
     eval_condition,
@@ -112,6 +120,14 @@ class TestEvalSafe:
         with pytest.raises(FormulaError):
             eval_safe("invalid syntax (", {})
 
+    def test_compiled_expression_is_cached_and_reusable(self):
+        """Test that an expression is parsed once and evaluates per context."""
+        evaluate = compile_expression("age > 50 and edge_type == 'colleague'")
+
+        assert compile_expression("age > 50 and edge_type == 'colleague'") is evaluate
+        assert evaluate({"age": 60, "edge_type": "colleague"}) is True
+        assert evaluate({"age": 40, "edge_type": "colleague"}) is False
+
     def test_missing_variable_raises(self):
         """Test that missing variables raise FormulaError."""
         with pytest.raises(FormulaError):
@@ -317,6 +333,120 @@ class TestDistributionSampling:
         true_count = sum(values)
         assert 600 < true_count < 800  # Expecting ~70%
 
+    def test_batch_normal_respects_bounds(self, simple_normal_distribution):
+        """Test vectorized normal draws are clamped and return floats."""
+        dist = simple_normal_distribution
+        values = sample_distribution_batch(dist, np.random.default_rng(42), 1000)
+
+        assert len(values) == 1000
+        assert all(isinstance(v, float) for v in values)
+        assert all(dist.min <= v <= dist.max for v in values)
+
+    def test_batch_beta_scaled(self):
+        """Test vectorized beta draws are scaled into [min, max]."""
+        dist = BetaDistribution(alpha=2.0, beta=5.0, min=10.0, max=20.0)
+        values = sample_distribution_batch(dist, np.random.default_rng(42), 100)
+
+        assert all(10.0 <= v <= 20.0 for v in values)
+
+    def test_batch_categorical_and_boolean(
+        self, simple_categorical_distribution, simple_boolean_distribution
+    ):
+        """Test vectorized categorical/boolean draws return plain values."""
+        rng = np.random.default_rng(42)
+        options = sample_distribution_batch(simple_categorical_distribution, rng, 1000)
+        flags = sample_distribution_batch(simple_boolean_distribution, rng, 1000)
+
+        assert set(options) <= set(simple_categorical_distribution.options)
+        assert 400 < options.count("A") < 600
+        assert all(isinstance(v, bool) for v in flags)
+        assert 600 < sum(flags) < 800
+
+    def test_batch_rejects_zero_weights(self):
+        """Test vectorized categorical draws reject unusable weights."""
+        dist = CategoricalDistribution(options=["a", "b"], weights=[0.0, 0.0])
+        with pytest.raises(ValueError, match="sum to > 0"):
+            sample_distribution_batch(dist, np.random.default_rng(42), 10)
+
+    @pytest.mark.parametrize(
+        "dist",
+        [
+            NormalDistribution(mean=50.0, std=10.0, min=40.0, max=65.0),
+            LognormalDistribution(mean=40000.0, std=15000.0, max=60000.0),
+            LognormalDistribution(mean=10.0),
+            UniformDistribution(min=0.0, max=100.0),
+            BetaDistribution(alpha=2.0, beta=5.0),
+            BetaDistribution(alpha=2.0, beta=5.0, min=10.0, max=20.0),
+            BetaDistribution(alpha=2.0, beta=5.0, min=0.3),
+        ],
+        ids=lambda d: d.type,
+    )
+    def test_batch_matches_scalar_numeric_statistics(self, dist):
+        """Test vectorized and scalar draws agree on mean, spread and bounds."""
+        n = 20_000
+        rng = random.Random(0)
+        scalar = np.array([sample_distribution(dist, rng) for _ in range(n)])
+        batch = np.array(sample_distribution_batch(dist, np.random.default_rng(0), n))
+
+        assert batch.mean() == pytest.approx(scalar.mean(), rel=0.03)
+        assert batch.std() == pytest.approx(scalar.std(), rel=0.05)
+        for q in (5, 50, 95):
+            assert np.percentile(batch, q) == pytest.approx(
+                np.percentile(scalar, q), abs=0.1 * scalar.std()
+            )
+        # Bounds clamp both paths identically
+        if dist.min is not None:
+            assert batch.min() >= dist.min and scalar.min() >= dist.min
+        if dist.max is not None:
+            assert batch.max() <= dist.max and scalar.max() <= dist.max
+
+    @pytest.mark.parametrize(
+        "dist",
+        [
+            CategoricalDistribution(options=["A", "B", "C"], weights=[0.5, 0.3, 0.2]),
+            CategoricalDistribution(options=["A", "B", "C"], weights=[0.0, 1.0, 0.0]),
+            BooleanDistribution(probability_true=0.7),
+            BooleanDistribution(probability_true=0.0),
+        ],
+        ids=["categorical", "categorical_single_weight", "boolean", "boolean_never"],
+    )
+    def test_batch_matches_scalar_frequencies(self, dist):
+        """Test vectorized and scalar draws agree on outcome frequencies."""
+        n = 20_000
+        rng = random.Random(0)
+        scalar = [sample_distribution(dist, rng) for _ in range(n)]
+        batch = sample_distribution_batch(dist, np.random.default_rng(0), n)
+
+        for outcome in set(scalar) | set(batch):
+            assert batch.count(outcome) / n == pytest.approx(
+                scalar.count(outcome) / n, abs=0.02
+            )
+
+    @pytest.mark.parametrize(
+        "weights",
+        [[], [0.0, 0.0], [2.0, -1.0], [float("inf"), 1.0], [float("nan"), 1.0]],
+        ids=["empty", "all_zero", "negative", "infinite", "nan"],
+    )
+    def test_degenerate_weights_rejected_by_both_samplers(self, weights):
+        """Test scalar and vectorized categorical draws reject the same weights."""
+        dist = CategoricalDistribution.model_construct(
+            type="categorical", options=["a", "b"], weights=weights
+        )
+        with pytest.raises(ValueError, match="sum to > 0"):
+            sample_distribution(dist, random.Random(0))
+        with pytest.raises(ValueError, match="sum to > 0"):
+            sample_distribution_batch(dist, np.random.default_rng(0), 10)
+
+    def test_formula_distributions_are_not_static(self):
+        """Test only formula-free distributions qualify for batch draws."""
+        assert is_static_distribution(NormalDistribution(mean=1.0, std=1.0))
+        assert not is_static_distribution(
+            NormalDistribution(mean_formula="age - 28", std=1.0)
+        )
+        assert not is_static_distribution(
+            NormalDistribution(mean=1.0, std=1.0, max_formula="age")
+        )
+
 
 class TestCoerceToType:
     """Tests for type coercion."""
@@ -383,14 +513,40 @@ class TestSamplePopulation:
         result1 = sample_population(minimal_population_spec, count=10, seed=42)
         result2 = sample_population(minimal_population_spec, count=10, seed=42)
 
-        assert result1.agents == result2.agents
+        assert result1.fingerprint() == result2.fingerprint()
+
+    def test_sample_negative_seed(self, minimal_population_spec):
+        """Negative seeds are reproducible, as with random.Random."""
+        result1 = sample_population(minimal_population_spec, count=10, seed=-5)
+        result2 = sample_population(minimal_population_spec, count=10, seed=-5)
+
+        assert result1.fingerprint() == result2.fingerprint()
+
+    def test_fingerprint_ignores_key_order(self):
+        """Fingerprints depend on agent values, not dict key order."""
+        stats = SamplingStats()
+        a = SamplingResult(agents=[{"age": 30, "gender": "f"}], meta={}, stats=stats)
+        b = SamplingResult(agents=[{"gender": "f", "age": 30}], meta={}, stats=stats)
+        c = SamplingResult(agents=[{"gender": "f", "age": 31}], meta={}, stats=stats)
+
+        assert a.fingerprint() == b.fingerprint()
+        assert a.fingerprint() != c.fingerprint()
+
+    def test_fingerprint_distinguishes_value_types(self):
+        """1, 1.0, True and "1" are different sampled values."""
+        stats = SamplingStats()
+        fingerprints = {
+            SamplingResult(agents=[{"x": v}], meta={}, stats=stats).fingerprint()
+            for v in (1, 1.0, True, "1")
+        }
+        assert len(fingerprints) == 4
 
     def test_sample_different_seeds_differ(self, minimal_population_spec):
         """Test that different seeds produce different results."""
         result1 = sample_population(minimal_population_spec, count=10, seed=42)
         result2 = sample_population(minimal_population_spec, count=10, seed=123)
 
-        assert result1.agents != result2.agents
+        assert result1.fingerprint() != result2.fingerprint()
 
     def test_sample_complex_spec(self, complex_population_spec):
         """Test sampling from a complex spec with derived and conditional attributes."""
@@ -622,11 +778,11 @@ class TestEdgeCases:
         assert len(result.agents) == 1
         assert result.agents[0]["_id"] == "agent_0"
 
-    def test_large_population_sampling(self, minimal_population_spec):
+    def test_large_population_sampling(self, minimal_population_spec_mut):
         """Test sampling a large population."""
         # Modify spec for larger population
-        minimal_population_spec.meta.size = 1000
-        result = sample_population(minimal_population_spec, count=1000, seed=42)
+        minimal_population_spec_mut.meta.size = 1000
+        result = sample_population(minimal_population_spec_mut, count=1000, seed=42)
 
         assert len(result.agents) == 1000
         # Check ID padding
@@ -18,9 +18,11 @@ from extropy.core.models.simulation import (
 )
 from extropy.simulation.state import StateManager
 from extropy.simulation.persona import (
+    compile_persona_template,
     generate_persona,
     render_persona,
 )
+from extropy.utils import template_fields
 
 
 class TestSimulationModels:
@@ -434,6 +436,23 @@ class TestPersonaGeneration:
         # Should generate something
         assert len(persona) > 0
 
+    def test_fallback_persona_lists_first_three_attributes(self):
+        agent = {
+            "age": 38.0,
+            "gender": "female",
+            "role": "nurse",
+            "occupation": "",
+            "specialty": "oncology",
+            "employer_type": "clinic",
+            "years_experience": 12,
+        }
+        persona = generate_persona(agent)
+
+        assert persona == (
+            "You are a 38-year-old female. Your role is nurse. "
+            "Your specialty is oncology. Your employer type is clinic."
+        )
+
     def test_render_persona_with_template(self, sample_agents):
         """Test rendering persona with a template."""
         agent = sample_agents[0]
@@ -444,6 +463,41 @@ class TestPersonaGeneration:
         assert str(agent["age"]) in persona
         assert agent["gender"] in persona
 
+    @pytest.mark.parametrize(
+        "template",
+        [
+            "You are {age} and {gender}.",
+            "{{literal}} {age:>5} {score:.1f}",
+            "{gender!r} is not compiled",
+            "No placeholders at all",
+        ],
+    )
+    def test_compiled_template_matches_str_format(self, template):
+        agent = {"age": 45, "gender": "male", "score": 0.25}
+        assert compile_persona_template(template)(agent) == template.format(**agent)
+
+    def test_compiled_template_is_cached(self):
+        template = "You are {age}."
+        assert compile_persona_template(template) is compile_persona_template(template)
+
+    def test_render_persona_missing_attribute(self):
+        persona = render_persona({"age": 45}, "You are {age} in {city}.")
+        assert persona == "[Template error: missing 'city']"
+
+    def test_render_persona_reports_first_missing_attribute(self):
+        template = "You are {age} in {city.name}, {state}."
+        assert render_persona({"age": 45}, template) == (
+            "[Template error: missing 'city']"
+        )
+
+    def test_template_fields(self):
+        assert template_fields("{age} in {city.name}, {x[0]}, {age} {} {0}") == (
+            "age",
+            "city",
+            "x",
+        )
+        assert template_fields("unbalanced {") is None
+
 
 class TestStateManagerEdgeCases:
     """Tests for edge cases in StateManager."""
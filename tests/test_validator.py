@@ -1,5 +1,7 @@
 """Tests for the population validator module."""
 
+import pytest
+
 from extropy.core.models.population import (
     PopulationSpec,
     SpecMeta,
@@ -47,6 +49,16 @@ def make_spec(
     )
 
 
+# Shared by every make_attr() call; validate_spec only reads them
+_GROUNDING = GroundingInfo(level="low", method="estimated")
+_DEFAULT_DISTRIBUTIONS = {
+    "int": NormalDistribution(mean=50.0, std=10.0),
+    "float": NormalDistribution(mean=50.0, std=10.0),
+    "categorical": CategoricalDistribution(options=["A", "B"], weights=[0.5, 0.5]),
+    "boolean": BooleanDistribution(probability_true=0.5),
+}
+
+
 def make_attr(
     name: str,
     attr_type: str = "int",
@@ -58,14 +70,7 @@ def make_attr(
 ) -> AttributeSpec:
     """Helper to create an AttributeSpec for testing."""
     if distribution is None and strategy != "derived":
-        if attr_type == "int" or attr_type == "float":
-            distribution = NormalDistribution(mean=50.0, std=10.0)
-        elif attr_type == "categorical":
-            distribution = CategoricalDistribution(
-                options=["A", "B"], weights=[0.5, 0.5]
-            )
-        elif attr_type == "boolean":
-            distribution = BooleanDistribution(probability_true=0.5)
+        distribution = _DEFAULT_DISTRIBUTIONS.get(attr_type)
 
     return AttributeSpec(
         name=name,
@@ -79,7 +84,7 @@ def make_attr(
             depends_on=depends_on or [],
             modifiers=modifiers or [],
         ),
-        grounding=GroundingInfo(level="low", method="estimated"),
+        grounding=_GROUNDING,
     )
 
 
@@ -356,64 +361,26 @@ class TestWeightValidity:
 class TestDistributionParameters:
     """Tests for Category 4: Distribution Parameters."""
 
-    def test_negative_std_error(self):
-        """Test that negative std is an error."""
-        attr = AttributeSpec(
-            name="value",
-            type="float",
-            category="universal",
-            description="Value",
-            sampling=SamplingConfig(
-                strategy="independent",
-                distribution=NormalDistribution(mean=50.0, std=-10.0),
-            ),
-            grounding=GroundingInfo(level="low", method="estimated"),
-        )
-        spec = make_spec([attr])
-        result = validate_spec(spec)
-
-        assert not result.valid
-        assert any("std" in str(e) and "negative" in str(e) for e in result.errors)
-
-    def test_zero_std_error(self):
-        """Test that zero std is an error (should be derived)."""
-        attr = AttributeSpec(
-            name="value",
-            type="float",
-            category="universal",
-            description="Value",
-            sampling=SamplingConfig(
-                strategy="independent",
-                distribution=NormalDistribution(mean=50.0, std=0.0),
-            ),
-            grounding=GroundingInfo(level="low", method="estimated"),
-        )
-        spec = make_spec([attr])
-        result = validate_spec(spec)
-
-        assert not result.valid
-        assert any("std" in str(e) and "0" in str(e) for e in result.errors)
-
-    def test_min_greater_than_max_error(self):
-        """Test that min >= max is an error."""
-        attr = AttributeSpec(
-            name="value",
-            type="float",
-            category="universal",
-            description="Value",
-            sampling=SamplingConfig(
-                strategy="independent",
-                distribution=NormalDistribution(
-                    mean=50.0, std=10.0, min=100.0, max=50.0
-                ),
+    @pytest.mark.parametrize(
+        "distribution, expected",
+        [
+            (NormalDistribution(mean=50.0, std=-10.0), ("std", "negative")),
+            # Zero std should be a derived attribute instead
+            (NormalDistribution(mean=50.0, std=0.0), ("std", "0")),
+            (
+                NormalDistribution(mean=50.0, std=10.0, min=100.0, max=50.0),
+                ("min", "max"),
             ),
-            grounding=GroundingInfo(level="low", method="estimated"),
-        )
-        spec = make_spec([attr])
-        result = validate_spec(spec)
+        ],
+        ids=["negative_std", "zero_std", "min_greater_than_max"],
+    )
+    def test_invalid_normal_parameters_error(self, distribution, expected):
+        """Test that invalid normal distribution parameters are errors."""
+        attr = make_attr("value", attr_type="float", distribution=distribution)
+        result = validate_spec(make_spec([attr]))
 
         assert not result.valid
-        assert any("min" in str(e) and "max" in str(e) for e in result.errors)
+        assert any(all(s in str(e) for s in expected) for e in result.errors)
 
 
 class TestDependencyValidation:
@@ -753,3 +720,19 @@ class TestComplexSpec:
         result = validate_spec(spec)
 
         assert result.valid is True
+
+
+class TestPackageExports:
+    """Tests for the lazily loaded extropy.population.validator namespace."""
+
+    def test_all_names_resolve(self):
+        import extropy.population.validator as validator
+
+        assert len(validator.__all__) == len(set(validator.__all__))
+        for name in validator.__all__:
+            assert getattr(validator, name) is not None, name
+
+    def test_dir_matches_all(self):
+        import extropy.population.validator as validator
+
+        assert dir(validator) == sorted(validator.__all__)